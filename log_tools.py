@@ -0,0 +1,1448 @@
+"""Log file tools for the Logs tab.
+
+`tail_lines` reads the end of a log by seeking backwards, so showing the
+last lines of a multi-hundred-MB DebugLog costs the same as a small one.
+`LogTailer` follows a growing log file from a background thread. On Linux
+it sleeps on an inotify watch, so new lines arrive within milliseconds and
+an idle file costs nothing. Elsewhere it falls back to a cheap stat poll.
+`LogIndex` keeps a timestamp -> offset index per log file in the tool's
+own cache directory, so a time range is read with one seek instead of a
+scan.
+`read_log_records` parses log lines into records (time, category, player,
+message) and filters them in a streaming generator pipeline.
+`search_logs` greps any number of current and archived logs in parallel,
+splitting large files into chunks for a process pool.
+`MultiLogTailer` follows every current log at once and merges their lines
+into one timeline.
+"""
+import bisect
+import ctypes
+import ctypes.util
+import fnmatch
+import functools
+import hashlib
+import itertools
+import logging
+import mmap
+import multiprocessing
+import os
+import re
+import select
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# inotify flags and event masks (linux/inotify.h)
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+TAIL_EVENTS = IN_MODIFY | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+INOTIFY_EVENT = struct.Struct('iIII')
+
+
+# "[dd-mm-yy HH:MM:SS.mmm]" at the start of every Project Zomboid log line
+LOG_TIMESTAMP = re.compile(rb'\[(\d{2})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?\]')
+
+# A timestamp at the start of any line of a block
+_LINE_TIMESTAMP = re.compile(rb'^' + LOG_TIMESTAMP.pattern, re.MULTILINE)
+
+# Characters that make a pattern more than plain text
+_REGEX_SPECIAL = re.compile(r'[\\.^$*+?{}\[\]|()]')
+
+# Bytes read at a time when streaming records
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Bytes of log searched per process pool task
+SEARCH_CHUNK_SIZE = 64 * 1024 * 1024
+# Bytes copied at a time from a mapped file (small enough to stay in cache)
+_SCAN_BLOCK_SIZE = 1024 * 1024
+
+# Categories of the files the server writes to Logs/ ('<date>_<category>.txt')
+LOG_CATEGORIES = ('chat', 'user', 'admin', 'pvp', 'map', 'cmd', 'DebugLog')
+
+# '76561198000000000 "Alice" ...' (user, map, cmd and item logs)
+_STEAMID_PLAYER = re.compile(r'(\d+)\s+"([^"]*)"\s*')
+# "ChatMessage{chat=General, author='Alice', text='hi'}" (chat log)
+_CHAT_AUTHOR = re.compile(r"author='([^']*)'")
+# The first quoted name, e.g. the attacker in the pvp log
+_QUOTED_NAME = re.compile(r'"([^"]+)"')
+# 'LOG  : General     , 1713536553123> 1,234,567> ' (DebugLog)
+_DEBUG_PREFIX = re.compile(r'[A-Z]+\s*:\s*\w+\s*,\s*\d+>\s*(?:[\d,]+>\s*)?')
+
+
+@functools.lru_cache(maxsize=256)
+def _hour_epoch(stamp):
+    """Epoch seconds at the start of a local hour given as b'dd-mm-yy HH'.
+
+    DST changes fall on the hour, so minutes and seconds can be added on.
+    """
+    return datetime(2000 + int(stamp[6:8]), int(stamp[3:5]), int(stamp[0:2]), int(stamp[9:11])).timestamp()
+
+
+def parse_log_time(line):
+    """Epoch seconds (local time) of a log line's leading timestamp.
+
+    Args:
+        line (bytes or str): One log line
+
+    Returns:
+        float: Seconds since the epoch, or None if the line has no timestamp
+    """
+    if isinstance(line, str):
+        line = line.encode('utf-8', 'ignore')
+    match = LOG_TIMESTAMP.match(line)
+    return _match_time(match) if match else None
+
+
+def _match_time(match):
+    """Epoch seconds from a LOG_TIMESTAMP match (None if not a real date)."""
+    line = match.string
+    try:
+        base = _hour_epoch(line[1:12])
+    except (ValueError, OverflowError):
+        return None
+    seconds = int(line[13:15]) * 60 + int(line[16:18])
+    fraction = match.group(7)
+    if fraction:
+        seconds += int(fraction) / 10 ** len(fraction)
+    return base + seconds
+
+
+def find_log_files(log_dir, pattern='*.txt', archives=True):
+    """List log files in a log directory, oldest first.
+
+    Args:
+        log_dir (Path): Server Logs directory
+        pattern (str): File name pattern
+        archives (bool): Also include the `logs_<date>` archive folders
+
+    Returns:
+        list: Paths sorted by modification time
+    """
+    log_dir = Path(log_dir)
+    files = list(log_dir.glob(pattern))
+    if archives:
+        files.extend(log_dir.glob(f'logs_*/{pattern}'))
+    mtimes = {}
+    for path in files:
+        try:
+            mtimes[path] = path.stat().st_mtime
+        except OSError:
+            continue
+    return sorted(mtimes, key=mtimes.get)
+
+
+def log_category(path):
+    """Category of a log file from its name suffix.
+
+    '2024-04-19_02-00_chat.txt' is 'chat', and
+    '2024-04-19_02-00_DebugLog-server.txt' is 'DebugLog'.
+    """
+    category = Path(path).stem.rsplit('_', 1)[-1]
+    return 'DebugLog' if category.startswith('DebugLog') else category
+
+
+def parse_log_line(line, category=None, path=None):
+    """Parse one log line into a record.
+
+    Args:
+        line (bytes or str): One log line
+        category (str): Category of the file it came from (see log_category)
+        path (Path): File it came from, kept in the record
+
+    Returns:
+        dict: time (epoch seconds), category, steamid and username (None
+        when the line doesn't name a player), message, line (the full
+        text) and path, or None if the line has no timestamp (a
+        continuation of the record above it)
+    """
+    if isinstance(line, str):
+        line = line.encode('utf-8', 'ignore')
+    line = line.rstrip(b'\r\n')
+    match = LOG_TIMESTAMP.match(line)
+    when = _match_time(match) if match else None
+    if when is None:
+        return None
+    return _make_record(when, category, match.end(), line.decode('utf-8', 'ignore'), path)
+
+
+def _make_record(when, category, text_start, line, path):
+    """Record for a timestamped line (text_start: where the text after the timestamp begins)."""
+    rest = line[text_start:].strip()
+    steamid = username = None
+    message = rest
+    match = _STEAMID_PLAYER.match(rest)
+    if match:
+        steamid, username = match.groups()
+        message = rest[match.end():]
+    elif category == 'DebugLog':
+        match = _DEBUG_PREFIX.match(rest)
+        if match:
+            message = rest[match.end():]
+    else:
+        match = (_CHAT_AUTHOR if category == 'chat' else _QUOTED_NAME).search(rest)
+        if match:
+            username = match.group(1)
+    return {
+        'time': when,
+        'category': category,
+        'steamid': steamid,
+        'username': username,
+        'message': message,
+        'line': line,
+        'path': path,
+    }
+
+
+def _read_lines(f, end=None, block_test=None):
+    """Raw lines (without line endings) from a file's current position.
+
+    The file is read in blocks cut at line ends. A block whose text fails
+    block_test can't contain a wanted record. It yields only its leading
+    untimestamped lines, which continue the record before it, and then
+    None to mark that records were skipped. Its last record may go on in
+    the next block, so that record is carried over and tested again with
+    it. A block that runs past `end` is never skipped, so the caller still
+    sees where to stop.
+    """
+    rest = b''
+    while True:
+        data = f.read(READ_BLOCK_SIZE)
+        if not data:
+            if rest:
+                yield rest
+            return
+        block = rest + data
+        cut = block.rfind(b'\n') + 1
+        if cut == 0:
+            rest = block
+            continue
+        block, rest = block[:cut], block[cut:]
+        if block_test is not None and not block_test(block.decode('utf-8', 'ignore')):
+            first = _LINE_TIMESTAMP.search(block)
+            last = _last_timestamp(block)
+            if (first is not None and last.start() > first.start()
+                    and (end is None or (_match_time(last) or 0) <= end)):
+                yield from block[:first.start()].splitlines()
+                yield None
+                rest = block[last.start():] + rest
+                continue
+        lines = block.split(b'\n')
+        lines.pop()
+        yield from lines
+
+
+def _last_timestamp(block):
+    """Match of the last line of a block that starts with a timestamp (None if none does)."""
+    pos = len(block)
+    while pos > 0:
+        pos = block.rfind(b'\n[', 0, pos - 1) + 1
+        match = _LINE_TIMESTAMP.match(block, pos)
+        if match:
+            return match
+    return None
+
+
+def iter_records(path, start=None, end=None, keep=None, block_test=None):
+    """Stream the records of one log file, oldest first.
+
+    Lines without a timestamp (stack traces, wrapped output) are added to
+    the record above them. With a start time, reading begins with one seek
+    through the file's LogIndex. Reading stops at the first record after
+    the end time.
+
+    Args:
+        path (str or Path): Log file
+        start (float): Skip records before this time (epoch seconds)
+        end (float): Stop at records after this time (epoch seconds)
+        keep (callable): Test on a record's full text; records failing it
+            are skipped before being parsed
+        block_test (callable): Test on the text of a whole block of lines,
+            false only if no record in it can pass keep; blocks failing it
+            are skipped unparsed
+
+    Yields:
+        dict: Records as from parse_log_line
+    """
+    path = Path(path)
+    category = log_category(path)
+    offset = 0
+    if start is not None:
+        index = LogIndex(path)
+        index.update()
+        offset = index.offset_for(start)
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        windowed = start is not None or end is not None
+        pending = None  # (timestamp match, time, raw lines) of the record being read
+        for raw in _read_lines(f, end, block_test):
+            if raw is None:
+                # Records were skipped here; the one being read has ended
+                if pending is not None:
+                    record = _finish_record(pending, category, path, keep)
+                    if record is not None:
+                        yield record
+                    pending = None
+                continue
+            raw = raw.rstrip(b'\r')
+            match = LOG_TIMESTAMP.match(raw)
+            # Without a time window, times are only worked out for records
+            # that pass keep
+            when = _match_time(match) if match and windowed else None
+            if match is None or (windowed and when is None):
+                if pending is not None:
+                    pending[2].append(raw)
+                continue
+            if pending is not None:
+                record = _finish_record(pending, category, path, keep)
+                if record is not None:
+                    yield record
+                pending = None
+            if end is not None and when > end:
+                return
+            if start is None or when >= start:
+                pending = (match, when, [raw])
+        if pending is not None:
+            record = _finish_record(pending, category, path, keep)
+            if record is not None:
+                yield record
+
+
+def _finish_record(pending, category, path, keep):
+    """Record from a timestamped line and its continuation lines, or None if keep rejects it."""
+    match, when, lines = pending
+    text = (lines[0] if len(lines) == 1 else b'\n'.join(lines)).decode('utf-8', 'ignore')
+    if keep is not None and not keep(text):
+        return None
+    if when is None:
+        when = _match_time(match)
+        if when is None:
+            return None
+    first, _, more = text.partition('\n')
+    record = _make_record(when, category, match.end(), first, path)
+    if more:
+        record['message'] += '\n' + more
+        record['line'] = text
+    return record
+
+
+def filter_categories(records, categories):
+    """Keep records of the given categories."""
+    categories = set(categories)
+    return (record for record in records if record['category'] in categories)
+
+
+def filter_player(records, player):
+    """Keep records naming a player, by username (any case) or SteamID."""
+    key = player.strip().lower()
+    return (record for record in records
+            if record['steamid'] == key or (record['username'] or '').lower() == key)
+
+
+def filter_pattern(records, pattern):
+    """Keep records whose text matches a regex (str patterns ignore case)."""
+    regex = re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
+    return (record for record in records if regex.search(record['line']))
+
+
+def filter_time(records, start=None, end=None):
+    """Keep records logged between two times (epoch seconds, either may be None)."""
+    return (record for record in records
+            if (start is None or record['time'] >= start) and (end is None or record['time'] <= end))
+
+
+def _crlf_line_ends(pattern):
+    """Rewrite a regex so $ also matches before a CR-LF line end (Windows logs)."""
+    out = []
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            # A ']' straight after '[' or '[^' is part of the class
+            j = i + 1
+            if pattern[j:j + 1] == '^':
+                j += 1
+            if pattern[j:j + 1] == ']':
+                j += 1
+            out.append(pattern[i:j])
+            i = j
+            in_class = True
+            continue
+        elif char == '$':
+            char = r'(?=\r?$)'
+        out.append(char)
+        i += 1
+    return ''.join(out)
+
+
+def _all_search(regexes):
+    """A test that text matches every regex (None if there are none)."""
+    if not regexes:
+        return None
+    if len(regexes) == 1:
+        return regexes[0].search
+    return lambda text: all(regex.search(text) for regex in regexes)
+
+
+def read_log_records(paths, start=None, end=None, categories=None, player=None, pattern=None):
+    """Records from many log files, filtered in one streaming pass.
+
+    Nothing is collected in memory: records are parsed and filtered one
+    at a time as the caller consumes them. Files are skipped without being
+    opened if their category isn't wanted. They are also skipped if they
+    were last written before the start time.
+
+    Args:
+        paths (iterable): Log files, in the order to read them
+        start (float): Earliest time (epoch seconds)
+        end (float): Latest time (epoch seconds)
+        categories (iterable): Categories to keep (default: all)
+        player (str): Username or SteamID to keep
+        pattern (str or compiled regex): Text to match
+
+    Yields:
+        dict: Records as from parse_log_line
+    """
+    categories = set(categories) if categories else None
+    # Text tests run before a record is parsed: the pattern is tested as
+    # filter_pattern would, and a player's name must appear in the text.
+    # Whole blocks of lines are ruled out at once by a substring test for
+    # plain text, or by the regex in MULTILINE mode (so ^ and $ still match
+    # at each line).
+    regexes, literals = [], []
+    if pattern:
+        regexes.append(re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern)
+        if isinstance(pattern, str) and pattern.isascii() and not _REGEX_SPECIAL.search(pattern):
+            literals.append(pattern.lower())
+    if player and player.strip().isascii():
+        regexes.append(re.compile(re.escape(player.strip()), re.IGNORECASE))
+        literals.append(player.strip().lower())
+    keep = _all_search(regexes)
+    block_test = None
+    if literals:
+        block_test = lambda text: all(literal in text.lower() for literal in literals)
+    elif regexes and not any('\\A' in r.pattern or '\\Z' in r.pattern for r in regexes):
+        block_test = _all_search([re.compile(_crlf_line_ends(r.pattern), r.flags | re.MULTILINE)
+                                  for r in regexes])
+    for path in paths:
+        if categories is not None and log_category(path) not in categories:
+            continue
+        if start is not None:
+            try:
+                if os.stat(path).st_mtime < start:
+                    continue
+            except OSError:
+                continue
+        records = iter_records(path, start, end, keep, block_test)
+        if player:
+            records = filter_player(records, player)
+        yield from records
+
+
+def search_logs(paths, query, regex=False, ignore_case=True, context=0, max_matches=None,
+                processes=None, chunk_size=None, cancel=None):
+    """Search log files for lines matching a query, using every CPU core.
+
+    Files are split into chunks of whole lines and searched by a process
+    pool. Results arrive in file order as each chunk is finished, so the
+    first matches show up long before the last file is read. Each file is
+    memory-mapped, so the search itself copies little. A single chunk is
+    searched in this process, without starting a pool.
+
+    Args:
+        paths (iterable): Log files, in the order to report them
+        query (str): Text to find, or a regular expression if regex is True
+            (^ and $ match at each line)
+        regex (bool): Treat query as a regular expression
+        ignore_case (bool): Ignore the case of ASCII letters
+        context (int): Lines to include before and after each match
+        max_matches (int): Stop after this many matches
+        processes (int): Worker processes (default: one per CPU)
+        chunk_size (int): Bytes of log per task (default SEARCH_CHUNK_SIZE)
+        cancel (threading.Event): Ends the search (after the chunk being
+            reported) once set
+
+    Yields:
+        dict: path, line_no (1-based), line, before and after (lists of
+        context lines)
+
+    Raises:
+        ValueError: If the query is empty
+        re.error: If a regex query is invalid
+    """
+    if not query:
+        raise ValueError("Search query is empty")
+    needle = _search_needle(query, regex, ignore_case)  # raises re.error early
+    chunk_size = chunk_size or SEARCH_CHUNK_SIZE
+    limit = max_matches or sys.maxsize
+    tasks = []
+    for path in paths:
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            continue
+        for start in range(0, size, chunk_size):
+            stop = start + chunk_size if start + chunk_size < size else None
+            tasks.append((str(path), start, stop, needle, regex, ignore_case, context, limit))
+    if not tasks:
+        return
+
+    processes = min(processes or os.cpu_count() or 1, len(tasks))
+    pool = _pool_context().Pool(processes) if processes > 1 else None
+    results = pool.imap(_search_chunk, tasks) if pool is not None else map(_search_chunk, tasks)
+    try:
+        lines_before = {}  # path -> lines in its chunks searched so far
+        found = 0
+        for path, lines, matches in results:
+            if cancel is not None and cancel.is_set():
+                return
+            base = lines_before.get(path, 0)
+            for index, line, before, after in matches:
+                yield {
+                    'path': Path(path),
+                    'line_no': base + index + 1,
+                    'line': line,
+                    'before': before,
+                    'after': after,
+                }
+                found += 1
+                if found >= limit:
+                    return
+            lines_before[path] = base + lines
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def _pool_context():
+    """Process start method for search pools.
+
+    Forking the GUI process (which runs threads) can deadlock the child, so
+    workers come from a fork server where there is one and are spawned
+    elsewhere. Frozen Windows builds need multiprocessing.freeze_support().
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _search_needle(query, regex, ignore_case):
+    """What search workers look for: a compiled bytes regex or a bytes literal."""
+    if regex:
+        return re.compile(_crlf_line_ends(query).encode('utf-8'),
+                          re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+    data = query.encode('utf-8')
+    return data.lower() if ignore_case else data
+
+
+def _search_chunk(task):
+    """Search the lines starting in one byte range of a file (pool worker).
+
+    Returns:
+        tuple: (path, lines in the range, matches), where each match is
+        (line index within the range, line, before, after)
+    """
+    path, start, stop, needle, regex, ignore_case, context, limit = task
+    try:
+        f = open(path, 'rb')
+    except OSError:
+        return path, 0, []
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0 or start >= size:
+            return path, 0, []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The range owns the lines that start inside it
+            begin = _line_start_from(mm, start)
+            end = size if stop is None or stop >= size else _line_start_from(mm, stop)
+            if regex:
+                hits = (match.start() for match in needle.finditer(mm, begin, end))
+            else:
+                hits = _literal_hits(mm, needle, begin, end, ignore_case)
+
+            matches = []
+            index = 0
+            counted = begin
+            next_line = begin
+            for hit in hits:
+                if hit < next_line:
+                    continue  # this line has matched already
+                newline = mm.rfind(b'\n', begin, hit)
+                line_start = newline + 1 if newline >= 0 else begin
+                line_end = mm.find(b'\n', hit)
+                if line_end < 0:
+                    line_end = size
+                index += _count_lines(mm, counted, line_start)
+                counted = line_start
+                before = _lines_before(mm, line_start, context) if context else []
+                after = _lines_after(mm, line_end, context) if context else []
+                matches.append((index, _decode_line(mm[line_start:line_end]), before, after))
+                if len(matches) >= limit:
+                    break
+                next_line = line_end + 1
+            lines = index + _count_lines(mm, counted, end)
+            return path, lines, matches
+
+
+def _line_start_from(mm, pos):
+    """Offset of the first line starting at or after pos."""
+    if pos == 0:
+        return 0
+    newline = mm.find(b'\n', pos - 1)
+    return len(mm) if newline < 0 else newline + 1
+
+
+def _literal_hits(mm, needle, begin, end, ignore_case):
+    """Offsets in [begin, end) where a literal starts (needle lowercased if ignore_case)."""
+    if not ignore_case:
+        limit = min(end + len(needle) - 1, len(mm))
+        pos = mm.find(needle, begin, limit)
+        while pos >= 0:
+            yield pos
+            pos = mm.find(needle, pos + 1, limit)
+        return
+    # bytes.lower() keeps offsets, so a lowercased copy is searched block by
+    # block (overlapping by the needle length, so no match is cut in two)
+    for block_start in range(begin, end, _SCAN_BLOCK_SIZE):
+        block_end = min(block_start + _SCAN_BLOCK_SIZE, end)
+        block = mm[block_start:min(block_end + len(needle) - 1, len(mm))].lower()
+        pos = block.find(needle)
+        while 0 <= pos < block_end - block_start:
+            yield block_start + pos
+            pos = block.find(needle, pos + 1)
+
+
+def _count_lines(mm, start, end):
+    """Number of newlines in mm[start:end]."""
+    return sum(mm[pos:min(pos + _SCAN_BLOCK_SIZE, end)].count(b'\n')
+               for pos in range(start, end, _SCAN_BLOCK_SIZE))
+
+
+def _lines_before(mm, line_start, count):
+    """Up to count lines before the line starting at line_start."""
+    lines = []
+    end = line_start - 1
+    while len(lines) < count and end >= 0:
+        start = mm.rfind(b'\n', 0, end) + 1
+        lines.append(_decode_line(mm[start:end]))
+        end = start - 1
+    lines.reverse()
+    return lines
+
+
+def _lines_after(mm, line_end, count):
+    """Up to count lines after the line ending at line_end."""
+    lines = []
+    start = line_end + 1
+    while len(lines) < count and start < len(mm):
+        end = mm.find(b'\n', start)
+        if end < 0:
+            end = len(mm)
+        lines.append(_decode_line(mm[start:end]))
+        start = end + 1
+    return lines
+
+
+def _decode_line(raw):
+    """Text of a raw line without its line ending."""
+    return raw.rstrip(b'\r').decode('utf-8', 'ignore')
+
+
+def tail_lines(path, count, block_size=64 * 1024, encoding='utf-8'):
+    """The last lines of a file, read backwards from its end.
+
+    Fixed-size blocks are read from EOF towards the start until they hold
+    enough newlines, so the cost depends on how many lines are asked for,
+    not on the size of the file. Only those lines are decoded. A last line
+    without its newline yet is still being written and is left out.
+
+    Args:
+        path (str or Path): File to read
+        count (int): Number of lines wanted
+        block_size (int): Bytes read per backwards step
+        encoding (str): Text encoding (undecodable bytes are dropped)
+
+    Returns:
+        tuple: (lines, end) where lines are the last complete lines, oldest
+        first and without line endings, and end is the byte offset just
+        after them (where a tailer should carry on)
+    """
+    with open(path, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        blocks = []
+        newlines = 0
+        # One newline more than lines wanted: the first line in the window
+        # is only known to be whole if a newline precedes it
+        while pos > 0 and newlines <= count:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+
+    lines = b''.join(reversed(blocks)).split(b'\n')
+    partial = lines.pop()
+    end -= len(partial)
+    if pos > 0:
+        lines = lines[1:]
+    lines = lines[-count:] if count > 0 else []
+    return [line.rstrip(b'\r').decode(encoding, 'ignore') for line in lines], end
+
+
+class Inotify:
+    """Minimal ctypes binding for Linux inotify.
+
+    Raises:
+        OSError: If inotify is not available on this platform
+    """
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c')
+        libc = ctypes.CDLL(libc_name, use_errno=True) if libc_name else None
+        if libc is None or not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify is not available")
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+    def add_watch(self, path, mask=TAIL_EVENTS):
+        """Watch a file or directory; returns the watch descriptor."""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        return wd
+
+    def read_names(self):
+        """Names of the files changed since the last call, without blocking.
+
+        An empty name means the event was about the watched path itself, or
+        that the kernel queue overflowed; either way, check everything.
+        """
+        names = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + INOTIFY_EVENT.size <= len(data):
+                _, _, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                names.add(os.fsdecode(data[offset:offset + length].rstrip(b'\0')))
+                offset += length
+        return names
+
+    def close(self):
+        """Release the inotify descriptor (and with it every watch)."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class _FollowedFile:
+    """Read position in one followed file (used by a tailer thread only).
+
+    Reads what was appended since the last read and hands over complete
+    lines. A file replaced under the same name (new inode) or truncated in
+    place is read again from the start, after on_reset is told which of
+    the two happened.
+    """
+
+    READ_SIZE = 1024 * 1024
+    # A "line" this long without a newline is delivered as it is
+    MAX_LINE = 1024 * 1024
+
+    def __init__(self, path, on_lines, on_reset, keep_open, stop):
+        self.path = Path(path)
+        self.on_lines = on_lines
+        self.on_reset = on_reset
+        self.keep_open = keep_open
+        self.offset = 0
+        self._stop = stop
+        self._file = None
+        self._inode = None
+        self._partial = b''
+
+    def open(self, offset=None):
+        """Start at a byte offset (default: the current end of the file).
+
+        Raises:
+            OSError: If the file can't be opened
+        """
+        stat = os.stat(self.path)
+        self._inode = stat.st_ino
+        self.offset = stat.st_size if offset is None else offset
+        self._partial = b''
+        if self.keep_open:
+            self._file = open(self.path, 'rb')
+
+    def check(self):
+        """Read whatever was appended, starting over if the file was replaced.
+
+        Returns:
+            bool: False if the file is no longer at its path
+        """
+        try:
+            inode = os.stat(self.path).st_ino
+        except OSError:
+            # Gone (moved to an archive folder); keep what is open
+            self._read()
+            return False
+        if inode != self._inode:
+            self._read()  # the end of the old file
+            self.close()
+            self._inode = inode
+            self.offset = 0
+            self._partial = b''
+            if self.keep_open:
+                try:
+                    self._file = open(self.path, 'rb')
+                except OSError:
+                    return True
+            self._reset('rotated')
+        self._read()
+        return True
+
+    def close(self):
+        """Close the open file, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read(self):
+        """Deliver the bytes appended since the last read."""
+        f = self._file
+        if f is None:
+            try:
+                f = open(self.path, 'rb')
+            except OSError:
+                return
+        try:
+            size = os.fstat(f.fileno()).st_size
+            if size < self.offset:
+                self.offset = 0
+                self._partial = b''
+                self._reset('truncated')
+            if size == self.offset:
+                return
+            f.seek(self.offset)
+            while self.offset < size and not self._stop.is_set():
+                data = f.read(min(self.READ_SIZE, size - self.offset))
+                if not data:
+                    break
+                self.offset += len(data)
+                self._deliver(data)
+        finally:
+            if f is not self._file:
+                f.close()
+
+    def _deliver(self, data):
+        """Split complete lines off the buffered data and pass them on."""
+        lines = (self._partial + data).split(b'\n')
+        self._partial = lines.pop()
+        if len(self._partial) > self.MAX_LINE:
+            lines.append(self._partial)
+            self._partial = b''
+        if lines:
+            self.on_lines([line.rstrip(b'\r').decode('utf-8', 'ignore') for line in lines])
+
+    def _reset(self, reason):
+        """Tell the owner the file started over."""
+        logger.debug("Log %s was %s", self.path, reason)
+        if self.on_reset is not None:
+            self.on_reset(reason)
+
+
+class _WatchThread:
+    """Background thread that wakes when files in a directory change.
+
+    On Linux it sleeps on an inotify watch of the directory, so changes are
+    seen within milliseconds and idle files cost nothing. Elsewhere (or
+    with use_inotify False) it polls. Subclasses handle the wake-ups.
+    """
+
+    # Seconds between checks when polling
+    POLL_INTERVAL = 0.1
+    # With inotify, check anyway after this many idle seconds (network
+    # filesystems don't always send events)
+    IDLE_CHECK_INTERVAL = 2.0
+
+    def __init__(self, directory, poll_interval=None, use_inotify=True):
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval or self.POLL_INTERVAL
+        self.use_inotify = use_inotify
+        self.keep_open = os.name != 'nt'
+        self.using_inotify = False
+        self._stop = threading.Event()
+        self._wake = None
+        self._thread = None
+
+    def stop(self, timeout=2.0):
+        """Stop following and close the files."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        wake, self._wake = self._wake, None
+        if wake is not None:
+            os.write(wake[1], b'x')
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        if wake is not None:
+            os.close(wake[0])
+            os.close(wake[1])
+
+    @property
+    def running(self):
+        """True while the tailer thread is following."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _start_thread(self, name):
+        """Watch the directory and start the thread."""
+        inotify = None
+        if self.use_inotify:
+            try:
+                inotify = Inotify()
+                # Watch the directory, so replaced and new files are noticed
+                inotify.add_watch(self.directory)
+            except OSError as e:
+                logger.debug("Polling %s (inotify unavailable: %s)", self.directory, e)
+                if inotify is not None:
+                    inotify.close()
+                inotify = None
+        self.using_inotify = inotify is not None
+        if inotify is not None:
+            self._wake = os.pipe()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(inotify,), name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self, inotify):
+        """Wait for changes and handle them until stopped (tailer thread)."""
+        wake = self._wake
+        try:
+            self._changed(None)
+            while not self._stop.is_set():
+                timeout = self._timeout()
+                if inotify is None:
+                    if self._stop.wait(min(self.poll_interval, timeout)):
+                        break
+                    self._changed(None)
+                    continue
+                ready, _, _ = select.select([inotify.fd, wake[0]], [], [],
+                                            min(self.IDLE_CHECK_INTERVAL, timeout))
+                if self._stop.is_set():
+                    break
+                if inotify.fd in ready:
+                    names = inotify.read_names()
+                    self._changed(None if '' in names else names)
+                else:
+                    self._changed(None)
+        except Exception:
+            logger.exception("Log tailer for %s stopped", self.directory)
+        finally:
+            if inotify is not None:
+                inotify.close()
+            self._close()
+
+    def _timeout(self):
+        """Longest wait before the next wake-up is needed (seconds)."""
+        return self.IDLE_CHECK_INTERVAL
+
+    def _changed(self, names):
+        """Handle changes to the named files (None: check everything)."""
+        raise NotImplementedError
+
+    def _close(self):
+        """Release the followed files (tailer thread, on the way out)."""
+
+
+class LogTailer(_WatchThread):
+    """Follows a growing log file and hands new lines to a callback.
+
+    The file is read from where the last read stopped, and only when its
+    size has changed. A line is delivered once its newline has been
+    written. A file replaced under the same name (new inode) is read from
+    the start, and so is a file truncated in place. on_reset is told which
+    of the two happened.
+
+    The file is kept open between reads, except on Windows. There an open
+    handle would stop the server from moving the log into its archive
+    folder, so the file is reopened only when it has grown.
+
+    Callbacks run on the tailer thread; GUI callers pass them on to the Tk
+    thread.
+
+    Usage:
+        tailer = LogTailer(path, on_lines=lambda lines: print(*lines, sep='\\n'))
+        tailer.start()          # from the current end of the file
+        ...
+        tailer.stop()
+
+    Attributes:
+        offset (int): Byte position up to which the file has been read
+        using_inotify (bool): True if changes wake the tailer via inotify,
+            False if it polls
+    """
+
+    def __init__(self, path, on_lines, on_reset=None, poll_interval=None, use_inotify=True):
+        """Initialize the tailer (call start() to begin following).
+
+        Args:
+            path (str or Path): Log file to follow
+            on_lines (callable): Called with a list of new lines (str,
+                without line endings)
+            on_reset (callable): Called with 'rotated' or 'truncated' when
+                the file starts over
+            poll_interval (float): Seconds between stats when polling
+            use_inotify (bool): Set False to always poll
+        """
+        self.path = Path(path)
+        super().__init__(self.path.parent, poll_interval, use_inotify)
+        self.on_lines = on_lines
+        self.on_reset = on_reset
+        self._followed = None
+
+    @property
+    def offset(self):
+        """Byte position up to which the file has been read."""
+        return self._followed.offset if self._followed is not None else 0
+
+    def start(self, offset=None):
+        """Start following the file from a background thread.
+
+        Args:
+            offset (int): Byte position to start reading from (default: the
+                current end of the file)
+
+        Raises:
+            OSError: If the file can't be opened
+        """
+        if self._thread is not None:
+            raise RuntimeError("Tailer already started")
+        followed = _FollowedFile(self.path, self.on_lines, self.on_reset, self.keep_open, self._stop)
+        followed.open(offset)
+        self._followed = followed
+        self._start_thread('log-tail')
+
+    def _changed(self, names):
+        """Read the file if it changed."""
+        if names is None or self.path.name in names:
+            self._followed.check()
+
+    def _close(self):
+        """Close the followed file."""
+        self._followed.close()
+
+
+class MultiLogTailer(_WatchThread):
+    """Follows every current log file in a directory as one timeline.
+
+    The server writes each category (chat, user, admin, pvp, map, DebugLog
+    and so on) to its own file at the same time. This tailer follows all
+    the files matching `pattern` at the top of the log directory, including
+    ones created later, from one thread and one directory watch. Files
+    moved away (into an archive folder at a server restart) are dropped.
+
+    Lines are grouped into records: a timestamped line and the lines
+    without a timestamp after it. Each record is held for `merge_delay`
+    seconds before delivery. Records written to different files at about
+    the same time are then delivered together, in timestamp order.
+
+    Callbacks run on the tailer thread; GUI callers pass them on to the Tk
+    thread.
+
+    Usage:
+        tailer = MultiLogTailer(log_dir, on_records=show)
+        tailer.start()          # every file from its current end
+        ...
+        tailer.stop()
+    """
+
+    MERGE_DELAY = 0.15
+
+    def __init__(self, log_dir, on_records, on_reset=None, pattern='*.txt', merge_delay=None,
+                 poll_interval=None, use_inotify=True):
+        """Initialize the tailer (call start() to begin following).
+
+        Args:
+            log_dir (str or Path): Server Logs directory
+            on_records (callable): Called with a list of new records (dicts
+                as from parse_log_line), oldest first
+            on_reset (callable): Called with (path, reason) when a file is
+                'rotated' or 'truncated'
+            pattern (str): Names of the files to follow
+            merge_delay (float): Seconds to hold records for ordering
+                (0 delivers each read at once, sorted within itself)
+            poll_interval (float): Seconds between checks when polling
+            use_inotify (bool): Set False to always poll
+        """
+        super().__init__(log_dir, poll_interval, use_inotify)
+        self.on_records = on_records
+        self.on_reset = on_reset
+        self.pattern = pattern
+        self.merge_delay = self.MERGE_DELAY if merge_delay is None else merge_delay
+        self._files = {}        # name -> _FollowedFile
+        self._held = []         # [time, seq, arrival, path, category, lines], by arrival
+        self._open_record = {}  # path -> its last held record, which may still get lines
+        self._last_time = {}    # path -> time of its last timestamped line
+        self._seq = itertools.count()
+
+    @property
+    def offsets(self):
+        """Path -> byte position read up to, per followed file."""
+        return {followed.path: followed.offset for followed in list(self._files.values())}
+
+    def start(self, offsets=None):
+        """Start following from a background thread.
+
+        Args:
+            offsets (dict): Path -> byte position to start each file from.
+                Files not listed start from their current end; files
+                created later start from the beginning.
+        """
+        if self._thread is not None:
+            raise RuntimeError("Tailer already started")
+        offsets = {Path(path).name: offset for path, offset in (offsets or {}).items()}
+        for path in sorted(self.directory.glob(self.pattern)):
+            self._follow(path, offsets.get(path.name))
+        self._start_thread('log-tail-all')
+
+    def _follow(self, path, offset):
+        """Start following one file (False if it can't be opened)."""
+        category = log_category(path)
+        followed = _FollowedFile(
+            path, lambda lines: self._add_lines(path, category, lines),
+            (lambda reason: self.on_reset(path, reason)) if self.on_reset else None,
+            self.keep_open, self._stop)
+        try:
+            followed.open(offset)
+        except OSError as e:
+            logger.debug("Not following %s: %s", path, e)
+            return False
+        self._files[path.name] = followed
+        return True
+
+    def _changed(self, names):
+        """Read changed files, follow new ones, drop vanished ones, release due records."""
+        if names is None:
+            names = set(self._files)
+            try:
+                names.update(entry.name for entry in os.scandir(self.directory))
+            except OSError:
+                pass
+        for name in names:
+            followed = self._files.get(name)
+            if followed is None:
+                path = self.directory / name
+                if not fnmatch.fnmatch(name, self.pattern) or not path.is_file():
+                    continue
+                if not self._follow(path, 0):
+                    continue
+                followed = self._files[name]
+            if not followed.check():
+                followed.close()
+                del self._files[name]
+                self._open_record.pop(followed.path, None)
+        self._release(time.monotonic())
+
+    def _add_lines(self, path, category, lines):
+        """Group new lines of one file into held records."""
+        now = time.monotonic()
+        for line in lines:
+            when = parse_log_time(line)
+            record = self._open_record.get(path)
+            if when is None and record is not None:
+                record[5].append(line)
+                continue
+            if when is None:
+                # Continues a record already delivered
+                when = self._last_time.get(path) or time.time()
+            else:
+                self._last_time[path] = when
+            record = [when, next(self._seq), now, path, category, [line]]
+            self._held.append(record)
+            self._open_record[path] = record
+
+    def _timeout(self):
+        """Wake up when the oldest held record is due."""
+        if not self._held:
+            return self.IDLE_CHECK_INTERVAL
+        return max(0.0, self._held[0][2] + self.merge_delay - time.monotonic())
+
+    def _release(self, now):
+        """Deliver the records held long enough, and any logged before them."""
+        cutoff = now - self.merge_delay
+        due = [record for record in self._held if record[2] <= cutoff]
+        if not due:
+            return
+        latest = max(record[0] for record in due)
+        ready = [record for record in self._held if record[2] <= cutoff or record[0] <= latest]
+        self._held = [record for record in self._held if not (record[2] <= cutoff or record[0] <= latest)]
+        for record in ready:
+            if self._open_record.get(record[3]) is record:
+                del self._open_record[record[3]]
+        ready.sort(key=lambda record: (record[0], record[1]))
+        self.on_records([self._make(record) for record in ready])
+
+    @staticmethod
+    def _make(held):
+        """Record dict for a held [time, seq, arrival, path, category, lines]."""
+        when, _, _, path, category, lines = held
+        record = parse_log_line(lines[0], category, path)
+        text = '\n'.join(lines)
+        if record is None:
+            return {'time': when, 'category': category, 'steamid': None, 'username': None,
+                    'message': text, 'line': text, 'path': path}
+        if len(lines) > 1:
+            record['message'] += '\n' + '\n'.join(lines[1:])
+            record['line'] = text
+        return record
+
+    def _close(self):
+        """Close every followed file."""
+        for followed in self._files.values():
+            followed.close()
+
+
+class LogIndex:
+    """Index from timestamps to byte offsets in one log file.
+
+    The index holds one (time, offset) entry per STRIDE bytes of log: the
+    first timestamped line that starts in each stride. Building it costs one
+    seek and a line or two of reading per stride, not a scan of the file.
+    `update` carries on from where the last one stopped, and starts over if
+    the file was replaced (new inode) or truncated.
+
+    The entries persist in the tool's cache directory (CACHE_DIR), in a
+    file keyed by the log's path and inode, so the next session only
+    indexes what was appended since. Nothing is ever written beside the
+    logs, which belong to the game server. If the cache directory isn't
+    writable, the index lives in memory only.
+
+    Log timestamps only go forwards, so reading a time range takes one
+    seek to the last entry before its start.
+
+    Usage:
+        index = LogIndex(log_dir / '2024-04-19_02-00_DebugLog-server.txt')
+        for line in index.lines_between(start, end):
+            ...
+    """
+
+    STRIDE = 256 * 1024
+    CACHE_DIR = Path.home() / '.pz_admin_tool_index'
+    # magic, version, stride, inode, scanned, next_mark, entry count
+    HEADER = struct.Struct('<4sHIQQQQ')
+    ENTRY = struct.Struct('<dQ')
+    MAGIC = b'PZLX'
+    VERSION = 1
+
+    def __init__(self, log_path, index_path=None, stride=None, cache_dir=None):
+        """Load the index if it has been built before (call update() to extend it).
+
+        Args:
+            log_path (str or Path): Log file
+            index_path (str or Path): Index file (default: one per log path
+                and inode in cache_dir)
+            stride (int): Bytes of log per entry
+            cache_dir (str or Path): Where default index files go
+                (default CACHE_DIR)
+        """
+        self.log_path = Path(log_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+        self._fixed_path = index_path is not None
+        self.index_path = Path(index_path) if index_path else self._cache_path()
+        self.stride = stride or self.STRIDE
+        self.persistent = True
+        self._lock = threading.Lock()
+        self._reset(None)
+        self._saved = 0
+        self._load()
+
+    def __len__(self):
+        return len(self._times)
+
+    @property
+    def span(self):
+        """(first, last) indexed timestamps, or None before anything is indexed."""
+        return (self._times[0], self._times[-1]) if self._times else None
+
+    def update(self):
+        """Index what was appended to the log since the last update.
+
+        Returns:
+            int: Number of new entries
+
+        Raises:
+            OSError: If the log file can't be read
+        """
+        with self._lock:
+            stat = os.stat(self.log_path)
+            if stat.st_ino != self._inode or stat.st_size < self._scanned:
+                if stat.st_ino != self._inode and not self._fixed_path:
+                    self.index_path = self._cache_path(stat.st_ino)
+                self._reset(stat.st_ino)
+            before = len(self._times)
+            if stat.st_size > self._scanned:
+                with open(self.log_path, 'rb') as f:
+                    self._scan(f, stat.st_size)
+            added = len(self._times) - before
+            if added or self._saved != len(self._times):
+                self._save()
+            return added
+
+    def offset_for(self, when):
+        """Byte offset to read from to see every line logged at or after `when`."""
+        i = bisect.bisect_left(self._times, when) - 1
+        return self._offsets[i] if i >= 0 else 0
+
+    def lines_between(self, start=None, end=None):
+        """Lines logged between two times, read from a single seek.
+
+        Lines without a timestamp (stack traces, wrapped output) go with
+        the timestamped line above them.
+
+        Args:
+            start (float): Epoch seconds, or None for the start of the log
+            end (float): Epoch seconds, or None for the end of the log
+
+        Yields:
+            str: Log lines without line endings
+        """
+        self.update()
+        offset = self.offset_for(start) if start is not None else 0
+        with open(self.log_path, 'rb') as f:
+            f.seek(offset)
+            inside = start is None
+            for raw in f:
+                when = parse_log_time(raw)
+                if when is not None:
+                    if end is not None and when > end:
+                        break
+                    inside = start is None or when >= start
+                if inside:
+                    yield raw.rstrip(b'\r\n').decode('utf-8', 'ignore')
+
+    def _cache_path(self, inode=None):
+        """Index file in cache_dir for this log path and inode (None if the log is missing)."""
+        if inode is None:
+            try:
+                inode = os.stat(self.log_path).st_ino
+            except OSError:
+                return None
+        key = hashlib.sha1(os.path.abspath(self.log_path).encode('utf-8', 'surrogateescape'))
+        return self.cache_dir / f'{self.log_path.name}.{key.hexdigest()[:16]}.{inode}.idx'
+
+    def _reset(self, inode):
+        """Forget every entry (new or replaced log file)."""
+        self._inode = inode
+        self._scanned = 0      # index is complete up to this line start
+        self._next_mark = 0    # next entry is the first timestamped line from here
+        self._times = []
+        self._offsets = []
+        self._saved = 0
+
+    def _scan(self, f, size):
+        """Add an entry for each stride between the scanned offset and size."""
+        while True:
+            if self._next_mark > self._scanned:
+                if self._next_mark >= size:
+                    return
+                # Land on the first line starting at or after the mark
+                f.seek(self._next_mark - 1)
+                rest = f.readline()
+                if not rest.endswith(b'\n'):
+                    return  # still being written
+                pos = self._next_mark - 1 + len(rest)
+            else:
+                pos = self._scanned
+            f.seek(pos)
+            while True:
+                line = f.readline()
+                if not line.endswith(b'\n'):
+                    self._scanned = pos
+                    return
+                start, pos = pos, pos + len(line)
+                when = parse_log_time(line)
+                if when is not None:
+                    break
+            self._times.append(when)
+            self._offsets.append(start)
+            self._scanned = pos
+            self._next_mark = (start // self.stride + 1) * self.stride
+
+    def _load(self):
+        """Read the index file, if there is a usable one."""
+        if self.index_path is None:
+            return
+        try:
+            with open(self.index_path, 'rb') as f:
+                header = f.read(self.HEADER.size)
+                if len(header) < self.HEADER.size:
+                    return
+                magic, version, stride, inode, scanned, next_mark, count = self.HEADER.unpack(header)
+                if magic != self.MAGIC or version != self.VERSION or stride != self.stride:
+                    return
+                data = f.read(count * self.ENTRY.size)
+        except OSError:
+            return
+        if len(data) < count * self.ENTRY.size:
+            return
+        entries = list(self.ENTRY.iter_unpack(data))
+        self._inode, self._scanned, self._next_mark = inode, scanned, next_mark
+        self._times = [when for when, _ in entries]
+        self._offsets = [offset for _, offset in entries]
+        self._saved = count
+
+    def _save(self):
+        """Append new entries to the index file and rewrite its header."""
+        if not self.persistent or self.index_path is None:
+            return
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, self.stride, self._inode or 0,
+                                  self._scanned, self._next_mark, len(self._times))
+        new = b''.join(self.ENTRY.pack(when, offset) for when, offset in
+                       zip(self._times[self._saved:], self._offsets[self._saved:]))
+        try:
+            if self._saved and self.index_path.exists():
+                with open(self.index_path, 'r+b') as f:
+                    # Entries first, then the header that counts them, so an
+                    # interrupted save leaves a valid (shorter) index
+                    f.seek(self.HEADER.size + self._saved * self.ENTRY.size)
+                    f.write(new)
+                    f.truncate()
+                    f.seek(0)
+                    f.write(header)
+            else:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.index_path, 'wb') as f:
+                    f.write(header)
+                    f.write(new)
+        except OSError as e:
+            logger.info("Keeping the index of %s in memory (%s)", self.log_path, e)
+            self.persistent = False
+            return
+        self._saved = len(self._times)
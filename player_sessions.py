@@ -0,0 +1,335 @@
+"""Player session history built from the server's user log.
+
+Project Zomboid writes one line per connect and disconnect to
+`Logs/<date>_user.txt`, e.g.:
+
+    [19-04-24 14:22:33.123] 76561198000000000 "Alice" fully connected (10892,9876,0).
+    [19-04-24 15:01:02.456] 76561198000000000 "Alice" disconnected player (10901,9870,0).
+
+`PlayerSessionDB` tails those files (resuming from a saved offset per file),
+appends every connect/disconnect to an `events` table and folds them into a
+`sessions` table indexed for "who was online at ..." and playtime queries.
+Older logs, including the `logs_<date>` archive folders, can be backfilled
+in one transaction. The events table is the source of truth; sessions can
+be rebuilt from it at any time.
+"""
+import os
+import re
+import sqlite3
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# "[dd-mm-yy HH:MM:SS.mmm] <steamid> "<name>" fully connected (x,y,z)."
+USER_LOG_EVENT = re.compile(
+    r'^\[(?P<time>\d{2}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:\.\d+)?)\]\s+'
+    r'(?P<steamid>\d+)\s+"(?P<username>[^"]*)"\s+'
+    r'(?P<event>fully connected|disconnected player)'
+    r'(?:\s*\((?P<x>-?[\d.]+),\s*(?P<y>-?[\d.]+),\s*(?P<z>-?[\d.]+)\))?')
+
+EVENT_KINDS = {
+    'fully connected': 'connect',
+    'disconnected player': 'disconnect',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    time REAL NOT NULL,
+    kind TEXT NOT NULL,
+    username TEXT NOT NULL,
+    steamid TEXT,
+    x REAL, y REAL, z REAL,
+    UNIQUE (server, time, kind, username)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    username TEXT NOT NULL,
+    steamid TEXT,
+    joined REAL NOT NULL,
+    left REAL,
+    x REAL, y REAL, z REAL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_joined ON sessions (server, joined);
+CREATE INDEX IF NOT EXISTS sessions_by_user ON sessions (server, username, joined);
+CREATE INDEX IF NOT EXISTS sessions_open ON sessions (server, username) WHERE left IS NULL;
+CREATE TABLE IF NOT EXISTS log_offsets (
+    path TEXT PRIMARY KEY,
+    inode INTEGER,
+    offset INTEGER NOT NULL
+);
+"""
+
+
+def parse_user_log_line(line):
+    """Parse a connect or disconnect line from a `*_user.txt` log.
+
+    Args:
+        line (str): One log line
+
+    Returns:
+        dict: time (epoch seconds, local time), kind ('connect' or
+        'disconnect'), username, steamid, x, y, z (None if absent), or
+        None if the line is not a connect/disconnect event
+    """
+    match = USER_LOG_EVENT.match(line)
+    if not match:
+        return None
+    stamp = match.group('time')
+    try:
+        when = datetime.strptime(stamp, '%d-%m-%y %H:%M:%S.%f' if '.' in stamp else '%d-%m-%y %H:%M:%S')
+    except ValueError:
+        return None
+    coords = [match.group(axis) for axis in ('x', 'y', 'z')]
+    x, y, z = (float(c) if c is not None else None for c in coords)
+    return {
+        'time': when.timestamp(),
+        'kind': EVENT_KINDS[match.group('event')],
+        'username': match.group('username'),
+        'steamid': match.group('steamid'),
+        'x': x, 'y': y, 'z': z,
+    }
+
+
+def find_user_logs(log_dir, archives=True):
+    """List `*_user.txt` files in a log directory, oldest first.
+
+    Args:
+        log_dir (Path): Server Logs directory
+        archives (bool): Also include the `logs_<date>` archive folders
+
+    Returns:
+        list: Paths sorted by modification time
+    """
+    log_dir = Path(log_dir)
+    files = list(log_dir.glob('*_user.txt'))
+    if archives:
+        files.extend(log_dir.glob('logs_*/*_user.txt'))
+    return sorted(files, key=lambda p: p.stat().st_mtime)
+
+
+class PlayerSessionDB:
+    """SQLite store of player connect/disconnect events and the sessions they form.
+
+    One database file can hold several servers; each instance reads and
+    writes the rows for the `server` it was opened with (by default the log
+    directory path). Safe to share between threads.
+
+    Usage:
+        db = PlayerSessionDB(Path.home() / '.pz_admin_tool_sessions.db', log_dir)
+        db.backfill()                 # once, from every historical log
+        db.sync()                     # then periodically, tails the live logs
+        db.online_at(datetime(2024, 4, 19, 3, 12).timestamp())
+    """
+
+    def __init__(self, db_path, log_dir, server=None):
+        """Open (creating if needed) the session database.
+
+        Args:
+            db_path (str or Path): SQLite database file (':memory:' for tests)
+            log_dir (str or Path): Directory holding the server's `*_user.txt` logs
+            server (str): Key for this server's rows (default: log_dir)
+        """
+        self.log_dir = Path(log_dir)
+        self.server = server or str(self.log_dir)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def sync(self):
+        """Read new lines from the live `*_user.txt` logs and record their events.
+
+        Each file is read from where the previous call stopped; a file that
+        shrank or was replaced (new inode) is read from the start again.
+        Events already stored are ignored, so overlapping reads are harmless.
+
+        Returns:
+            int: Number of new events recorded
+        """
+        return self._ingest(find_user_logs(self.log_dir, archives=False))
+
+    def backfill(self):
+        """Record events from every user log, including the archive folders.
+
+        All files are parsed first and their events applied in time order in
+        a single transaction, so a long history loads in one pass.
+
+        Returns:
+            int: Number of new events recorded
+        """
+        count = self._ingest(find_user_logs(self.log_dir, archives=True))
+        logger.info("Backfilled %d player events from %s", count, self.log_dir)
+        return count
+
+    def rebuild_sessions(self):
+        """Recompute the sessions table from the stored events."""
+        with self._lock, self._conn:
+            self._rebuild_sessions()
+
+    def online_at(self, when):
+        """Sessions in progress at a moment.
+
+        Args:
+            when (float): Epoch seconds
+
+        Returns:
+            list: Session dicts (username, steamid, joined, left, x, y, z),
+            earliest join first
+        """
+        return self._query(
+            'SELECT username, steamid, joined, left, x, y, z FROM sessions '
+            'WHERE server = ? AND joined <= ? AND (left IS NULL OR left > ?) ORDER BY joined',
+            (self.server, when, when))
+
+    def online_now(self):
+        """Sessions without a recorded disconnect."""
+        return self._query(
+            'SELECT username, steamid, joined, left, x, y, z FROM sessions '
+            'WHERE server = ? AND left IS NULL ORDER BY joined', (self.server,))
+
+    def top_playtime(self, since, until=None, limit=10):
+        """Players ranked by time online within a window.
+
+        Sessions are clipped to the window; open sessions count up to
+        `until`.
+
+        Args:
+            since (float): Window start, epoch seconds
+            until (float): Window end (default: now)
+            limit (int): Most players returned
+
+        Returns:
+            list: dicts with username, seconds and sessions, longest first
+        """
+        until = time.time() if until is None else until
+        return self._query(
+            'SELECT username, SUM(MIN(COALESCE(left, :until), :until) - MAX(joined, :since)) AS seconds, '
+            'COUNT(*) AS sessions FROM sessions '
+            'WHERE server = :server AND joined < :until AND (left IS NULL OR left > :since) '
+            'GROUP BY username ORDER BY seconds DESC LIMIT :limit',
+            {'server': self.server, 'since': since, 'until': until, 'limit': limit})
+
+    def player_sessions(self, username, limit=50):
+        """A player's most recent sessions, newest first."""
+        return self._query(
+            'SELECT username, steamid, joined, left, x, y, z FROM sessions '
+            'WHERE server = ? AND username = ? ORDER BY joined DESC LIMIT ?',
+            (self.server, username, limit))
+
+    def usernames(self):
+        """Every username seen on this server."""
+        return [row['username'] for row in self._query(
+            'SELECT DISTINCT username FROM sessions WHERE server = ?', (self.server,))]
+
+    def stats(self):
+        """Row counts for this server: events, sessions and open sessions."""
+        with self._lock:
+            count = lambda sql: self._conn.execute(sql, (self.server,)).fetchone()[0]
+            return {
+                'events': count('SELECT COUNT(*) FROM events WHERE server = ?'),
+                'sessions': count('SELECT COUNT(*) FROM sessions WHERE server = ?'),
+                'online': count('SELECT COUNT(*) FROM sessions WHERE server = ? AND left IS NULL'),
+            }
+
+    def _query(self, sql, params):
+        """Run a read query and return the rows as dicts."""
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+    def _ingest(self, paths):
+        """Parse the unread part of each file and apply the events in time order."""
+        events = []
+        offsets = []
+        with self._lock:
+            for path in paths:
+                new_events, offset = self._read_new_events(path)
+                events.extend(new_events)
+                offsets.append(offset)
+            if not offsets:
+                return 0
+
+            events.sort(key=lambda e: e['time'])
+            latest = self._conn.execute('SELECT MAX(time) FROM events WHERE server = ?',
+                                        (self.server,)).fetchone()[0]
+            # Events older than what is already stored (a backfill after
+            # tailing began) can't be folded in incrementally
+            in_order = latest is None or not events or events[0]['time'] >= latest
+            recorded = 0
+            with self._conn:
+                for event in events:
+                    cursor = self._conn.execute(
+                        'INSERT OR IGNORE INTO events (server, time, kind, username, steamid, x, y, z) '
+                        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                        (self.server, event['time'], event['kind'], event['username'],
+                         event['steamid'], event['x'], event['y'], event['z']))
+                    if cursor.rowcount:
+                        recorded += 1
+                        if in_order:
+                            self._apply_event(event)
+                if recorded and not in_order:
+                    self._rebuild_sessions()
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO log_offsets (path, inode, offset) VALUES (?, ?, ?)', offsets)
+        return recorded
+
+    def _read_new_events(self, path):
+        """Events after the saved offset of one file, and the (path, inode, offset) to save."""
+        key = str(Path(path).resolve())
+        stat = os.stat(path)
+        row = self._conn.execute('SELECT inode, offset FROM log_offsets WHERE path = ?', (key,)).fetchone()
+        offset = 0
+        if row and row['inode'] == stat.st_ino and row['offset'] <= stat.st_size:
+            offset = row['offset']
+
+        events = []
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # Partial line still being written; read it next time
+                offset += len(raw)
+                event = parse_user_log_line(raw.decode('utf-8', 'ignore'))
+                if event:
+                    events.append(event)
+        return events, (key, stat.st_ino, offset)
+
+    def _rebuild_sessions(self):
+        """Replay every stored event into a fresh sessions table (caller holds the lock)."""
+        self._conn.execute('DELETE FROM sessions WHERE server = ?', (self.server,))
+        rows = self._conn.execute(
+            'SELECT time, kind, username, steamid, x, y, z FROM events '
+            'WHERE server = ? ORDER BY time, id', (self.server,)).fetchall()
+        for row in rows:
+            self._apply_event(dict(row))
+
+    def _apply_event(self, event):
+        """Fold one event into the sessions table (caller holds the lock and transaction).
+
+        A connect while a session is still open (the server stopped without
+        logging the disconnect) closes the stale session at the new join.
+        """
+        open_session = self._conn.execute(
+            'SELECT id FROM sessions WHERE server = ? AND username = ? AND left IS NULL',
+            (self.server, event['username'])).fetchone()
+        if open_session:
+            self._conn.execute('UPDATE sessions SET left = ? WHERE id = ?',
+                               (event['time'], open_session['id']))
+        if event['kind'] == 'connect':
+            self._conn.execute(
+                'INSERT INTO sessions (server, username, steamid, joined, x, y, z) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (self.server, event['username'], event['steamid'], event['time'],
+                 event['x'], event['y'], event['z']))
@@ -0,0 +1,197 @@
+"""Read-only, paginated access to the server's players.db.
+
+The game server keeps players.db open while it runs, so the browser opens
+it through an `immutable` read-only URI: SQLite takes no locks and never
+writes, so browsing can't stall the server. The schema is read once per
+version of the file, and rows are fetched a page at a time with keyset
+pagination on rowid, so even a table with tens of thousands of characters
+is never loaded whole. BLOB columns (the serialized character data) are
+shown by size instead of being read.
+"""
+import os
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def _quote(identifier):
+    """Quote an SQL identifier."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class PlayersDB:
+    """Browse the tables of a players.db without locking or loading it whole.
+
+    Usage:
+        db = PlayersDB(path)
+        page = db.page('networkPlayers', username='ali', limit=100)
+        more = db.page('networkPlayers', after=page['next'], username='ali')
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, db_path):
+        """Open the database read-only.
+
+        Args:
+            db_path (str or Path): players.db file
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._schema = None
+        self._schema_key = None
+
+    def close(self):
+        """Close the connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def tables(self):
+        """Names of the tables in the database, networkPlayers first."""
+        return list(self._load_schema())
+
+    def columns(self, table):
+        """Column (name, declared type) pairs for a table.
+
+        Raises:
+            KeyError: If the table does not exist
+        """
+        return self._load_schema()[table]
+
+    def page(self, table, after=None, before=None, limit=None, username=None, near=None):
+        """Fetch one page of rows in rowid order.
+
+        Args:
+            table (str): Table name
+            after (int): Return rows after this rowid (the previous page's
+                `next`)
+            before (int): Return the rows just before this rowid (the
+                current page's `prev`), for paging backwards
+            limit (int): Rows per page (default PAGE_SIZE)
+            username (str): Keep rows whose username contains this text
+                (case-insensitive; tables with a username column only)
+            near (tuple): (x, y, radius) keeps rows whose last position is
+                within radius tiles (tables with x and y columns only)
+
+        Returns:
+            dict: columns (list of names, 'rowid' first), rows (list of
+            tuples), prev and next (rowid cursors, None at either end)
+
+        Raises:
+            KeyError: If the table does not exist
+            ValueError: If a filter needs a column the table lacks
+        """
+        limit = limit or self.PAGE_SIZE
+        columns = self.columns(table)
+        names = [name for name, _ in columns]
+        select = ['rowid'] + [
+            f'length({_quote(name)})' if decl.upper() == 'BLOB' else _quote(name)
+            for name, decl in columns]
+
+        where, params = self._filters(names, username, near)
+        if after is not None:
+            where.append('rowid > ?')
+            params.append(after)
+        if before is not None:
+            where.append('rowid < ?')
+            params.append(before)
+        order = 'DESC' if before is not None and after is None else 'ASC'
+
+        sql = f"SELECT {', '.join(select)} FROM {_quote(table)}"
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += f' ORDER BY rowid {order} LIMIT ?'
+        # One extra row says whether there is another page in this direction
+        rows = self._execute(sql, params + [limit + 1])
+        more = len(rows) > limit
+        rows = rows[:limit]
+        if order == 'DESC':
+            rows.reverse()
+
+        first = rows[0][0] if rows else None
+        last = rows[-1][0] if rows else None
+        if order == 'DESC':
+            has_prev, has_next = more, True
+        else:
+            has_prev, has_next = after is not None, more
+        return {
+            'columns': ['rowid'] + names,
+            'rows': rows,
+            'prev': first if has_prev and rows else None,
+            'next': last if has_next and rows else None,
+        }
+
+    def count(self, table, username=None, near=None):
+        """Number of rows matching the same filters as `page`."""
+        where, params = self._filters([name for name, _ in self.columns(table)], username, near)
+        sql = f'SELECT COUNT(*) FROM {_quote(table)}'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        return self._execute(sql, params)[0][0]
+
+    def _filters(self, names, username, near):
+        """WHERE clauses and parameters for the username and position filters."""
+        where, params = [], []
+        if username:
+            if 'username' not in names:
+                raise ValueError("This table has no username column")
+            escaped = username.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            where.append("username LIKE ? ESCAPE '\\'")
+            params.append(f'%{escaped}%')
+        if near:
+            if 'x' not in names or 'y' not in names:
+                raise ValueError("This table has no x/y position columns")
+            x, y, radius = near
+            # Box test first (cheap), then the exact circle
+            where.append('x BETWEEN ? AND ? AND y BETWEEN ? AND ?')
+            params.extend([x - radius, x + radius, y - radius, y + radius])
+            where.append('(x - ?) * (x - ?) + (y - ?) * (y - ?) <= ?')
+            params.extend([x, x, y, y, radius * radius])
+        return where, params
+
+    def _execute(self, sql, params=()):
+        """Run a query on the shared read-only connection."""
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def _connection(self):
+        """The open connection, reopened if the file changed (caller holds the lock)."""
+        key = self._file_key()
+        if self._conn is not None and key != self._schema_key:
+            # immutable=1 means SQLite assumes the file never changes, so a
+            # new version of the file needs a fresh connection
+            self._conn.close()
+            self._conn = None
+            self._schema = None
+        if self._conn is None:
+            uri = f'file:{self.db_path.resolve().as_posix()}?mode=ro&immutable=1'
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._schema_key = key
+        return self._conn
+
+    def _file_key(self):
+        """(mtime, size) of the database file, to notice when it is rewritten."""
+        stat = os.stat(self.db_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_schema(self):
+        """Table -> columns map, read once per version of the file."""
+        with self._lock:
+            conn = self._connection()
+            if self._schema is None:
+                names = [row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' "
+                    "AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+                names.sort(key=lambda name: name != 'networkPlayers')
+                self._schema = {
+                    name: [(row[1], row[2] or '') for row in
+                           conn.execute(f'PRAGMA table_info({_quote(name)})')]
+                    for name in names}
+                logger.debug("Loaded players.db schema: %s", ', '.join(names))
+            return self._schema
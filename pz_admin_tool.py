@@ -4,10 +4,12 @@ A comprehensive GUI tool for managing Project Zomboid servers
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, font
-import socket
-import struct
+from tkinter import ttk, messagebox, scrolledtext, font, simpledialog
+import multiprocessing
+import queue
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import time
 import sqlite3
 import os
@@ -16,226 +18,18 @@ import re
 import subprocess
 import webbrowser
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-# ---------------------------------------------------------------------------
-# Inlined: rcon.py
-# ---------------------------------------------------------------------------
-class RCONClient:
-    """RCON client for communicating with Project Zomboid server."""
+from rcon import (PRIORITY_URGENT, PRIORITY_INTERACTIVE, PRIORITY_BULK, LatencyTracker,
+                  RCONClient, RCONRateLimiter, RCONFleet, build_connection)
+from utils import (parse_mods_and_workshop, parse_banlist, parse_player_list, diff_keyed,
+                   find_server_path, find_config_file, find_log_file,
+                   NameIndex, ServerPathCache, _config_dirs, _log_dirs)
+from player_sessions import PlayerSessionDB
+from players_db import PlayersDB
+from log_tools import (LOG_CATEGORIES, parse_log_time, find_log_files, log_category,
+                       read_log_records, search_logs, tail_lines, LogTailer, MultiLogTailer)
 
-    SERVERDATA_AUTH = 3
-    SERVERDATA_AUTH_RESPONSE = 2
-    SERVERDATA_EXECCOMMAND = 2
-    SERVERDATA_RESPONSE_VALUE = 0
-
-    def __init__(self, host, port, password):
-        self.host = host
-        self.port = port
-        self.password = password
-        self.sock = None
-        self.request_id = 0
-        self.authenticated = False
-
-    def connect(self):
-        """Establish connection to RCON server and authenticate."""
-        try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.settimeout(10)
-            self.sock.connect((self.host, self.port))
-            self.request_id += 1
-            auth_id = self.request_id
-            auth_body = self.password.encode('utf-8')
-            packet_data = auth_body + b'\x00\x00'
-            packet_size = 4 + 4 + len(packet_data)
-            packet = struct.pack('<i', packet_size)
-            packet += struct.pack('<i', auth_id)
-            packet += struct.pack('<i', self.SERVERDATA_AUTH)
-            packet += packet_data
-            self.sock.sendall(packet)
-            size_data = self._recv_all(4)
-            if not size_data:
-                raise Exception("Auth failed - no response")
-            response_size = struct.unpack('<i', size_data)[0]
-            response_data = self._recv_all(response_size)
-            if not response_data or len(response_data) < 8:
-                raise Exception("Auth failed - incomplete response")
-            first_packet_type = struct.unpack('<i', response_data[4:8])[0]
-            if first_packet_type == self.SERVERDATA_RESPONSE_VALUE:
-                size_data = self._recv_all(4)
-                if not size_data:
-                    raise Exception("Auth failed - no auth response")
-                response_size = struct.unpack('<i', size_data)[0]
-                response_data = self._recv_all(response_size)
-                if not response_data or len(response_data) < 4:
-                    raise Exception("Auth failed - incomplete auth response")
-            response_id = struct.unpack('<i', response_data[:4])[0]
-            if response_id == -1:
-                raise Exception("Authentication failed - wrong password")
-            self.authenticated = True
-            return True
-        except socket.timeout:
-            raise Exception("Connection timed out - check host and port")
-        except ConnectionRefusedError:
-            raise Exception("Connection refused - is RCON enabled and server running?")
-        except Exception:
-            if self.sock:
-                try:
-                    self.sock.close()
-                except Exception:
-                    pass
-                self.sock = None
-            raise
-
-    def disconnect(self):
-        """Close RCON connection."""
-        if self.sock:
-            try:
-                self.sock.close()
-            except (OSError, socket.error):
-                pass
-            self.sock = None
-            self.authenticated = False
-
-    def execute_command(self, command):
-        """Execute a command on the server using existing connection."""
-        if not self.sock or not self.authenticated:
-            raise Exception("Not connected to server")
-        try:
-            self.request_id += 1
-            cmd_id = self.request_id
-            cmd_body = command.encode('utf-8')
-            packet_data = cmd_body + b'\x00\x00'
-            packet_size = 4 + 4 + len(packet_data)
-            packet = struct.pack('<i', packet_size)
-            packet += struct.pack('<i', cmd_id)
-            packet += struct.pack('<i', self.SERVERDATA_EXECCOMMAND)
-            packet += packet_data
-            self.sock.sendall(packet)
-            response_text = ""
-            size_data = self._recv_all(4)
-            if size_data:
-                response_size = struct.unpack('<i', size_data)[0]
-                response_data = self._recv_all(response_size)
-                if response_data and len(response_data) >= 8:
-                    response_text = response_data[8:].rstrip(b'\x00').decode('utf-8', errors='ignore')
-            return response_text
-        except (BrokenPipeError, ConnectionResetError):
-            self.authenticated = False
-            raise Exception("Connection lost - please reconnect")
-        except socket.timeout:
-            raise Exception("Command timed out")
-        except Exception as e:
-            raise Exception(f"Command failed: {str(e)}")
-
-    def _recv_all(self, n):
-        """Receive exactly n bytes from socket."""
-        data = b''
-        while len(data) < n:
-            try:
-                chunk = self.sock.recv(n - len(data))
-                if not chunk:
-                    return None
-                data += chunk
-            except socket.error:
-                return None
-        return data
-
-
-# ---------------------------------------------------------------------------
-# Inlined: utils.py
-# ---------------------------------------------------------------------------
-def parse_mods_and_workshop(ini_file):
-    """Parse mods and workshop items from server INI file."""
-    mods = []
-    workshop_ids = []
-    try:
-        with open(ini_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            for line in content.split('\n'):
-                if line.startswith('Mods='):
-                    mods_str = line.split('=', 1)[1].strip()
-                    mods = [m.strip() for m in mods_str.split(';') if m.strip()]
-                elif line.startswith('WorkshopItems='):
-                    workshop_str = line.split('=', 1)[1].strip()
-                    workshop_ids = [w.strip() for w in workshop_str.split(';') if w.strip()]
-    except Exception as e:
-        logger.error("Failed to parse mods from %s: %s", ini_file, e)
-    return mods, workshop_ids
-
-
-def parse_banlist(banlist_file):
-    """Parse ban list from banlist.txt file."""
-    bans = []
-    try:
-        with open(banlist_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                parts = line.split(',')
-                username = parts[0] if len(parts) > 0 else 'Unknown'
-                ip = parts[1] if len(parts) > 1 else 'N/A'
-                reason = parts[2] if len(parts) > 2 else 'No reason specified'
-                bans.append((username, ip, 'N/A', reason))
-    except Exception as e:
-        logger.error("Failed to parse banlist from %s: %s", banlist_file, e)
-    return bans
-
-
-def find_server_path(start_path):
-    """Auto-detect Project Zomboid server paths."""
-    data_paths = [
-        Path.home() / "Zomboid",
-        Path.home() / ".local" / "share" / "Zomboid",
-    ]
-    install_paths = [
-        Path.home() / ".steam" / "steamapps" / "common" / "Project Zomboid Dedicated Server",
-        Path.home() / "Steam" / "steamapps" / "common" / "Project Zomboid Dedicated Server",
-        Path("/home/pzserver/.steam/steamapps/common/Project Zomboid Dedicated Server"),
-        Path("/opt/pzserver"),
-        Path.home() / ".local" / "share" / "Steam" / "steamapps" / "common" / "Project Zomboid Dedicated Server",
-    ]
-    for path in data_paths:
-        server_dir = path / 'Server'
-        if server_dir.exists():
-            has_ini = any(f.endswith('.ini') for f in os.listdir(server_dir)
-                         if os.path.isfile(os.path.join(server_dir, f)))
-            if has_ini:
-                return path
-    for path in install_paths:
-        if path.exists():
-            return path
-    return None
-
-
-def find_config_file(server_path):
-    """Find the server .ini config file."""
-    search_dirs = [
-        server_path / 'Server',
-        server_path,
-        Path.home() / 'Zomboid' / 'Server',
-        Path.home() / '.local' / 'share' / 'Zomboid' / 'Server',
-    ]
-    for search_dir in search_dirs:
-        if search_dir.exists():
-            for ini_file in search_dir.glob('*.ini'):
-                return ini_file
-    return None
-
-
-def find_log_file(server_path):
-    """Find the server log directory."""
-    log_locations = [
-        server_path / 'Logs',
-        server_path.parent / 'Logs',
-        Path.home() / 'Zomboid' / 'Logs',
-        Path.home() / '.local' / 'share' / 'Zomboid' / 'Logs',
-    ]
-    for log_dir in log_locations:
-        if log_dir.exists() and log_dir.is_dir():
-            return log_dir
-    return None
 
 # Set up logging
 logging.basicConfig(
@@ -248,23 +42,80 @@ logger = logging.getLogger(__name__)
 class PZServerAdmin(tk.Tk):
     """Main application window"""
     
+    # Milliseconds between drains of the background -> Tk callback queue
+    UI_DISPATCH_INTERVAL = 50
+    # Callbacks run per drain, so a flood of output can't starve the mainloop
+    UI_DISPATCH_BATCH = 200
+    # Players list rows are keyed by username with this prefix (other rows are placeholders)
+    PLAYER_IID_PREFIX = 'player:'
+    # Player actions that apply to every selected player at once
+    BULK_PLAYER_ACTIONS = ('kick', 'ban', 'admin', 'removeadmin')
+    # Player actions sent ahead of everything else, like restart warnings
+    # (in bulk they run at interactive priority; see run_bulk_commands)
+    URGENT_PLAYER_ACTIONS = ('kick', 'ban')
+    # Default pacing of outgoing RCON commands (commands/second, burst size)
+    DEFAULT_RCON_RATE = 20
+    DEFAULT_RCON_BURST = 40
+    # Seconds between fleet summary refreshes
+    FLEET_REFRESH_INTERVAL = 30
+    # Seconds between reads of the user log into the session history
+    SESSION_POLL_INTERVAL = 15
+    SESSION_DB_FILE = Path.home() / '.pz_admin_tool_sessions.db'
+    PATH_CACHE_FILE = Path.home() / '.pz_admin_tool_paths.json'
+    # Most lines a Logs tab time range shows
+    LOG_RANGE_MAX_LINES = 20000
+    # Most matches a log search shows
+    LOG_SEARCH_MAX_MATCHES = 5000
+    # Merged live view colour per log category (readable on both themes)
+    LIVE_LOG_COLORS = {
+        'chat': '#2e9e5b', 'user': '#3a86d4', 'admin': '#d2691e', 'pvp': '#d64545',
+        'map': '#9b59b6', 'cmd': '#b8860b', 'DebugLog': '#8c8c8c', 'other': '#1fa2a2',
+    }
+    
     def __init__(self):
         super().__init__()
         
         self.title("Project Zomboid Server Admin Tool v2.5.0")
         self.geometry("1200x800")  # Increased from 1000x700
-        
+        self._base_title = self.title()
+        
+        # Every known server keeps its own connection and worker in the
+        # fleet; self.rcon / self.rcon_worker are those of the active server,
+        # which all the tabs below operate on
+        self.fleet = RCONFleet(connection_factory=self._build_rcon_connection)
+        self.active_server = None
+        self._fleet_status = {}  # name -> last summary from refresh_fleet
+        self._fleet_refresh_id = None
+        self._fleet_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='fleet-ui')
+        self._session_db = None  # PlayerSessionDB for the current server's logs
+        # Where each server's config, logs, ban list and players.db were
+        # found; checked by stat on use instead of searched every time
+        self.path_cache = ServerPathCache(self.PATH_CACHE_FILE)
+        # Every player name seen (online list, players.db, bans, session
+        # history), for completion in the username fields
+        self.player_names = NameIndex()
         self.rcon = None
+        self.rcon_worker = None  # Background RCON I/O; results come back via _dispatch_ui_calls
+        self._ui_calls = queue.Queue()
+        self._health_check_id = None
+        self._rcon_was_connected = False
         self.auto_refresh = False
         self.server_path = tk.StringVar()
         
-        # Restart countdown tracking
+        # Restart countdown tracking (bound to the server active when it started)
         self.restart_countdown_active = False
         self.restart_time_remaining = 0
+        self._restart_server = None
+        
+        # Outgoing RCON pacing (saved with the connection config)
+        self.rcon_rate = self.DEFAULT_RCON_RATE
+        self.rcon_burst = self.DEFAULT_RCON_BURST
         
         # Theme and appearance settings
         self.current_theme = tk.StringVar(value="light")
         self.font_size = tk.IntVar(value=9)
+        # Dump every raw 'players' reply into the command output (debugging)
+        self.log_raw_responses = tk.BooleanVar(value=False)
         
         # Load appearance preferences
         self.load_appearance_settings()
@@ -281,6 +132,13 @@ class PZServerAdmin(tk.Tk):
         
         # Check for saved restart timer and offer to resume
         self.after(500, self._check_and_resume_restart_timer)
+        
+        # Deliver results from background RCON calls to the Tk thread
+        self.after(self.UI_DISPATCH_INTERVAL, self._dispatch_ui_calls)
+        
+        # Keep the player session history up to date from the user log
+        self.after(self.SESSION_POLL_INTERVAL * 1000, self._poll_player_sessions)
+        self.after(1500, self.load_player_names)
     
     def create_menu(self):
         """Create menu bar"""
@@ -315,6 +173,12 @@ class PZServerAdmin(tk.Tk):
         font_menu.add_radiobutton(label="Extra Large (12pt)", variable=self.font_size, 
                                  value=12, command=self.apply_font_size)
         
+        view_menu.add_separator()
+        view_menu.add_command(label="RCON Diagnostics...", command=self.show_rcon_diagnostics)
+        view_menu.add_command(label="RCON Rate Limit...", command=self.show_rate_limit_settings)
+        view_menu.add_checkbutton(label="Log Raw Player List Responses", variable=self.log_raw_responses,
+                                  command=self.save_appearance_settings)
+        
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
@@ -623,7 +487,8 @@ class PZServerAdmin(tk.Tk):
         try:
             config = {
                 'theme': self.current_theme.get(),
-                'font_size': self.font_size.get()
+                'font_size': self.font_size.get(),
+                'log_raw_responses': self.log_raw_responses.get()
             }
             config_file = Path.home() / '.pz_admin_tool_appearance.json'
             with open(config_file, 'w') as f:
@@ -640,6 +505,7 @@ class PZServerAdmin(tk.Tk):
                     config = json.load(f)
                     self.current_theme.set(config.get('theme', 'light'))
                     self.font_size.set(config.get('font_size', 9))
+                    self.log_raw_responses.set(config.get('log_raw_responses', False))
         except (IOError, OSError, json.JSONDecodeError) as e:
             logger.debug("Failed to load appearance settings, using defaults: %s", e)
     
@@ -664,6 +530,164 @@ Created with ❤️ for the PZ community
 """
         messagebox.showinfo("About", about_text)
     
+    def show_rcon_diagnostics(self):
+        """Show connection, pool, worker, cache and latency statistics for the RCON session"""
+        dialog = tk.Toplevel(self)
+        dialog.title("RCON Diagnostics")
+        dialog.geometry("640x600")
+        dialog.transient(self)
+        self.apply_dialog_theme(dialog)
+        
+        text = scrolledtext.ScrolledText(dialog, wrap=tk.WORD, font=('Courier', 9))
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 5))
+        
+        def refresh():
+            text.config(state=tk.NORMAL)
+            text.delete(1.0, tk.END)
+            text.insert(tk.END, self._rcon_diagnostics_text())
+            text.config(state=tk.DISABLED)
+        
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(btn_frame, text="🔄 Refresh", command=refresh).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        refresh()
+    
+    def show_rate_limit_settings(self):
+        """Configure how fast commands are sent to the server"""
+        dialog = tk.Toplevel(self)
+        dialog.title("RCON Rate Limit")
+        dialog.geometry("420x220")
+        dialog.transient(self)
+        self.apply_dialog_theme(dialog)
+        
+        ttk.Label(dialog, text="Outgoing commands are paced so bursts (bulk unbans,\n"
+                               "scheduled announcements) can't stall the server.\n"
+                               "Restart warnings and kicks always go first.",
+                  justify=tk.LEFT).pack(padx=15, pady=(15, 10), anchor=tk.W)
+        
+        form = ttk.Frame(dialog)
+        form.pack(padx=15, fill=tk.X)
+        rate_var = tk.StringVar(value=str(self.rcon_rate))
+        burst_var = tk.StringVar(value=str(self.rcon_burst))
+        ttk.Label(form, text="Commands per second (0 = unlimited):").grid(row=0, column=0, sticky=tk.W, pady=3)
+        ttk.Spinbox(form, from_=0, to=1000, textvariable=rate_var, width=8).grid(row=0, column=1, padx=5)
+        ttk.Label(form, text="Burst size:").grid(row=1, column=0, sticky=tk.W, pady=3)
+        ttk.Spinbox(form, from_=1, to=1000, textvariable=burst_var, width=8).grid(row=1, column=1, padx=5)
+        
+        def apply():
+            try:
+                rate = float(rate_var.get())
+                burst = int(burst_var.get())
+                if rate < 0 or burst < 1:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("Invalid Value",
+                                     "Rate must be 0 or more and burst at least 1", parent=dialog)
+                return
+            self.rcon_rate = int(rate) if rate.is_integer() else rate
+            self.rcon_burst = burst
+            pool = self._rcon_pool()
+            if pool is not None and pool.limiter:
+                pool.limiter.configure(rate=self.rcon_rate, burst=self.rcon_burst)
+            logger.info("RCON rate limit set to %s/s (burst %d)", self.rcon_rate, self.rcon_burst)
+            dialog.destroy()
+        
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(fill=tk.X, padx=15, pady=15)
+        ttk.Label(btn_frame, text="Use Save Config to keep these settings.",
+                  foreground='gray').pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Apply", command=apply).pack(side=tk.RIGHT, padx=5)
+    
+    def _rcon_pool(self):
+        """The connection pool under the cache and session, or None if not connected"""
+        if not self.rcon:
+            return None
+        return self.rcon.connection.connection
+    
+    def _rcon_diagnostics_text(self):
+        """Build the report shown by show_rcon_diagnostics"""
+        if not self.rcon:
+            return "Not connected.\n"
+        
+        cache = self.rcon
+        session = cache.connection
+        pool = session.connection
+        lines = [f"Server: {session.host}:{session.port}", ""]
+        
+        health = session.stats()
+        lines.append("=== Connection ===")
+        lines.append(f"State:          {'connected' if health['connected'] else 'reconnecting'}")
+        lines.append(f"Reconnects:     {health['reconnects']}")
+        lines.append(f"Replayed cmds:  {health['replays']}")
+        if health['down_for'] is not None:
+            lines.append(f"Down for:       {health['down_for']:.1f}s ({health['attempts']} attempts)")
+        if health['last_outage'] is not None:
+            lines.append(f"Last outage:    {health['last_outage']:.1f}s")
+        lines.append(f"Total downtime: {health['total_downtime']:.1f}s")
+        lines.append("")
+        
+        usage = pool.stats()
+        lines.append("=== Connection pool ===")
+        lines.append(f"Open / size:    {usage['open']} / {usage['size']} ({usage['reserved']} reserved)")
+        lines.append(f"In use / idle:  {usage['in_use']} / {usage['idle']}")
+        lines.append(f"Created:        {usage['created']}   Discarded: {usage['discarded']}")
+        lines.append("")
+        
+        if pool.limiter:
+            limits = pool.limiter.stats()
+            rate = f"{limits['rate']:g}/s" if limits['rate'] else "unlimited"
+            lines.append("=== Rate limiter ===")
+            lines.append(f"Rate / burst:   {rate} / {limits['burst']}   "
+                         f"Tokens: {limits['tokens']:.1f}   Waiting: {limits['waiting']}")
+            for name, c in limits['classes'].items():
+                lines.append(f"  {name:<12} waiting {c['waiting']:<4} sent {c['granted']:<6} "
+                             f"avg wait {c['avg_wait'] * 1000:>7.1f} ms   max {c['max_wait'] * 1000:>7.1f} ms")
+            lines.append("")
+        
+        if self.rcon_worker:
+            lines.append("=== Background worker ===")
+            lines.append(f"Queued calls:   {self.rcon_worker.pending}")
+            for name, c in self.rcon_worker.stats().items():
+                lines.append(f"  {name:<12} queued {c['queued']:<4} started {c['started']:<6} "
+                             f"avg wait {c['avg_wait'] * 1000:>7.1f} ms   max {c['max_wait'] * 1000:>7.1f} ms")
+            lines.append("")
+        
+        cached = cache.cache_stats()
+        lookups = cached['hits'] + cached['misses'] + cached['collapsed']
+        hit_rate = (cached['hits'] + cached['collapsed']) / lookups * 100 if lookups else 0
+        lines.append("=== Response cache ===")
+        lines.append(f"Hits: {cached['hits']}   Misses: {cached['misses']}   "
+                     f"Collapsed: {cached['collapsed']}   Hit rate: {hit_rate:.0f}%")
+        lines.append(f"Entries: {cached['entries']}   Invalidations: {cached['invalidations']}")
+        for verb, counters in sorted(cached['verbs'].items()):
+            lines.append(f"  {verb:<12} hits {counters['hits']:<5} misses {counters['misses']:<5} "
+                         f"collapsed {counters['collapsed']:<4} invalidated {counters['invalidations']}")
+        lines.append("")
+        
+        latency = session.latency_stats()
+        lines.append("=== Command latency (ms) ===")
+        if not latency:
+            lines.append("No commands timed yet.")
+        else:
+            lines.append(f"  {'command':<16} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'timeout':>9}")
+            for verb, summary in sorted(latency.items()):
+                lines.append(f"  {verb or '(blank)':<16} {summary['count']:>6} "
+                             f"{summary['p50'] * 1000:>8.1f} {summary['p95'] * 1000:>8.1f} "
+                             f"{summary['p99'] * 1000:>8.1f} {summary['timeout']:>8.1f}s")
+            for verb, summary in sorted(latency.items()):
+                lines.append("")
+                lines.append(f"  {verb or '(blank)'} (last {summary['samples']}):")
+                peak = max(count for _, count in summary['histogram']) or 1
+                for bound, count in summary['histogram']:
+                    if not count:
+                        continue
+                    label = f"<= {bound * 1000:g}" if bound is not None else f"> {LatencyTracker.BUCKETS[-1] * 1000:g}"
+                    bar = "█" * max(1, round(count / peak * 30))
+                    lines.append(f"    {label:>10} ms {bar} {count}")
+        return "\n".join(lines) + "\n"
+    
     def apply_dialog_theme(self, dialog):
         """Apply current theme to a dialog window"""
         theme = self.current_theme.get()
@@ -866,6 +890,11 @@ Created with ❤️ for the PZ community
         self.notebook.add(self.info_frame, text="ℹ️  Server Info")
         self.create_info_tab()
         
+        # Fleet Tab (every configured server at a glance)
+        self.fleet_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.fleet_frame, text="🗄️ Fleet")
+        self.create_fleet_tab()
+        
         # Players Tab
         self.players_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.players_frame, text="👥 Players")
@@ -886,11 +915,21 @@ Created with ❤️ for the PZ community
         self.notebook.add(self.logs_frame, text="📜 Logs")
         self.create_logs_tab()
         
+        # Log Search Tab (every current and archived log)
+        self.log_search_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.log_search_frame, text="🔎 Log Search")
+        self.create_log_search_tab()
+        
         # Ban List Tab
         self.banlist_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.banlist_frame, text="🚫 Ban List")
         self.create_banlist_tab()
         
+        # Database Tab (players.db browser)
+        self.database_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.database_frame, text="🗃️ Database")
+        self.create_database_tab()
+        
         # Scheduler Tab
         self.scheduler_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.scheduler_frame, text="⏰ Scheduler")
@@ -1050,12 +1089,14 @@ Created with ❤️ for the PZ community
         ttk.Label(top_row, text="Username:").pack(side=tk.LEFT, padx=(0, 5))
         self.player_username_entry = ttk.Entry(top_row, width=25)
         self.player_username_entry.pack(side=tk.LEFT, padx=(0, 10))
+        NameCompleter(self.player_username_entry, self.player_names)
         
-        ttk.Label(top_row, text="(select from list or type)", 
+        ttk.Label(top_row, text="(select from list or type; Ctrl/Shift-click to kick, ban or set access for several)", 
                   font=('TkDefaultFont', 8)).pack(side=tk.LEFT, padx=(0, 20))
         
         ttk.Button(top_row, text="🔄 Refresh Players", command=self.refresh_players,
                   style='Accent.TButton').pack(side=tk.RIGHT)
+        ttk.Button(top_row, text="📜 Session History", command=self.show_player_sessions).pack(side=tk.RIGHT, padx=5)
         
         # Button row
         btn_row = ttk.Frame(actions_frame)
@@ -1085,6 +1126,194 @@ Created with ❤️ for the PZ community
         ttk.Button(btn_row, text="✨ God Mode", command=lambda: self.player_action('godmode'),
                   style='Accent.TButton', width=12).pack(side=tk.LEFT, padx=2)
     
+    def _player_session_db(self):
+        """Session history for the current server's log directory, or None without logs"""
+        server_path = self.server_path.get()
+        log_dir = self.path_cache.find_one(server_path, 'logs') if server_path and os.path.isdir(server_path) else None
+        if log_dir is None:
+            return None
+        if self._session_db is None or self._session_db.log_dir != log_dir:
+            if self._session_db is not None:
+                self._session_db.close()
+            self._session_db = PlayerSessionDB(self.SESSION_DB_FILE, log_dir)
+        return self._session_db
+    
+    def _poll_player_sessions(self):
+        """Read new connect/disconnect lines in the background, then reschedule"""
+        try:
+            db = self._player_session_db()
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("Session history unavailable: %s", e)
+            db = None
+        if db is not None:
+            future = self._fleet_executor.submit(db.sync)
+            self._deliver_to_ui(future, None,
+                                lambda e: logger.debug("Session history sync failed: %s", e))
+        self.after(self.SESSION_POLL_INTERVAL * 1000, self._poll_player_sessions)
+    
+    def show_player_sessions(self):
+        """Browse player sessions recorded from the server's user log"""
+        try:
+            db = self._player_session_db()
+        except (OSError, sqlite3.Error) as e:
+            messagebox.showerror("Error", f"Failed to open session history: {e}")
+            return
+        if db is None:
+            messagebox.showwarning("No Server Path", "Please set the server path to view session history")
+            return
+        
+        dialog = tk.Toplevel(self)
+        dialog.title("Player Session History")
+        dialog.geometry("820x540")
+        dialog.transient(self)
+        self.apply_dialog_theme(dialog)
+        
+        query_frame = ttk.Frame(dialog, padding=10)
+        query_frame.pack(fill=tk.X)
+        at_var = tk.StringVar(value=datetime.now().strftime('%Y-%m-%d %H:%M'))
+        range_var = tk.StringVar(value='7 days')
+        player_var = tk.StringVar(value=self.player_username_entry.get())
+        
+        ttk.Label(query_frame, text="Online at:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(query_frame, textvariable=at_var, width=18).grid(row=0, column=1, padx=5)
+        ttk.Button(query_frame, text="Show", command=lambda: online_at()).grid(row=0, column=2)
+        ttk.Label(query_frame, text="Top playtime:").grid(row=0, column=3, sticky=tk.W, padx=(20, 0))
+        ttk.Combobox(query_frame, textvariable=range_var, values=('24 hours', '7 days', '30 days'),
+                     state='readonly', width=10).grid(row=0, column=4, padx=5)
+        ttk.Button(query_frame, text="Show", command=lambda: top_playtime()).grid(row=0, column=5)
+        ttk.Label(query_frame, text="Player:").grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        ttk.Entry(query_frame, textvariable=player_var, width=18).grid(row=1, column=1, padx=5, pady=(5, 0))
+        ttk.Button(query_frame, text="Show", command=lambda: player_history()).grid(row=1, column=2, pady=(5, 0))
+        
+        tree_frame = ttk.Frame(dialog)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        tree = ttk.Treeview(tree_frame, show='headings')
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        status_label = ttk.Label(dialog, text="")
+        status_label.pack(anchor=tk.W, padx=10, pady=5)
+        
+        def fmt_time(ts):
+            return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M') if ts else 'online'
+        
+        def fmt_duration(seconds):
+            hours, rem = divmod(int(seconds), 3600)
+            return f"{hours}h {rem // 60:02d}m"
+        
+        def session_row(s):
+            end = s['left'] or time.time()
+            position = f"{s['x']:.0f}, {s['y']:.0f}, {s['z']:.0f}" if s['x'] is not None else ''
+            return (s['username'], s['steamid'] or '', fmt_time(s['joined']), fmt_time(s['left']),
+                    fmt_duration(end - s['joined']), position)
+        
+        session_columns = ('Player', 'SteamID', 'Joined', 'Left', 'Duration', 'Position at Join')
+        
+        def show_rows(columns, rows, summary):
+            try:
+                tree.delete(*tree.get_children())
+                tree['columns'] = columns
+                for column in columns:
+                    tree.heading(column, text=column)
+                    tree.column(column, width=130)
+                for row in rows:
+                    tree.insert('', tk.END, values=row)
+                status_label.config(text=summary)
+            except tk.TclError:
+                pass  # Dialog closed while the query ran
+        
+        def run_query(fn, on_rows):
+            status_label.config(text="Loading...")
+            future = self._fleet_executor.submit(fn)
+            self._deliver_to_ui(future, on_rows,
+                                lambda e: status_label.config(text=f"Query failed: {e}"))
+        
+        def online_at():
+            try:
+                when = datetime.strptime(at_var.get().strip(), '%Y-%m-%d %H:%M').timestamp()
+            except ValueError:
+                messagebox.showerror("Invalid Time", "Use the format YYYY-MM-DD HH:MM", parent=dialog)
+                return
+            run_query(lambda: db.online_at(when), lambda sessions: show_rows(
+                session_columns, [session_row(s) for s in sessions],
+                f"{len(sessions)} players online at {at_var.get().strip()}"))
+        
+        def top_playtime():
+            hours = {'24 hours': 24, '7 days': 24 * 7, '30 days': 24 * 30}[range_var.get()]
+            since = time.time() - hours * 3600
+            run_query(lambda: db.top_playtime(since, limit=50), lambda rows: show_rows(
+                ('Player', 'Playtime', 'Sessions'),
+                [(r['username'], fmt_duration(r['seconds']), r['sessions']) for r in rows],
+                f"Top playtime, last {range_var.get()}"))
+        
+        def player_history():
+            username = player_var.get().strip()
+            if not username:
+                return
+            run_query(lambda: db.player_sessions(username, limit=200), lambda sessions: show_rows(
+                session_columns, [session_row(s) for s in sessions],
+                f"{len(sessions)} most recent sessions for {username}"))
+        
+        def backfill():
+            def done(count):
+                stats = db.stats()
+                status_label.config(text=f"Backfill added {count} events "
+                                         f"({stats['sessions']} sessions, {stats['events']} events stored)")
+            status_label.config(text="Reading historical logs...")
+            future = self._fleet_executor.submit(db.backfill)
+            self._deliver_to_ui(future, done, lambda e: status_label.config(text=f"Backfill failed: {e}"))
+        
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(btn_frame, text="⏬ Backfill From Old Logs", command=backfill).pack(side=tk.LEFT, padx=5)
+        ttk.Label(btn_frame, text=f"Logs: {db.log_dir}", foreground='gray').pack(side=tk.LEFT, padx=10)
+        ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        
+        # Start with who is online now (after catching up on the live log)
+        run_query(lambda: (db.sync(), db.online_now())[1], lambda sessions: show_rows(
+            session_columns, [session_row(s) for s in sessions], f"{len(sessions)} players online now"))
+    
+    def load_player_names(self):
+        """Add known players from players.db and the session history to the completion index"""
+        server_path = self.server_path.get()
+        if not server_path or not os.path.isdir(server_path):
+            return
+        try:
+            sessions = self._player_session_db()
+        except (OSError, sqlite3.Error):
+            sessions = None
+        
+        def collect():
+            names = []
+            db_path = self.path_cache.find_one(server_path, 'players_db')
+            if db_path:
+                names.extend(self._players_db_usernames(db_path))
+            if sessions is not None:
+                names.extend(sessions.usernames())
+            return names
+        
+        def done(names):
+            added = self.player_names.add_many(names)
+            logger.info("Player name index: %d names (%d new)", len(self.player_names), added)
+        
+        future = self._fleet_executor.submit(collect)
+        self._deliver_to_ui(future, done, lambda e: logger.debug("Failed to load player names: %s", e))
+    
+    @staticmethod
+    def _players_db_usernames(db_path):
+        """Usernames stored in the server's players.db (opened read-only)"""
+        conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro&immutable=1", uri=True)
+        try:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(networkPlayers)")]
+            if 'username' not in columns:
+                return []
+            return [row[0] for row in conn.execute("SELECT DISTINCT username FROM networkPlayers")
+                    if row[0]]
+        finally:
+            conn.close()
+    
     def on_player_select(self, event):
         """Auto-fill username when player selected from list"""
         selection = self.players_tree.selection()
@@ -1233,11 +1462,101 @@ Created with ❤️ for the PZ community
         ttk.Checkbutton(btn_frame, text="Live Stream", 
                        variable=self.live_logs_var,
                        command=self.toggle_live_logs).pack(side=tk.LEFT, padx=20)
+        # Follow every current log merged by time, or just the newest file
+        self.live_merge_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(btn_frame, text="All logs merged",
+                       variable=self.live_merge_var).pack(side=tk.LEFT, padx=5)
+        
+        # Categories shown in the merged live view, each in its own colour
+        live_frame = ttk.Frame(self.logs_frame)
+        live_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+        ttk.Label(live_frame, text="Live categories:").pack(side=tk.LEFT, padx=5)
+        self.live_category_vars = {}
+        for key, color in self.LIVE_LOG_COLORS.items():
+            self.logs_text.tag_config(f'live_{key}', foreground=color)
+            ttk.Label(live_frame, text="■", foreground=color).pack(side=tk.LEFT, padx=(8, 0))
+            var = tk.BooleanVar(value=True)
+            ttk.Checkbutton(live_frame, text=key, variable=var,
+                           command=self._refilter_live_logs).pack(side=tk.LEFT)
+            self.live_category_vars[key] = var
+        
+        # Time range across all logs, read through the per-file timestamp index
+        range_frame = ttk.Frame(self.logs_frame)
+        range_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+        ttk.Label(range_frame, text="From:").pack(side=tk.LEFT, padx=5)
+        self.log_range_from = ttk.Entry(range_frame, width=16)
+        self.log_range_from.insert(0, (datetime.now() - timedelta(hours=1)).strftime('%d-%m-%y %H:%M'))
+        self.log_range_from.pack(side=tk.LEFT, padx=5)
+        ttk.Label(range_frame, text="To:").pack(side=tk.LEFT, padx=5)
+        self.log_range_to = ttk.Entry(range_frame, width=16)
+        self.log_range_to.pack(side=tk.LEFT, padx=5)
+        ttk.Button(range_frame, text="🕒 Show Range", command=self.show_log_range).pack(side=tk.LEFT, padx=5)
+        ttk.Label(range_frame, text="dd-mm-yy HH:MM[:SS], blank = no limit",
+                 foreground='gray').pack(side=tk.LEFT, padx=10)
+        
+        # Record filters applied by Show Range
+        filter_frame = ttk.Frame(self.logs_frame)
+        filter_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+        ttk.Label(filter_frame, text="Category:").pack(side=tk.LEFT, padx=5)
+        self.log_category_var = tk.StringVar(value='All')
+        ttk.Combobox(filter_frame, textvariable=self.log_category_var, values=('All',) + LOG_CATEGORIES,
+                     state='readonly', width=10).pack(side=tk.LEFT, padx=5)
+        ttk.Label(filter_frame, text="Player:").pack(side=tk.LEFT, padx=5)
+        self.log_player_var = tk.StringVar()
+        ttk.Entry(filter_frame, textvariable=self.log_player_var, width=18).pack(side=tk.LEFT, padx=5)
+        ttk.Label(filter_frame, text="Match (regex):").pack(side=tk.LEFT, padx=5)
+        self.log_pattern_var = tk.StringVar()
+        ttk.Entry(filter_frame, textvariable=self.log_pattern_var, width=24).pack(side=tk.LEFT, padx=5)
+        ttk.Label(filter_frame, text="username or SteamID; match ignores case",
+                 foreground='gray').pack(side=tk.LEFT, padx=10)
         
         # Initialize live log tracking
         self.live_logs_active = False
         self.log_file_position = 0
         self.current_log_file = None
+        self.log_tailer = None  # LogTailer following current_log_file, or MultiLogTailer
+        self.live_log_entries = deque(maxlen=1000)  # (category, text) shown by the merged view
+        self._live_log_header = ''
+    
+    def create_log_search_tab(self):
+        """Create the full-text search tab over current and archived logs"""
+        query_frame = ttk.Frame(self.log_search_frame)
+        query_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(query_frame, text="Search:").pack(side=tk.LEFT, padx=5)
+        self.log_search_var = tk.StringVar()
+        query_entry = ttk.Entry(query_frame, textvariable=self.log_search_var, width=40)
+        query_entry.pack(side=tk.LEFT, padx=5)
+        query_entry.bind('<Return>', lambda e: self.start_log_search())
+        self.log_search_regex_var = tk.BooleanVar()
+        ttk.Checkbutton(query_frame, text="Regex", variable=self.log_search_regex_var).pack(side=tk.LEFT, padx=5)
+        self.log_search_case_var = tk.BooleanVar()
+        ttk.Checkbutton(query_frame, text="Match case", variable=self.log_search_case_var).pack(side=tk.LEFT, padx=5)
+        ttk.Label(query_frame, text="Context lines:").pack(side=tk.LEFT, padx=(15, 5))
+        self.log_search_context_var = tk.StringVar(value='0')
+        ttk.Spinbox(query_frame, from_=0, to=10, textvariable=self.log_search_context_var, width=4).pack(side=tk.LEFT)
+        ttk.Button(query_frame, text="🔎 Search", command=self.start_log_search).pack(side=tk.LEFT, padx=(15, 5))
+        ttk.Button(query_frame, text="⏹ Stop", command=self.stop_log_search).pack(side=tk.LEFT, padx=5)
+        
+        self.log_search_status = ttk.Label(self.log_search_frame, foreground='gray',
+            text="Searches every log in the server's Logs folder, including archived sessions (logs_<date>)")
+        self.log_search_status.pack(fill=tk.X, padx=10)
+        
+        results_frame = ttk.Frame(self.log_search_frame)
+        results_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        colors = self.get_text_colors()
+        self.log_search_text = scrolledtext.ScrolledText(results_frame, wrap=tk.WORD, **colors)
+        self.log_search_text.pack(fill=tk.BOTH, expand=True)
+        self.log_search_text.tag_config('file', foreground='#4a90d9', font=('TkDefaultFont', 9, 'bold'))
+        self.log_search_text.tag_config('context', foreground='#909090')
+        self.log_search_text.tag_config('hit', background='#ffa500', foreground='#000000')
+        # A search still running when the window closes is stopped
+        self.log_search_text.bind('<Destroy>', lambda e: self.stop_log_search())
+        
+        self._log_search_stop = None      # Event that stops the running search
+        self._log_search_pending = []     # matches found, not yet shown
+        self._log_search_shown = (None, 0)  # (last file shown, matches shown)
+        self._log_search_lock = threading.Lock()
     
     def create_banlist_tab(self):
         """Create the ban list manager tab"""
@@ -1278,8 +1597,158 @@ Created with ❤️ for the PZ community
         ttk.Label(actions_frame, text="Username:").pack(side=tk.LEFT, padx=(20, 5))
         self.unban_username_entry = ttk.Entry(actions_frame, width=20)
         self.unban_username_entry.pack(side=tk.LEFT, padx=5)
+        NameCompleter(self.unban_username_entry, self.player_names)
         ttk.Button(actions_frame, text="Unban", command=self.unban_manual).pack(side=tk.LEFT, padx=5)
     
+    def create_database_tab(self):
+        """Create the players.db browser tab"""
+        filter_frame = ttk.Frame(self.database_frame)
+        filter_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(filter_frame, text="Table:").pack(side=tk.LEFT, padx=(0, 5))
+        self.db_table_var = tk.StringVar()
+        self.db_table_combo = ttk.Combobox(filter_frame, textvariable=self.db_table_var,
+                                           state='readonly', width=18)
+        self.db_table_combo.pack(side=tk.LEFT)
+        self.db_table_combo.bind('<<ComboboxSelected>>', lambda e: self.load_database_page())
+        
+        ttk.Label(filter_frame, text="Username:").pack(side=tk.LEFT, padx=(15, 5))
+        self.db_username_entry = ttk.Entry(filter_frame, width=16)
+        self.db_username_entry.pack(side=tk.LEFT)
+        self.db_username_entry.bind('<Return>', lambda e: self.load_database_page())
+        NameCompleter(self.db_username_entry, self.player_names)
+        
+        ttk.Label(filter_frame, text="Near X, Y:").pack(side=tk.LEFT, padx=(15, 5))
+        self.db_near_x_entry = ttk.Entry(filter_frame, width=7)
+        self.db_near_x_entry.pack(side=tk.LEFT)
+        self.db_near_y_entry = ttk.Entry(filter_frame, width=7)
+        self.db_near_y_entry.pack(side=tk.LEFT, padx=2)
+        ttk.Label(filter_frame, text="within").pack(side=tk.LEFT, padx=2)
+        self.db_near_radius_entry = ttk.Entry(filter_frame, width=5)
+        self.db_near_radius_entry.insert(0, "50")
+        self.db_near_radius_entry.pack(side=tk.LEFT)
+        
+        ttk.Button(filter_frame, text="🔍 Apply", command=self.load_database_page).pack(side=tk.LEFT, padx=10)
+        ttk.Button(filter_frame, text="🔄 Reload", command=self.open_players_database).pack(side=tk.LEFT)
+        
+        tree_frame = ttk.Frame(self.database_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5)
+        self.db_tree = ttk.Treeview(tree_frame, show='headings')
+        yscroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.db_tree.yview)
+        xscroll = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.db_tree.xview)
+        self.db_tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        yscroll.pack(side=tk.RIGHT, fill=tk.Y)
+        xscroll.pack(side=tk.BOTTOM, fill=tk.X)
+        self.db_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        nav_frame = ttk.Frame(self.database_frame)
+        nav_frame.pack(fill=tk.X, padx=5, pady=5)
+        self.db_prev_btn = ttk.Button(nav_frame, text="◀ Previous", state=tk.DISABLED,
+                                      command=lambda: self.load_database_page(before=self._db_page['prev']))
+        self.db_prev_btn.pack(side=tk.LEFT)
+        self.db_next_btn = ttk.Button(nav_frame, text="Next ▶", state=tk.DISABLED,
+                                      command=lambda: self.load_database_page(after=self._db_page['next']))
+        self.db_next_btn.pack(side=tk.LEFT, padx=5)
+        self.db_status_label = ttk.Label(nav_frame, text="Open the Database tab after setting the server path.",
+                                         foreground='gray')
+        self.db_status_label.pack(side=tk.LEFT, padx=10)
+        
+        self.players_db = None  # PlayersDB for the current server
+        self._db_page = {'prev': None, 'next': None}
+        self._db_total = 0
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_notebook_tab_changed, add='+')
+    
+    def _on_notebook_tab_changed(self, event=None):
+        """Open players.db the first time the Database tab is shown"""
+        if self.notebook.select() == str(self.database_frame) and self.players_db is None:
+            self.open_players_database()
+    
+    def open_players_database(self):
+        """(Re)open the current server's players.db and show its first page"""
+        server_path = self.server_path.get()
+        if not server_path or not os.path.isdir(server_path):
+            self.db_status_label.config(text="Set the server path to browse players.db")
+            return
+        self.db_status_label.config(text="Looking for players.db...")
+        
+        def find():
+            db_path = self.path_cache.find_one(server_path, 'players_db')
+            if db_path is None:
+                return None, []
+            db = PlayersDB(db_path)
+            return db, db.tables()
+        
+        def opened(result):
+            db, tables = result
+            if self.players_db is not None:
+                self.players_db.close()
+            self.players_db = db
+            if db is None:
+                self.db_status_label.config(text=f"No players.db found under {server_path}")
+                return
+            self.db_table_combo['values'] = tables
+            if self.db_table_var.get() not in tables:
+                self.db_table_var.set(tables[0] if tables else '')
+            self.load_database_page()
+        
+        future = self._fleet_executor.submit(find)
+        self._deliver_to_ui(future, opened,
+                            lambda e: self.db_status_label.config(text=f"Failed to open players.db: {e}"))
+    
+    def load_database_page(self, after=None, before=None):
+        """Fetch one page of the selected table in the background"""
+        db = self.players_db
+        table = self.db_table_var.get()
+        if db is None or not table:
+            return
+        
+        username = self.db_username_entry.get().strip() or None
+        near = None
+        if self.db_near_x_entry.get().strip() or self.db_near_y_entry.get().strip():
+            try:
+                near = (float(self.db_near_x_entry.get()), float(self.db_near_y_entry.get()),
+                        float(self.db_near_radius_entry.get() or 50))
+            except ValueError:
+                messagebox.showerror("Invalid Position", "X, Y and radius must be numbers")
+                return
+        
+        def fetch():
+            page = db.page(table, after=after, before=before, username=username, near=near)
+            # Count once per filter change, not on every page turn
+            if after is None and before is None:
+                page['total'] = db.count(table, username=username, near=near)
+            return page
+        
+        self.db_status_label.config(text="Loading...")
+        future = self._fleet_executor.submit(fetch)
+        self._deliver_to_ui(future, self._show_database_page,
+                            lambda e: self.db_status_label.config(text=f"Query failed: {e}"))
+    
+    def _show_database_page(self, page):
+        """Fill the database grid with one page of rows"""
+        tree = self.db_tree
+        tree.delete(*tree.get_children())
+        if list(tree['columns']) != page['columns']:
+            tree['columns'] = page['columns']
+            for column in page['columns']:
+                tree.heading(column, text=column)
+                tree.column(column, width=70 if column in ('rowid', 'id', 'x', 'y', 'z') else 130,
+                            stretch=False)
+        for row in page['rows']:
+            tree.insert('', tk.END, values=['' if v is None else v for v in row])
+        
+        if 'total' in page:
+            self._db_total = page['total']
+        self._db_page = page
+        self.db_prev_btn.config(state=tk.NORMAL if page['prev'] is not None else tk.DISABLED)
+        self.db_next_btn.config(state=tk.NORMAL if page['next'] is not None else tk.DISABLED)
+        if page['rows']:
+            self.db_status_label.config(
+                text=f"rowid {page['rows'][0][0]}–{page['rows'][-1][0]} of {self._db_total} matching rows "
+                     f"(read-only; BLOB columns show their size)")
+        else:
+            self.db_status_label.config(text="No matching rows")
+    
     def create_scheduler_tab(self):
         """Create the scheduler tab for automated tasks"""
         # Scheduled tasks list
@@ -1324,6 +1793,459 @@ Created with ❤️ for the PZ community
         # Load saved tasks
         self.load_scheduled_tasks()
         
+    def create_fleet_tab(self):
+        """Create the fleet tab listing every configured server"""
+        columns = ('address', 'status', 'players', 'latency', 'last_log', 'restart')
+        tree_frame = ttk.Frame(self.fleet_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.fleet_tree = ttk.Treeview(tree_frame, columns=columns, selectmode='extended')
+        self.fleet_tree.heading('#0', text='Server')
+        self.fleet_tree.column('#0', width=180)
+        for column, heading, width in (('address', 'Address', 170), ('status', 'Status', 150),
+                                       ('players', 'Players', 70), ('latency', 'Latency', 80),
+                                       ('last_log', 'Last Log Activity', 140),
+                                       ('restart', 'Restart', 110)):
+            self.fleet_tree.heading(column, text=heading)
+            self.fleet_tree.column(column, width=width)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.fleet_tree.yview)
+        self.fleet_tree.configure(yscrollcommand=scrollbar.set)
+        self.fleet_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.fleet_tree.bind('<Double-1>', lambda e: self.activate_selected_server())
+        
+        btn_frame = ttk.Frame(self.fleet_frame)
+        btn_frame.pack(fill=tk.X, padx=5, pady=5)
+        ttk.Button(btn_frame, text="➕ Add", command=self.add_fleet_server).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="✏️ Edit", command=self.edit_fleet_server).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="🗑️ Remove", command=self.remove_fleet_server).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="⭐ Make Active", command=self.activate_selected_server,
+                   style='Accent.TButton').pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Button(btn_frame, text="🔗 Connect", command=self.connect_selected_servers).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="🔌 Disconnect", command=self.disconnect_selected_servers).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="🔗 Connect All", command=lambda: self.connect_fleet()).pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Button(btn_frame, text="🔄 Refresh All", command=self.refresh_fleet).pack(side=tk.LEFT, padx=2)
+        ttk.Button(btn_frame, text="📢 Broadcast / Command", command=self.show_fleet_broadcast,
+                   style='Warning.TButton').pack(side=tk.RIGHT, padx=2)
+        
+        ttk.Label(self.fleet_frame,
+                  text="The other tabs work on the active server (⭐). Passwords are never saved; "
+                       "set each server's password environment variable to connect on startup.",
+                  foreground='gray').pack(anchor=tk.W, padx=10, pady=(0, 5))
+    
+    def _build_rcon_connection(self, host, port, password):
+        """Connection factory for the fleet, paced with the configured rate limit"""
+        return build_connection(host, port, password,
+                                limiter=RCONRateLimiter(self.rcon_rate, self.rcon_burst))
+    
+    def _selected_fleet_servers(self):
+        """Names of the servers selected in the fleet grid"""
+        return [name for name in self.fleet_tree.selection() if self.fleet.get(name)]
+    
+    def refresh_fleet_grid(self):
+        """Redraw the fleet grid from the last refresh (no network I/O)"""
+        tree = self.fleet_tree
+        names = self.fleet.names()
+        for iid in tree.get_children():
+            if iid not in names:
+                tree.delete(iid)
+        
+        for index, name in enumerate(names):
+            server = self.fleet.get(name)
+            status = self._fleet_status.get(name, {})
+            if server['connection']:
+                state = "🔄 Reconnecting" if not getattr(server['connection'], 'connected', True) else "✅ Connected"
+            elif server['error']:
+                state = f"❌ {server['error']}"
+            elif server['password'] is None:
+                state = "🔑 No password"
+            else:
+                state = "⭕ Disconnected"
+            if status.get('error') and server['connection']:
+                state = f"⚠️ {status['error']}"
+            
+            latency = status.get('latency')
+            last_log = status.get('last_log')
+            values = (
+                f"{server['host']}:{server['port']}",
+                state,
+                status.get('players', '') if server['connection'] else '',
+                f"{latency * 1000:.0f} ms" if latency is not None else '',
+                datetime.fromtimestamp(last_log).strftime('%Y-%m-%d %H:%M') if last_log else '',
+                self._fleet_restart_text(name),
+            )
+            text = f"⭐ {name}" if name == self.active_server else name
+            if tree.exists(name):
+                tree.item(name, text=text, values=values)
+                tree.move(name, '', index)
+            else:
+                tree.insert('', index, iid=name, text=text, values=values)
+    
+    def _fleet_restart_text(self, name):
+        """Countdown shown in the fleet grid's Restart column for a server"""
+        if self.restart_countdown_active and self._restart_server == name:
+            mins, secs = divmod(self.restart_time_remaining, 60)
+            return f"⏰ {mins}:{secs:02d}"
+        return ""
+    
+    def _update_fleet_restart_cell(self):
+        """Update just the restarting server's countdown cell (runs every second)"""
+        name = self._restart_server
+        if name and self.fleet_tree.exists(name):
+            self.fleet_tree.set(name, 'restart', self._fleet_restart_text(name))
+    
+    def refresh_fleet(self):
+        """Poll every connected server concurrently and update the grid"""
+        if self._fleet_refresh_id:
+            self.after_cancel(self._fleet_refresh_id)
+            self._fleet_refresh_id = None
+        future = self._fleet_executor.submit(self.fleet.run_all, self._poll_fleet_server)
+        self._deliver_to_ui(future, self._show_fleet_status, self._show_fleet_status_error)
+    
+    def _poll_fleet_server(self, server):
+        """Collect one server's grid summary (runs on a fleet thread)"""
+        response = server['worker'].submit('players', priority=PRIORITY_BULK).result()
+        match = re.search(r'Players connected \((\d+)\)', response or '')
+        summary = {'players': int(match.group(1)) if match else 0, 'latency': None, 'last_log': None}
+        
+        stats = server['connection'].latency_stats().get('players')
+        if stats and stats['count']:
+            summary['latency'] = stats['p50']
+        
+        server_path = server['info'].get('server_path')
+        log_dir = self.path_cache.find_one(server_path, 'logs') if server_path else None
+        if log_dir:
+            mtimes = [entry.stat().st_mtime for entry in os.scandir(log_dir) if entry.is_file()]
+            summary['last_log'] = max(mtimes, default=None)
+        return summary
+    
+    def _show_fleet_status(self, outcome):
+        """Store a fleet refresh, redraw and schedule the next one (Tk thread)"""
+        for name, result in outcome.items():
+            status = result['result'] or {}
+            status['error'] = result['error']
+            self._fleet_status[name] = status
+        self.refresh_fleet_grid()
+        if self.fleet.connected_names():
+            self._fleet_refresh_id = self.after(self.FLEET_REFRESH_INTERVAL * 1000, self.refresh_fleet)
+    
+    def _show_fleet_status_error(self, error):
+        """Log a failed fleet refresh and keep polling"""
+        logger.error("Fleet refresh failed: %s", error)
+        self._show_fleet_status({})
+    
+    def connect_fleet(self, names=None):
+        """Connect servers concurrently in the background.
+        
+        Args:
+            names: Servers to connect (default: every disconnected server
+                whose password is known)
+        """
+        if names is None:
+            names = [name for name in self.fleet.names()
+                     if self.fleet.get(name)['password'] is not None
+                     and not self.fleet.get(name)['connection']]
+        if not names:
+            return
+        
+        def done(errors):
+            for name, error in errors.items():
+                if error:
+                    logger.warning("Fleet server '%s' failed to connect: %s", name, error)
+                    self.log_command_output(f"❌ {name}: {error}")
+            if self.active_server in errors and not errors[self.active_server]:
+                self.set_active_server(self.active_server)
+            self.refresh_fleet()
+        
+        future = self._fleet_executor.submit(self.fleet.connect_all, names)
+        self._deliver_to_ui(future, done, self._show_fleet_status_error)
+    
+    def connect_selected_servers(self):
+        """Connect the selected servers, asking for any missing passwords"""
+        names = self._selected_fleet_servers()
+        if not names:
+            messagebox.showwarning("No Selection", "Please select one or more servers")
+            return
+        for name in names:
+            server = self.fleet.get(name)
+            if server['password'] is None:
+                password = simpledialog.askstring("RCON Password", f"RCON password for {name}:",
+                                                  show='*', parent=self)
+                if password is None:
+                    return
+                self.fleet.add(name, server['host'], server['port'], password)
+        self.connect_fleet(names)
+    
+    def disconnect_selected_servers(self):
+        """Disconnect the selected servers"""
+        for name in self._selected_fleet_servers():
+            self.fleet.disconnect(name)
+            if name == self.active_server:
+                self.set_active_server(name)
+        self.refresh_fleet_grid()
+    
+    def activate_selected_server(self):
+        """Make the selected server the one the other tabs work on"""
+        names = self._selected_fleet_servers()
+        if names:
+            self.set_active_server(names[0])
+    
+    def set_active_server(self, name):
+        """Point the connection bar and every tab at a fleet server.
+        
+        Args:
+            name: Fleet server name
+        """
+        server = self.fleet.get(name)
+        if server is None:
+            return
+        
+        # Keep the outgoing server's local settings
+        previous = self.fleet.get(self.active_server) if self.active_server else None
+        if previous is not None and previous is not server:
+            previous['info'].update(server_path=self.server_path.get(), pz_version=self.pz_version.get())
+        
+        self._stop_connection_watch()
+        self.active_server = name
+        self.rcon = server['connection']
+        self.rcon_worker = server['worker']
+        
+        self.host_entry.delete(0, tk.END)
+        self.host_entry.insert(0, server['host'])
+        self.port_entry.delete(0, tk.END)
+        self.port_entry.insert(0, str(server['port']))
+        self.password_entry.delete(0, tk.END)
+        self.password_entry.insert(0, server['password'] or '')
+        self.server_path.set(server['info'].get('server_path', ''))
+        self.pz_version.set(server['info'].get('pz_version', 'build42'))
+        self.title(f"{self._base_title} - {name}")
+        
+        if self.players_db is not None:
+            self.players_db.close()
+            self.players_db = None
+            self._on_notebook_tab_changed()
+        
+        if self.rcon:
+            self._start_connection_watch()
+        self.update_ui_state()
+        self.refresh_fleet_grid()
+        if self._ensure_connected(show_warning=False):
+            self.refresh_all()
+        logger.info("Active server is now '%s'", name)
+    
+    def show_fleet_broadcast(self):
+        """Send one message or command to several fleet servers at once"""
+        connected = self.fleet.connected_names()
+        if not connected:
+            messagebox.showwarning("Not Connected", "Connect to at least one fleet server first")
+            return
+        
+        dialog = tk.Toplevel(self)
+        dialog.title("Broadcast to Servers")
+        dialog.geometry("620x520")
+        dialog.transient(self)
+        self.apply_dialog_theme(dialog)
+        
+        top = ttk.Frame(dialog, padding=10)
+        top.pack(fill=tk.X)
+        servers_frame = ttk.LabelFrame(top, text="Servers", padding=5)
+        servers_frame.pack(side=tk.LEFT, fill=tk.Y)
+        server_list = tk.Listbox(servers_frame, selectmode=tk.MULTIPLE, height=8, exportselection=False)
+        server_list.pack(fill=tk.BOTH, expand=True)
+        selected = set(self._selected_fleet_servers()) & set(connected) or set(connected)
+        for index, name in enumerate(connected):
+            server_list.insert(tk.END, name)
+            if name in selected:
+                server_list.selection_set(index)
+        
+        form = ttk.Frame(top, padding=(10, 0))
+        form.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        mode_var = tk.StringVar(value='message')
+        urgent_var = tk.BooleanVar(value=True)
+        ttk.Radiobutton(form, text="Server message", variable=mode_var, value='message',
+                        command=lambda: urgent_var.set(True)).pack(anchor=tk.W)
+        ttk.Radiobutton(form, text="RCON command", variable=mode_var, value='command',
+                        command=lambda: urgent_var.set(False)).pack(anchor=tk.W)
+        entry = ttk.Entry(form)
+        entry.pack(fill=tk.X, pady=5)
+        entry.focus_set()
+        ttk.Checkbutton(form, text="Urgent (jump queued commands, as restart warnings do)",
+                        variable=urgent_var).pack(anchor=tk.W)
+        
+        report_text = scrolledtext.ScrolledText(dialog, wrap=tk.NONE, height=12, font=('Courier', 9))
+        report_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        def show_report(command, report):
+            text = self._format_fleet_report(command, report)
+            self.log_command_output(text)
+            try:
+                report_text.delete(1.0, tk.END)
+                report_text.insert(tk.END, text)
+                send_btn.config(state=tk.NORMAL)
+            except tk.TclError:
+                pass  # Dialog closed while waiting
+        
+        def send():
+            names = [server_list.get(i) for i in server_list.curselection()]
+            text = entry.get().strip()
+            if not names or not text:
+                messagebox.showwarning("Missing Info", "Select servers and enter a message or command",
+                                       parent=dialog)
+                return
+            if mode_var.get() == 'message':
+                command = f'servermsg "{text.replace(" ", "_")}"'
+            else:
+                command = text
+            priority = PRIORITY_URGENT if urgent_var.get() else PRIORITY_INTERACTIVE
+            
+            send_btn.config(state=tk.DISABLED)
+            report_text.delete(1.0, tk.END)
+            report_text.insert(tk.END, f"Sending to {len(names)} servers...\n")
+            future = self._fleet_executor.submit(self.fleet.execute_all, command, names, priority)
+            self._deliver_to_ui(future, lambda report: show_report(command, report),
+                                lambda e: show_report(command, {name: {'result': None, 'error': str(e),
+                                                                       'elapsed': 0.0} for name in names}))
+        
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        send_btn = ttk.Button(btn_frame, text="📢 Send", command=send, style='Accent.TButton')
+        send_btn.pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Close", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        entry.bind('<Return>', lambda e: send())
+    
+    @staticmethod
+    def _format_fleet_report(command, report):
+        """Per-server outcome and latency table for a fan-out command"""
+        ok = {name: r for name, r in report.items() if not r['error']}
+        lines = [f"Fleet command: {command}",
+                 f"{len(ok)}/{len(report)} servers OK"]
+        if ok:
+            times = [r['elapsed'] for r in ok.values()]
+            lines[-1] += (f", all replies within {max(times) * 1000:.0f} ms "
+                          f"(spread {(max(times) - min(times)) * 1000:.0f} ms)")
+        width = max([len(name) for name in report] + [6])
+        lines.append("")
+        lines.append(f"{'Server':<{width}}  {'Status':<6}  {'Latency':>8}  Response")
+        for name, r in report.items():
+            if r['error']:
+                status, detail = "FAIL", r['error']
+            else:
+                status, detail = "OK", (r['result'] or '').strip().replace('\n', ' | ')
+            latency = f"{r['elapsed'] * 1000:.0f} ms" if not r['error'] else "-"
+            lines.append(f"{name:<{width}}  {status:<6}  {latency:>8}  {detail[:80]}")
+        return "\n".join(lines)
+    
+    def add_fleet_server(self):
+        """Add a server to the fleet"""
+        self._fleet_server_dialog()
+    
+    def edit_fleet_server(self):
+        """Edit the selected fleet server"""
+        names = self._selected_fleet_servers()
+        if not names:
+            messagebox.showwarning("No Selection", "Please select a server to edit")
+            return
+        self._fleet_server_dialog(names[0])
+    
+    def remove_fleet_server(self):
+        """Remove the selected servers from the fleet"""
+        names = self._selected_fleet_servers()
+        if not names:
+            messagebox.showwarning("No Selection", "Please select one or more servers")
+            return
+        if not messagebox.askyesno("Remove Servers", f"Remove {', '.join(names)} from the fleet?"):
+            return
+        for name in names:
+            self.fleet.remove(name)
+            self._fleet_status.pop(name, None)
+            if name == self.active_server:
+                self._stop_connection_watch()
+                self.active_server = None
+                self.rcon = None
+                self.rcon_worker = None
+                self.title(self._base_title)
+                self.update_ui_state()
+        self.refresh_fleet_grid()
+    
+    def _fleet_server_dialog(self, name=None):
+        """Add/edit dialog for one fleet server"""
+        from tkinter import filedialog
+        server = self.fleet.get(name) if name else None
+        info = server['info'] if server else {}
+        
+        dialog = tk.Toplevel(self)
+        dialog.title("Edit Server" if server else "Add Server")
+        dialog.geometry("480x300")
+        dialog.transient(self)
+        self.apply_dialog_theme(dialog)
+        
+        form = ttk.Frame(dialog, padding=15)
+        form.pack(fill=tk.BOTH, expand=True)
+        form.columnconfigure(1, weight=1)
+        
+        fields = {}
+        for row, (key, label, value) in enumerate((
+                ('name', "Name:", name or ''),
+                ('host', "Host:", server['host'] if server else 'localhost'),
+                ('port', "RCON Port:", str(server['port']) if server else '27015'),
+                ('password', "Password:", (server['password'] or '') if server else ''),
+                ('password_env', "Password env var:", info.get('password_env', '')),
+                ('server_path', "Server Path:", info.get('server_path', '')),
+                ('pz_version', "PZ Build:", info.get('pz_version', 'build42')))):
+            ttk.Label(form, text=label).grid(row=row, column=0, sticky=tk.W, pady=3)
+            var = tk.StringVar(value=value)
+            if key == 'pz_version':
+                entry = ttk.Combobox(form, textvariable=var, values=('build41', 'build42'),
+                                     state='readonly', width=12)
+                entry.grid(row=row, column=1, sticky=tk.W, padx=5)
+            else:
+                entry = ttk.Entry(form, textvariable=var, show='*' if key == 'password' else '')
+                entry.grid(row=row, column=1, sticky=tk.EW, padx=5)
+            if key == 'name' and server:
+                entry.config(state='readonly')
+            if key == 'server_path':
+                ttk.Button(form, text="Browse", command=lambda v=var: v.set(
+                    filedialog.askdirectory(parent=dialog) or v.get())).grid(row=row, column=2)
+            fields[key] = var
+        
+        def save():
+            new_name = fields['name'].get().strip()
+            host = fields['host'].get().strip()
+            try:
+                port = int(fields['port'].get().strip())
+            except ValueError:
+                messagebox.showerror("Invalid Port", "Port must be a number", parent=dialog)
+                return
+            if not new_name or not host:
+                messagebox.showwarning("Missing Info", "Please enter a name and host", parent=dialog)
+                return
+            if not server and self.fleet.get(new_name):
+                messagebox.showerror("Duplicate Name", f"A server named {new_name} already exists",
+                                     parent=dialog)
+                return
+            
+            password_env = fields['password_env'].get().strip() or self._fleet_password_env(new_name)
+            password = fields['password'].get() or os.environ.get(password_env)
+            self.fleet.add(new_name, host, port, password, password_env=password_env,
+                           server_path=fields['server_path'].get().strip(),
+                           pz_version=fields['pz_version'].get())
+            dialog.destroy()
+            if new_name == self.active_server:
+                self.set_active_server(new_name)
+            self.refresh_fleet_grid()
+        
+        btn_frame = ttk.Frame(dialog)
+        btn_frame.pack(fill=tk.X, padx=15, pady=(0, 15))
+        ttk.Label(btn_frame, text="Use Save Config to keep servers (not passwords).",
+                  foreground='gray').pack(side=tk.LEFT)
+        ttk.Button(btn_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Save", command=save).pack(side=tk.RIGHT, padx=5)
+    
+    @staticmethod
+    def _fleet_password_env(name):
+        """Default environment variable holding a fleet server's RCON password"""
+        return 'PZ_RCON_PASSWORD_' + re.sub(r'[^A-Z0-9]+', '_', name.upper()).strip('_')
+    
     def toggle_password_visibility(self):
         """Toggle password visibility"""
         if self.show_password_var.get():
@@ -1335,9 +2257,12 @@ Created with ❤️ for the PZ community
         """Connect to the RCON server"""
         # Check if already connected - if so, disconnect
         if self.rcon and getattr(self.rcon, 'authenticated', False):
-            self.rcon.disconnect()
+            self._stop_connection_watch()
+            self.fleet.disconnect(self.active_server)
             self.rcon = None
+            self.rcon_worker = None
             self.update_ui_state()
+            self.refresh_fleet_grid()
             return
         
         try:
@@ -1359,23 +2284,59 @@ Created with ❤️ for the PZ community
                 if not messagebox.askyesno("No Password", "RCON password is empty. Continue?"):
                     return
             
-            # Create RCON client and connect
-            self.rcon = RCONClient(host, port, password)
-            self.rcon.connect()
+            # The connection bar edits the active fleet server (registering
+            # it on first connect). Its connection is a pool of RCON sessions
+            # so slow commands, the scheduler and restart warnings don't
+            # serialise behind one socket, paced, kept alive across server
+            # restarts, and caching read-only replies
+            name = self.active_server or f"{host}:{port}"
+            self.fleet.add(name, host, port, password, server_path=self.server_path.get(),
+                           pz_version=self.pz_version.get())
+            self.active_server = name
+            self.title(f"{self._base_title} - {name}")
+        except Exception as e:
+            self._connect_failed(e)
+            return
+        
+        def connected(connection):
+            self.connect_btn.config(state='normal')
+            if self.active_server != name:
+                # Another server was picked while this one connected
+                self.refresh_fleet_grid()
+                return
+            self.rcon = connection
+            self.rcon_worker = self.fleet.get(name)['worker']
+            self._start_connection_watch()
+            self.refresh_fleet_grid()
             
             self.notify_success("Connected", "Connected to server successfully!\n\nConnection will remain open for commands.")
             
             # Update UI and auto-refresh
             self.update_ui_state()
             self.refresh_all()
-            
-        except Exception as e:
-            error_msg = str(e)
-            self.notify_error("Connection Error", error_msg)
-            self.rcon = None
-            self.update_ui_state()
-            logger.error("Connection failed: %s", error_msg)
-            
+        
+        # Connecting (DNS, TCP, auth, a full pool) can take seconds; keep
+        # the window responsive while it does
+        self.connect_btn.config(state='disabled')
+        self.status_label.config(text="🔄 Connecting...", foreground="orange")
+        future = self._fleet_executor.submit(self.fleet.connect, name)
+        self._deliver_to_ui(future, connected, lambda e: self._connect_failed(e, name))
+    
+    def _connect_failed(self, error, name=None):
+        """Report a failed connect from the connection bar (Tk thread)"""
+        self.connect_btn.config(state='normal')
+        if name is not None and self.active_server != name:
+            logger.error("Connection to '%s' failed: %s", name, error)
+            self.refresh_fleet_grid()
+            return
+        error_msg = str(error)
+        self.notify_error("Connection Error", error_msg)
+        self.rcon = None
+        self.rcon_worker = None
+        self.refresh_fleet_grid()
+        self.update_ui_state()
+        logger.error("Connection failed: %s", error_msg)
+        
     def _ensure_connected(self, show_warning=True):
         """Check if connected to RCON server.
         
@@ -1391,29 +2352,40 @@ Created with ❤️ for the PZ community
             logger.warning("Command attempted without connection")
         return is_connected
     
-    def _send_server_message(self, message, log_output=True):
+    def _send_server_message(self, message, log_output=True, on_result=None):
         """Send a message to all connected players via RCON.
         
         Handles formatting (space-to-underscore conversion) and error logging.
+        The message is sent by the background RCON worker.
         
         Args:
             message: Message text to send
             log_output: If True, log to command output
+            on_result: Called on the Tk thread with the server response, or
+                None if sending failed
             
         Returns:
-            str: Server response, or None if error
+            Future: The pending command, or None if not connected
         """
         if not self._ensure_connected(show_warning=False):
             logger.warning("Cannot send message - not connected: %s", message)
             return None
         
-        try:
-            safe_message = message.replace(' ', '_')
-            response = self.rcon.execute_command(f'servermsg "{safe_message}"')
+        def done(response):
             if log_output:
                 self.log_command_output(f"Broadcast: {message}\nResponse: {response}")
             logger.info("Server message sent: %s", message)
-            return response
+            if on_result:
+                on_result(response)
+        
+        def failed(e):
+            logger.error("Failed to send server message: %s - %s", message, e)
+            if on_result:
+                on_result(None)
+        
+        try:
+            safe_message = message.replace(' ', '_')
+            return self.run_rcon(f'servermsg "{safe_message}"', on_done=done, on_error=failed)
         except Exception as e:
             logger.error("Failed to send server message: %s - %s", message, e)
             return None
@@ -1427,7 +2399,11 @@ Created with ❤️ for the PZ community
         is_connected = self._ensure_connected(show_warning=False)
         
         # Update status label appearance with animation effect
-        if is_connected:
+        if is_connected and not getattr(self.rcon, 'connected', True):
+            self.status_label.config(text="🔄 Reconnecting...", foreground="orange", font=('TkDefaultFont', 10, 'bold'))
+            self.connect_btn.config(text="🔌 Disconnect", style='Danger.TButton')
+            logger.info("UI updated: Reconnecting state")
+        elif is_connected:
             self.status_label.config(text="✅ Connected", foreground="green", font=('TkDefaultFont', 10, 'bold'))
             self.connect_btn.config(text="🔌 Disconnect", style='Danger.TButton')
             logger.info("UI updated: Connected state")
@@ -1436,6 +2412,105 @@ Created with ❤️ for the PZ community
             self.connect_btn.config(text="🔗 Connect", style='Accent.TButton')
             logger.info("UI updated: Disconnected state")
     
+    def run_rcon(self, command, on_done=None, on_error=None, priority=PRIORITY_INTERACTIVE):
+        """Run an RCON command on the background worker without blocking Tk.
+        
+        Args:
+            command: RCON command to execute
+            on_done: Called on the Tk thread with the response
+            on_error: Called on the Tk thread with the exception; by default
+                the error is written to the command output
+            priority: PRIORITY_URGENT (restart warnings, kicks) uses the
+                worker's urgent lane and jumps the rate limiter queue;
+                PRIORITY_BULK (scheduled tasks) yields to everything else
+            
+        Returns:
+            Future: The pending command
+        """
+        future = self.rcon_worker.submit(command, priority=priority)
+        self._deliver_to_ui(future, on_done, on_error)
+        return future
+    
+    def run_in_background(self, fn, *args, on_done=None, on_error=None,
+                          priority=PRIORITY_INTERACTIVE):
+        """Run fn(*args) on the RCON worker; callbacks and priority as for run_rcon."""
+        future = self.rcon_worker.submit_call(fn, *args, priority=priority)
+        self._deliver_to_ui(future, on_done, on_error)
+        return future
+    
+    def call_in_ui(self, fn, *args):
+        """Queue fn(*args) to run on the Tk thread (safe to call from any thread)."""
+        self._ui_calls.put((fn, args))
+    
+    def _deliver_to_ui(self, future, on_done, on_error):
+        """Hand a future's outcome to the Tk thread once it resolves."""
+        future.add_done_callback(
+            lambda f: self.call_in_ui(self._complete_background_call, f, on_done, on_error))
+    
+    def _complete_background_call(self, future, on_done, on_error):
+        """Invoke the success or error callback for a finished future (Tk thread)."""
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            else:
+                self.log_command_output(f"Command error: {e}")
+                logger.error("Background RCON call failed: %s", e)
+            return
+        if on_done:
+            on_done(result)
+    
+    def _dispatch_ui_calls(self):
+        """Run callbacks queued by background threads.
+        
+        This is the only place results from the RCON worker re-enter Tk.
+        """
+        for _ in range(self.UI_DISPATCH_BATCH):
+            try:
+                fn, args = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("UI callback failed")
+        self.after(self.UI_DISPATCH_INTERVAL, self._dispatch_ui_calls)
+    
+    def _start_connection_watch(self):
+        """Start polling the RCON session so outages show up in the UI."""
+        self._stop_connection_watch()
+        self._rcon_was_connected = True
+        self._health_check_id = self.after(2000, self._watch_connection_health)
+    
+    def _stop_connection_watch(self):
+        """Cancel the connection health poll."""
+        if self._health_check_id:
+            self.after_cancel(self._health_check_id)
+            self._health_check_id = None
+    
+    def _watch_connection_health(self):
+        """Report lost and restored connections (the keepalive thread reconnects)."""
+        self._health_check_id = None
+        if not self.rcon or not self.rcon.authenticated:
+            return
+        
+        connected = self.rcon.connected
+        if connected != self._rcon_was_connected:
+            self._rcon_was_connected = connected
+            self.update_ui_state()
+            if connected:
+                stats = self.rcon.stats()
+                outage = stats['outages'][-1] if stats['outages'] else None
+                if outage:
+                    self.log_command_output(
+                        f"✅ Reconnected to server after {outage['duration']:.1f}s "
+                        f"({outage['attempts']} attempts, {stats['reconnects']} reconnects this session)")
+            else:
+                self.log_command_output("⚠️ Connection to server lost - reconnecting automatically")
+        
+        self._health_check_id = self.after(2000, self._watch_connection_health)
+    
     def notify_success(self, title, message):
         """Show a success notification with styled appearance.
         
@@ -1471,53 +2546,61 @@ Created with ❤️ for the PZ community
         if not self._ensure_connected():
             return
         
-        try:
-            # Clear existing items
-            for item in self.players_tree.get_children():
-                self.players_tree.delete(item)
-            
-            # Get players from RCON
-            response = self.rcon.execute_command('players')
-            
-            # Log the raw response for debugging
+        self.run_rcon('players', on_done=self._show_players, on_error=self._refresh_players_failed)
+    
+    def _refresh_players_failed(self, error):
+        """Report a failed players refresh."""
+        messagebox.showerror("Error", f"Failed to refresh players: {str(error)}")
+        self.log_command_output(f"Error refreshing players: {str(error)}")
+    
+    def _show_players(self, response):
+        """Update the players list from a 'players' response.
+        
+        Rows are keyed by username and only joins and leaves touch the tree,
+        so auto refresh doesn't flicker, drop the selection or jump the
+        scroll position.
+        """
+        tree = self.players_tree
+        if self.log_raw_responses.get():
             self.log_command_output(f"Raw 'players' response:\n{repr(response)}\n---\n{response}")
-            
-            # Parse response - format is like: "Players connected (1): \nPlayerName\n"
-            if not response or not response.strip():
-                self.players_tree.insert('', tk.END, text='0',
-                                        values=('No players online', '', ''))
-                return
-            
-            lines = response.strip().split('\n')
-            player_count = 0
-            
-            # First line is "Players connected (N):"
-            # Remaining lines are player names
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Skip the header line
-                if 'Players connected' in line:
-                    continue
-                
-                # This is a player name
-                player_count += 1
-                self.players_tree.insert('', tk.END, text=str(player_count), 
-                                        values=(line, 'User', 'Online'))
-            
-            # If no players found after parsing
-            if player_count == 0:
-                self.players_tree.insert('', tk.END, text='0',
-                                        values=('No players online', '', ''))
-                        
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to refresh players: {str(e)}")
-            self.log_command_output(f"Error refreshing players: {str(e)}")
-            
+        
+        names = parse_player_list(response)
+        self.player_names.add_many(names)
+        rows = tree.get_children()
+        shown = [iid[len(self.PLAYER_IID_PREFIX):] for iid in rows
+                 if iid.startswith(self.PLAYER_IID_PREFIX)]
+        placeholders = [iid for iid in rows if not iid.startswith(self.PLAYER_IID_PREFIX)]
+        joined, left, _ = diff_keyed(shown, names)
+        if not joined and not left and bool(placeholders) == (not names):
+            return
+        
+        first_visible = tree.yview()[0]
+        for iid in placeholders:
+            tree.delete(iid)
+        for name in left:
+            tree.delete(self.PLAYER_IID_PREFIX + name)
+        for name in joined:
+            tree.insert('', tk.END, iid=self.PLAYER_IID_PREFIX + name, text=str(len(tree.get_children()) + 1),
+                        values=(name, 'User', 'Online'))
+        
+        # Renumber only rows whose position changed
+        for number, iid in enumerate(tree.get_children(), 1):
+            if tree.item(iid, 'text') != str(number):
+                tree.item(iid, text=str(number))
+        if not names:
+            tree.insert('', tk.END, text='0', values=('No players online', '', ''))
+        tree.yview_moveto(first_visible)
+        
+        if joined or left:
+            logger.info("Players: %d online, joined %s, left %s", len(names), joined, left)
+    
     def player_action(self, action):
-        """Perform action on a player"""
+        """Perform action on a player (or on every selected player for bulk actions)"""
+        selected = self._selected_player_names()
+        if len(selected) > 1 and action in self.BULK_PLAYER_ACTIONS:
+            self.bulk_player_action(action, selected)
+            return
+        
         username = self.player_username_entry.get()
         if not username:
             messagebox.showwarning("No Username", "Please enter a username")
@@ -1528,30 +2611,154 @@ Created with ❤️ for the PZ community
             return
         
         try:
-            if action == 'kick':
-                cmd = f'kickuser "{username}"'
-            elif action == 'ban':
-                cmd = f'banuser "{username}"'
-            elif action == 'admin':
-                cmd = f'setaccesslevel "{username}" admin'
-            elif action == 'removeadmin':
-                cmd = f'setaccesslevel "{username}" none'
-            elif action == 'godmode':
-                cmd = f'godmod "{username}"'
-            elif action == 'teleport':
+            if action == 'teleport':
                 # Open teleport dialog
                 self.open_teleport_dialog(username)
                 return
-            else:
+            cmd = self._player_command(action, username)
+            if not cmd:
                 return
             
-            response = self.rcon.execute_command(cmd)
-            self.log_command_output(f"Action: {action}\nCommand: {cmd}\nResponse: {response}")
-            messagebox.showinfo("Success", f"Action '{action}' executed for {username}")
+            def done(response):
+                self.log_command_output(f"Action: {action}\nCommand: {cmd}\nResponse: {response}")
+                messagebox.showinfo("Success", f"Action '{action}' executed for {username}")
+            
+            priority = PRIORITY_URGENT if action in self.URGENT_PLAYER_ACTIONS else PRIORITY_INTERACTIVE
+            self.run_rcon(cmd, on_done=done, on_error=lambda e: messagebox.showerror("Error", str(e)),
+                          priority=priority)
             
         except Exception as e:
             messagebox.showerror("Error", str(e))
     
+    def bulk_player_action(self, action, usernames):
+        """Apply a moderation or access-level action to several players in one batch"""
+        if not self._ensure_connected():
+            return
+        
+        preview = "\n".join(f"  - {u}" for u in usernames[:15])
+        if len(usernames) > 15:
+            preview += f"\n  ... and {len(usernames) - 15} more"
+        if not messagebox.askyesno("Confirm Bulk Action",
+                                   f"Apply '{action}' to {len(usernames)} players?\n\n{preview}",
+                                   icon='warning'):
+            return
+        
+        commands = [self._player_command(action, u) for u in usernames]
+        priority = PRIORITY_INTERACTIVE if action in self.URGENT_PLAYER_ACTIONS else PRIORITY_BULK
+        self.run_bulk_commands(f"{action.title()} {len(usernames)} players", commands,
+                               priority=priority)
+    
+    def _player_command(self, action, username):
+        """Build the RCON command for a player action, or None if unknown"""
+        commands = {
+            'kick': f'kickuser "{username}"',
+            'ban': f'banuser "{username}"',
+            'admin': f'setaccesslevel "{username}" admin',
+            'removeadmin': f'setaccesslevel "{username}" none',
+            'godmode': f'godmod "{username}"',
+        }
+        return commands.get(action)
+    
+    def _selected_player_names(self):
+        """Usernames of all selected rows in the players list"""
+        names = []
+        for item in self.players_tree.selection():
+            values = self.players_tree.item(item)['values']
+            if values and values[0] not in ['No players online', 'Connect to server first']:
+                names.append(str(values[0]))
+        return names
+    
+    def run_bulk_commands(self, title, commands, on_complete=None, priority=PRIORITY_BULK):
+        """Run a batch of RCON commands in the background with a progress window.
+        
+        The batch is pipelined through `execute_many` in chunks paced by the
+        rate limiter, so it cannot flood the server and interactive commands
+        still get through while it runs. When it completes, each command's
+        outcome and timing is written to the command output and failures are
+        reported.
+        
+        Args:
+            title: Short description for the progress window and summary
+            commands: RCON commands to execute, in order
+            on_complete: Called on the Tk thread with the per-command results
+            priority: Pacing class for the batch (PRIORITY_BULK by default);
+                PRIORITY_URGENT is lowered to PRIORITY_INTERACTIVE so the
+                urgent lane stays free for restart warnings
+        """
+        if not self._ensure_connected():
+            return
+        
+        commands = list(commands)
+        priority = max(priority, PRIORITY_INTERACTIVE)
+        progress_window = tk.Toplevel(self)
+        progress_window.title(title)
+        progress_window.geometry("400x120")
+        progress_window.transient(self)
+        self.apply_dialog_theme(progress_window)
+        
+        status_label = ttk.Label(progress_window, text=f"0 / {len(commands)} commands")
+        status_label.pack(pady=(15, 5))
+        progress = ttk.Progressbar(progress_window, mode='determinate', length=350,
+                                   maximum=max(1, len(commands)))
+        progress.pack(padx=20, pady=5)
+        
+        started = time.monotonic()
+        
+        def update(done, total):
+            if progress_window.winfo_exists():
+                progress['value'] = done
+                status_label.config(text=f"{done} / {total} commands")
+        
+        def report_progress(done, total):
+            # Worker thread
+            self.call_in_ui(update, done, total)
+        
+        def finished(results):
+            if progress_window.winfo_exists():
+                progress_window.destroy()
+            self._report_bulk_results(title, results, time.monotonic() - started)
+            if on_complete:
+                on_complete(results)
+        
+        def failed(e):
+            if progress_window.winfo_exists():
+                progress_window.destroy()
+            messagebox.showerror("Error", f"{title} failed: {str(e)}")
+            logger.error("Bulk command batch failed: %s", e)
+        
+        # Bind the batch to this server's connection; switching servers
+        # while it waits must not send it elsewhere
+        connection = self.rcon
+        try:
+            self.run_in_background(
+                lambda: connection.execute_many(commands, progress=report_progress, priority=priority),
+                on_done=finished, on_error=failed, priority=priority)
+        except Exception as e:
+            failed(e)
+    
+    def _report_bulk_results(self, title, results, elapsed):
+        """Log every result of a bulk batch and summarise failures"""
+        errors = [r for r in results if r['error']]
+        summary = (f"{title}: {len(results) - len(errors)} succeeded, "
+                   f"{len(errors)} failed in {elapsed:.1f}s")
+        
+        lines = [summary]
+        for r in results:
+            if r['error']:
+                lines.append(f"  ✗ {r['command']} - {r['error']}")
+            else:
+                lines.append(f"  ✓ {r['command']} ({r['elapsed'] * 1000:.0f} ms): {r['response'].strip()}")
+        self.log_command_output("\n".join(lines))
+        logger.info(summary)
+        
+        if errors:
+            details = "\n".join(f"  - {r['command']}: {r['error']}" for r in errors[:10])
+            if len(errors) > 10:
+                details += f"\n  ... and {len(errors) - 10} more (see command output)"
+            messagebox.showwarning("Completed With Errors", f"{summary}\n\n{details}")
+        else:
+            messagebox.showinfo("Success", summary)
+    
     def open_teleport_dialog(self, username):
         """Open dialog to choose teleport destination"""
         dialog = tk.Toplevel(self)
@@ -1577,6 +2784,7 @@ Created with ❤️ for the PZ community
         target_entry = ttk.Entry(player_frame, width=30)
         target_entry.pack(fill=tk.X, pady=5)
         target_entry.focus()
+        NameCompleter(target_entry, self.player_names)
         
         def teleport_to_player():
             target = target_entry.get().strip()
@@ -1584,12 +2792,16 @@ Created with ❤️ for the PZ community
                 messagebox.showwarning("No Target", "Please enter a target player name")
                 return
             
-            try:
-                cmd = f'teleport "{username}" "{target}"'
-                response = self.rcon.execute_command(cmd)
+            cmd = f'teleport "{username}" "{target}"'
+            
+            def done(response):
                 self.log_command_output(f"Teleport: {username} → {target}\nCommand: {cmd}\nResponse: {response}")
                 messagebox.showinfo("Success", f"Teleported {username} to {target}")
-                dialog.destroy()
+                if dialog.winfo_exists():
+                    dialog.destroy()
+            
+            try:
+                self.run_rcon(cmd, on_done=done, on_error=lambda e: messagebox.showerror("Error", str(e)))
             except Exception as e:
                 messagebox.showerror("Error", str(e))
         
@@ -1631,40 +2843,22 @@ Created with ❤️ for the PZ community
         info += f"Server path: {server_path}\n\n"
         
         try:
-            # Check for server config in multiple locations
-            config_locations = [
-                server_path / 'Server' / 'servertest.ini',      # ~/Zomboid/Server/servertest.ini
-                server_path / 'servertest.ini',                  # Direct
-                Path.home() / 'Zomboid' / 'Server' / 'servertest.ini',  # Fallback
-            ]
-            
-            config_found = False
-            for config_path in config_locations:
-                if config_path.exists():
-                    info += f"Config file found: {config_path}\n"
-                    config_found = True
-                    break
-            
-            if not config_found:
+            config_path = self.path_cache.find_one(server_path, 'config')
+            if config_path:
+                info += f"Config file found: {config_path}\n"
+            else:
                 info += "Config file: Not found\n"
             
             # Check for database
-            db_files = list(server_path.rglob('players.db'))
-            if db_files:
-                info += f"\nPlayer database found: {db_files[0]}\n"
-                info += self.get_database_info(db_files[0])
-            
-            # Check for logs in multiple locations
-            log_locations = [
-                server_path / 'Logs',                            # ~/Zomboid/Logs
-                Path.home() / 'Zomboid' / 'Logs',                # Fallback
-            ]
-            
-            for log_dir in log_locations:
-                if log_dir.exists():
-                    log_files = list(log_dir.glob('*.txt'))
-                    info += f"\nLog files found: {len(log_files)} in {log_dir}\n"
-                    break
+            db_path = self.path_cache.find_one(server_path, 'players_db')
+            if db_path:
+                info += f"\nPlayer database found: {db_path}\n"
+                info += self.get_database_info(db_path)
+            
+            log_dir = self.path_cache.find_one(server_path, 'logs')
+            if log_dir:
+                log_files = list(log_dir.glob('*.txt'))
+                info += f"\nLog files found: {len(log_files)} in {log_dir}\n"
                 
         except Exception as e:
             info += f"\nError reading files: {str(e)}\n"
@@ -1675,21 +2869,16 @@ Created with ❤️ for the PZ community
         """Get information from the players database"""
         info = ""
         try:
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-            
-            # Get player count
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = cursor.fetchall()
-            info += f"Database tables: {', '.join([t[0] for t in tables])}\n"
-            
-            # Try to get player count
-            if ('networkPlayers',) in tables:
-                cursor.execute("SELECT COUNT(*) FROM networkPlayers")
-                count = cursor.fetchone()[0]
-                info += f"Total players in database: {count}\n"
-            
-            conn.close()
+            db = PlayersDB(db_path)
+            try:
+                tables = db.tables()
+                info += f"Database tables: {', '.join(tables)}\n"
+                
+                # Try to get player count
+                if 'networkPlayers' in tables:
+                    info += f"Total players in database: {db.count('networkPlayers')}\n"
+            finally:
+                db.close()
         except Exception as e:
             info += f"Error reading database: {str(e)}\n"
         
@@ -1971,6 +3160,11 @@ Screen:
         """Start the restart countdown with progress window"""
         self.restart_countdown_active = True
         
+        # Warnings go to the server that was active when the countdown started
+        # (kept across repeats), even if another fleet server is made active
+        if self._restart_server is None:
+            self._restart_server = self.active_server
+        
         # Only set time remaining if not already set (allows resuming with elapsed time)
         if not hasattr(self, 'restart_time_remaining') or self.restart_time_remaining <= 0:
             self.restart_time_remaining = total_minutes * 60  # Convert to seconds
@@ -1978,6 +3172,25 @@ Screen:
         # Save restart timer state to file (for recovery if program closes)
         self._save_restart_timer_state(total_minutes, warnings)
         
+        def restart_target():
+            server = self.fleet.get(self._restart_server) if self._restart_server else None
+            if server is None:
+                return self.rcon, self.rcon_worker
+            return server['connection'], server['worker']
+        
+        def target_connected():
+            connection = restart_target()[0]
+            return bool(connection and connection.authenticated)
+        
+        def send_urgent(cmd, on_sent=None):
+            # Urgent lane: warnings never wait behind slow commands or the Tk thread
+            def failed(e):
+                logger.warning("Restart countdown command failed: %s - %s", cmd, e)
+                if on_sent:
+                    on_sent()
+            future = restart_target()[1].submit(cmd, priority=PRIORITY_URGENT)
+            self._deliver_to_ui(future, (lambda _: on_sent()) if on_sent else None, failed)
+        
         # Create countdown window
         countdown_window = tk.Toplevel(self)
         if warnings.get('repeat', False):
@@ -2022,11 +3235,13 @@ Screen:
             self.restart_indicator.config(text="")  # Clear indicator
             self._clear_restart_timer_state()  # Clear saved state
             countdown_window.destroy()
-            if self.rcon and self.rcon.authenticated:
+            if target_connected():
                 try:
-                    self.rcon.execute_command('servermsg "Server restart has been CANCELLED."')
+                    send_urgent('servermsg "Server restart has been CANCELLED."')
                 except Exception:
                     pass
+            self._restart_server = None
+            self.refresh_fleet_grid()
             messagebox.showinfo("Cancelled", "Server restart has been cancelled")
         
         ttk.Button(countdown_window, text="Cancel Restart", command=cancel_restart).pack(pady=10)
@@ -2048,44 +3263,47 @@ Screen:
             except tk.TclError:
                 pass  # Window closed
             
-            # Update admin indicator in main window
+            # Update admin indicator in main window and the fleet grid's
+            # countdown cell (the rest of the grid only changes with fleet state)
+            server_label = f" ({self._restart_server})" if self._restart_server else ""
             if mins > 0:
-                self.restart_indicator.config(text=f"⏰ Restart in {mins}m {secs}s")
+                self.restart_indicator.config(text=f"⏰ Restart in {mins}m {secs}s{server_label}")
             else:
-                self.restart_indicator.config(text=f"⏰ Restart in {secs}s")
+                self.restart_indicator.config(text=f"⏰ Restart in {secs}s{server_label}")
+            self._update_fleet_restart_cell()
             
             # Check for warnings
-            if self.rcon and self.rcon.authenticated:
+            if target_connected():
                 try:
                     # 30 minutes
                     if warnings['warn_30min'] and self.restart_time_remaining == 1800 and '30min' not in warnings_sent:
-                        self.rcon.execute_command('servermsg "Server will restart in 30 minutes! Please finish up."')
+                        send_urgent('servermsg "Server will restart in 30 minutes! Please finish up."')
                         status_label.config(text="⚠️ 30 minute warning sent")
                         warnings_sent.add('30min')
                     
                     # 15 minutes
                     elif warnings['warn_15min'] and self.restart_time_remaining == 900 and '15min' not in warnings_sent:
-                        self.rcon.execute_command('servermsg "Server will restart in 15 minutes!"')
+                        send_urgent('servermsg "Server will restart in 15 minutes!"')
                         status_label.config(text="⚠️ 15 minute warning sent")
                         warnings_sent.add('15min')
                     
                     # 10 minutes
                     elif warnings['warn_10min'] and self.restart_time_remaining == 600 and '10min' not in warnings_sent:
-                        self.rcon.execute_command('servermsg "Server will restart in 10 minutes!"')
+                        send_urgent('servermsg "Server will restart in 10 minutes!"')
                         status_label.config(text="⚠️ 10 minute warning sent")
                         warnings_sent.add('10min')
                     
                     # 5 minutes
                     elif warnings['warn_5min'] and self.restart_time_remaining == 300 and '5min' not in warnings_sent:
-                        self.rcon.execute_command('servermsg "Server will restart in 5 minutes!"')
+                        send_urgent('servermsg "Server will restart in 5 minutes!"')
                         status_label.config(text="⚠️ 5 minute warning sent")
                         warnings_sent.add('5min')
                     
                     # 1 minute + auto-save
                     elif warnings['warn_1min'] and self.restart_time_remaining == 60 and '1min' not in warnings_sent:
-                        self.rcon.execute_command('servermsg "Server will restart in 1 minute!"')
+                        send_urgent('servermsg "Server will restart in 1 minute!"')
                         if warnings['auto_save']:
-                            self.rcon.execute_command('save')
+                            send_urgent('save')
                             status_label.config(text="💾 Auto-save triggered")
                         else:
                             status_label.config(text="⚠️ 1 minute warning sent")
@@ -2093,7 +3311,7 @@ Screen:
                     
                     # 30 seconds
                     elif warnings['warn_30sec'] and self.restart_time_remaining == 30 and '30sec' not in warnings_sent:
-                        self.rcon.execute_command('servermsg "Server restarting in 30 seconds!"')
+                        send_urgent('servermsg "Server restarting in 30 seconds!"')
                         status_label.config(text="⚠️ 30 second warning sent")
                         warnings_sent.add('30sec')
                 except Exception:
@@ -2104,28 +3322,33 @@ Screen:
                 self.restart_countdown_active = False
                 countdown_window.destroy()
                 
-                # Final warning
-                if self.rcon and self.rcon.authenticated:
+                def execute_restart():
+                    self.log_command_output("⏰ Scheduled restart time reached - restarting server...")
+                    config = self._load_server_control_config()
+                    cmd = config.get('restart_cmd', '')
+                    self._execute_shell_command(cmd, "Scheduled Restart")
+                
+                # Final warning, then restart once it has gone out (or failed)
+                if target_connected():
                     try:
-                        self.rcon.execute_command('servermsg "Server is restarting NOW!"')
+                        send_urgent('servermsg "Server is restarting NOW!"', on_sent=execute_restart)
                     except Exception:
-                        pass
-                
-                # Execute restart
-                self.log_command_output("⏰ Scheduled restart time reached - restarting server...")
-                config = self._load_server_control_config()
-                cmd = config.get('restart_cmd', '')
-                self._execute_shell_command(cmd, "Scheduled Restart")
+                        execute_restart()
+                else:
+                    execute_restart()
                 
                 # Check if should repeat
                 if warnings.get('repeat', False):
                     # Schedule next restart with same settings (state will be saved again when it starts)
                     self.after(5000, lambda: self.start_restart_countdown(total_minutes, warnings))
+                    self._update_fleet_restart_cell()
                     self.log_command_output(f"🔄 Repeating restart scheduled - next restart in {total_minutes} minutes")
                 else:
                     # One-time restart, clear indicator and saved state
                     self.restart_indicator.config(text="")
                     self._clear_restart_timer_state()
+                    self._restart_server = None
+                    self.refresh_fleet_grid()
                 
                 return
             
@@ -2249,8 +3472,7 @@ Screen:
             return
         
         try:
-            response = self.rcon.execute_command(cmd)
-            self.log_command_output(f"Command: {cmd}\nResponse: {response}")
+            self.stream_command_output(cmd)
         except Exception as e:
             messagebox.showerror("Error", str(e))
             logger.error("Command failed: %s", e)
@@ -2259,8 +3481,11 @@ Screen:
         """Send a message to all players"""
         message = tk.simpledialog.askstring("Server Message", "Enter message to broadcast:")
         if message:
-            response = self._send_server_message(message)
-            if not response:
+            def check_sent(response):
+                if not response:
+                    messagebox.showerror("Error", "Failed to send message - check connection")
+            
+            if not self._send_server_message(message, on_result=check_sent):
                 messagebox.showerror("Error", "Failed to send message - check connection")
                 
     def execute_custom_command(self):
@@ -2273,13 +3498,56 @@ Screen:
             return
         
         try:
-            response = self.rcon.execute_command(cmd)
-            self.log_command_output(f"Command: {cmd}\nResponse: {response}")
-            logger.info("Custom command executed: %s", cmd)
+            self.stream_command_output(
+                cmd, on_done=lambda: logger.info("Custom command executed: %s", cmd))
         except Exception as e:
             messagebox.showerror("Error", str(e))
             logger.error("Custom command failed: %s", e)
             
+    def stream_command_output(self, cmd, on_done=None):
+        """Execute a command and append its output to the commands tab as it arrives.
+        
+        Long replies (`help`, `players` on a full server) can span several RCON
+        packets; the worker reads them and each one is shown as soon as it is
+        read, without blocking the window.
+        
+        Args:
+            cmd: RCON command to execute
+            on_done: Called with no arguments once the whole reply is shown
+        """
+        self.command_output.insert(tk.END, f"\n[{datetime.now().strftime('%H:%M:%S')}]\nCommand: {cmd}\nResponse: ")
+        
+        def append(chunk):
+            self.command_output.insert(tk.END, chunk)
+            self.command_output.see(tk.END)
+        
+        connection = self.rcon
+        
+        def stream():
+            # Worker thread: chunks are queued ahead of the completion callback
+            for chunk in connection.iter_response(cmd):
+                self.call_in_ui(append, chunk)
+        
+        def finish():
+            self.command_output.insert(tk.END, "\n" + "=" * 50 + "\n")
+            self.command_output.see(tk.END)
+        
+        def done(_):
+            finish()
+            if on_done:
+                on_done()
+        
+        def failed(e):
+            finish()
+            messagebox.showerror("Error", str(e))
+            logger.error("Command failed: %s", e)
+        
+        try:
+            self.run_in_background(stream, on_done=done, on_error=failed)
+        except Exception:
+            finish()
+            raise
+    
     def log_command_output(self, text):
         """Log command output to the commands tab"""
         self.command_output.insert(tk.END, f"\n[{datetime.now().strftime('%H:%M:%S')}]\n{text}\n")
@@ -2372,23 +3640,9 @@ Screen:
             messagebox.showwarning("No Server Path", "Please set the server path first")
             return
         
-        # Find the .ini file - search multiple locations
         server_path = Path(self.server_path.get())
-        
-        search_dirs = [
-            server_path / 'Server',              # ~/Zomboid/Server
-            server_path,                          # Direct path if user pointed to Server folder
-            Path.home() / 'Zomboid' / 'Server',  # Fallback to home
-            Path.home() / '.local' / 'share' / 'Zomboid' / 'Server',  # Alternative Linux
-        ]
-        
-        ini_files = []
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                found = list(search_dir.glob('*.ini'))
-                for f in found:
-                    if f not in ini_files:
-                        ini_files.append(f)
+        search_dirs = _config_dirs(server_path)
+        ini_files = self.path_cache.find(server_path, 'config')
         
         if not ini_files:
             searched = "\n".join(f"  • {d}" for d in search_dirs[:3] if d.exists() or d == search_dirs[0])
@@ -2421,8 +3675,7 @@ Screen:
         try:
             server_path = Path(self.server_path.get())
             
-            # Use utils to find config file
-            config_file = find_config_file(server_path)
+            config_file = self.path_cache.find_one(server_path, 'config')
             
             if not config_file:
                 self.log_command_output("No server config file found with mod information.")
@@ -2458,23 +3711,10 @@ Screen:
         try:
             server_path = Path(self.server_path.get())
             
-            # Try multiple possible log locations
-            log_locations = [
-                server_path / 'Logs',                    # ~/Zomboid/Logs (most common)
-                server_path / 'server-console.txt',      # Direct log file
-                server_path.parent / 'Logs',             # Parent/Logs if in Server subdir
-                Path.home() / 'Zomboid' / 'Logs',        # Fallback to home
-                Path.home() / '.local' / 'share' / 'Zomboid' / 'Logs',  # Alternative Linux
-            ]
-            
-            log_dir = None
-            for loc in log_locations:
-                if loc.exists() and loc.is_dir():
-                    log_dir = loc
-                    break
+            log_dir = self.path_cache.find_one(server_path, 'logs')
             
             if not log_dir:
-                searched = "\n".join(f"  • {loc}" for loc in log_locations[:3])
+                searched = "\n".join(f"  • {loc}" for loc in _log_dirs(server_path)[:3])
                 messagebox.showwarning("Logs Not Found", 
                     f"Could not find logs directory.\n\n"
                     f"Searched in:\n{searched}\n\n"
@@ -2491,14 +3731,12 @@ Screen:
             # Read last N lines
             lines_to_read = int(self.log_lines_entry.get() or 100)
             
-            with open(log_files[0], 'r', encoding='utf-8', errors='ignore') as f:
-                all_lines = f.readlines()
-                recent_lines = all_lines[-lines_to_read:]
+            recent_lines, _ = tail_lines(log_files[0], lines_to_read)
             
             self.logs_text.delete(1.0, tk.END)
             self.logs_text.insert(tk.END, f"=== {log_files[0].name} (last {lines_to_read} lines) ===\n")
             self.logs_text.insert(tk.END, f"=== Path: {log_dir} ===\n\n")
-            self.logs_text.insert(tk.END, ''.join(recent_lines))
+            self.logs_text.insert(tk.END, ''.join(line + '\n' for line in recent_lines))
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to read logs: {str(e)}")
@@ -2512,21 +3750,8 @@ Screen:
                 self.live_logs_var.set(False)
                 return
             
-            # Find log file - try multiple locations
             server_path = Path(self.server_path.get())
-            
-            log_locations = [
-                server_path / 'Logs',                    # ~/Zomboid/Logs (most common)
-                server_path.parent / 'Logs',             # Parent/Logs if in Server subdir
-                Path.home() / 'Zomboid' / 'Logs',        # Fallback to home
-                Path.home() / '.local' / 'share' / 'Zomboid' / 'Logs',  # Alternative Linux
-            ]
-            
-            log_dir = None
-            for loc in log_locations:
-                if loc.exists() and loc.is_dir():
-                    log_dir = loc
-                    break
+            log_dir = self.path_cache.find_one(server_path, 'logs')
             
             if not log_dir:
                 messagebox.showwarning("Logs Not Found", 
@@ -2534,6 +3759,10 @@ Screen:
                 self.live_logs_var.set(False)
                 return
             
+            if self.live_merge_var.get():
+                self._start_merged_live_logs(log_dir)
+                return
+            
             # Find most recent log file
             log_files = sorted(log_dir.glob('*.txt'), key=os.path.getmtime, reverse=True)
             
@@ -2551,75 +3780,355 @@ Screen:
             
             # Read last 50 lines first to show context
             try:
-                with open(self.current_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    all_lines = f.readlines()
-                    recent_lines = all_lines[-50:] if len(all_lines) > 50 else all_lines
-                    self.logs_text.insert(tk.END, ''.join(recent_lines))
-                    self.logs_text.insert(tk.END, "\n--- [Live updates below] ---\n\n")
-                    
-                    # Set position to end of file
-                    self.log_file_position = f.tell()
+                # The tailer carries on from the end of the last whole line
+                recent_lines, self.log_file_position = tail_lines(self.current_log_file, 50)
+                self.logs_text.insert(tk.END, ''.join(line + '\n' for line in recent_lines))
+                self.logs_text.insert(tk.END, "\n--- [Live updates below] ---\n\n")
             except Exception as e:
                 self.logs_text.insert(tk.END, f"Error reading initial log: {str(e)}\n")
                 self.log_file_position = 0
             
-            self.live_logs_active = True
-            
             # Auto-scroll to bottom
             self.logs_text.see(tk.END)
             
-            # Start streaming immediately
-            self.after(100, self.stream_logs)
+            # Follow the file from a background thread; new lines come back
+            # through the UI queue as soon as they are written
+            self._stop_log_tailer()
+            tailer = LogTailer(
+                self.current_log_file,
+                on_lines=lambda lines: self.call_in_ui(self._append_live_log_lines, tailer, lines),
+                on_reset=lambda reason: self.call_in_ui(self._on_live_log_reset, tailer, reason))
+            try:
+                tailer.start(self.log_file_position)
+            except OSError as e:
+                self.logs_text.insert(tk.END, f"\n[Live stream error: {str(e)}]\n")
+                self.live_logs_var.set(False)
+                return
+            self.log_tailer = tailer
+            self.live_logs_active = True
             
-            self.log_command_output(f"Live log streaming started: {self.current_log_file}")
+            mode = "inotify" if tailer.using_inotify else "polling"
+            self.log_command_output(f"Live log streaming started ({mode}): {self.current_log_file}")
         else:
             # Stop live streaming
             self.live_logs_active = False
+            self._stop_log_tailer()
             self.log_command_output("Live log streaming stopped")
     
-    def stream_logs(self):
-        """Stream new log lines in real-time"""
-        if not self.live_logs_active:
+    def _start_merged_live_logs(self, log_dir):
+        """Follow every current log file at once, merged into one timeline"""
+        log_files = sorted(log_dir.glob('*.txt'))
+        if not log_files:
+            messagebox.showinfo("No Logs", f"No log files found in:\n{log_dir}")
+            self.live_logs_var.set(False)
             return
+        self.current_log_file = None
         
+        # Recent lines of every file, merged by time, for context; the
+        # tailer carries on from the end of each file's last whole line
+        offsets = {}
+        recent = []
+        for path in log_files:
+            try:
+                lines, offsets[path] = tail_lines(path, 50)
+            except OSError as e:
+                logger.warning("Could not read %s: %s", path, e)
+                continue
+            key = self._live_log_key(log_category(path))
+            when = 0
+            for line in lines:
+                # Lines without a timestamp stay after the line they continue
+                when = parse_log_time(line) or when
+                recent.append((when, len(recent), key, line))
+        recent.sort()
+        self.live_log_entries.clear()
+        self.live_log_entries.extend((key, line) for _, _, key, line in recent[-200:])
+        self._live_log_header = (f"=== Live Streaming: all logs, merged by time ===\n"
+                                 f"=== Log directory: {log_dir} ===\n\n")
+        self._render_live_log_entries()
+        self.logs_text.insert(tk.END, "\n--- [Live updates below] ---\n\n")
+        self.logs_text.see(tk.END)
+        
+        self._stop_log_tailer()
+        tailer = MultiLogTailer(
+            log_dir,
+            on_records=lambda records: self.call_in_ui(self._append_live_log_records, tailer, records),
+            on_reset=lambda path, reason: self.call_in_ui(
+                self._on_live_log_reset, tailer, f"{path.name} {reason}"))
         try:
-            if self.current_log_file and self.current_log_file.exists():
-                # Check current file size
-                current_size = os.path.getsize(self.current_log_file)
-                
-                # If file was truncated/rotated, reset position
-                if current_size < self.log_file_position:
-                    self.log_file_position = 0
-                    self.logs_text.insert(tk.END, "\n--- [Log file rotated/cleared] ---\n\n")
-                
-                with open(self.current_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    # Seek to last read position
-                    f.seek(self.log_file_position)
-                    
-                    # Read new lines
-                    new_lines = f.readlines()
-                    
-                    if new_lines:
-                        # Update position
-                        self.log_file_position = f.tell()
-                        
-                        # Append new lines to text widget
-                        self.logs_text.insert(tk.END, ''.join(new_lines))
-                        
-                        # Auto-scroll to bottom
-                        self.logs_text.see(tk.END)
-                        
-                        # Limit total lines to prevent memory issues (keep last 1000 lines)
-                        total_lines = int(self.logs_text.index('end-1c').split('.')[0])
-                        if total_lines > 1000:
-                            self.logs_text.delete('1.0', f'{total_lines - 1000}.0')
-        except Exception as e:
+            tailer.start(offsets)
+        except OSError as e:
             self.logs_text.insert(tk.END, f"\n[Live stream error: {str(e)}]\n")
-            self.log_command_output(f"Live log streaming error: {str(e)}")
+            self.live_logs_var.set(False)
+            return
+        self.log_tailer = tailer
+        self.live_logs_active = True
         
-        # Schedule next check (every 1 second)
-        if self.live_logs_active:
-            self.after(1000, self.stream_logs)
+        mode = "inotify" if tailer.using_inotify else "polling"
+        self.log_command_output(f"Live log streaming started ({mode}): {len(offsets)} files in {log_dir}")
+    
+    def _live_log_key(self, category):
+        """Colour/toggle key of a log category"""
+        return category if category in self.LIVE_LOG_COLORS else 'other'
+    
+    def _render_live_log_entries(self):
+        """Redraw the merged live view from the kept entries, hiding unticked categories"""
+        self.logs_text.delete(1.0, tk.END)
+        self.logs_text.insert(tk.END, self._live_log_header)
+        for key, text in self.live_log_entries:
+            if self.live_category_vars[key].get():
+                self.logs_text.insert(tk.END, text + '\n', f'live_{key}')
+    
+    def _refilter_live_logs(self):
+        """Show or hide a category in the merged live view"""
+        if self.live_logs_active and isinstance(self.log_tailer, MultiLogTailer):
+            self._render_live_log_entries()
+            self.logs_text.see(tk.END)
+    
+    def _append_live_log_records(self, tailer, records):
+        """Show records from the merged live tailer (Tk thread)"""
+        if tailer is not self.log_tailer or not self.live_logs_active:
+            return  # queued before streaming stopped
+        for record in records:
+            key = self._live_log_key(record['category'])
+            self.live_log_entries.append((key, record['line']))
+            if self.live_category_vars[key].get():
+                self.logs_text.insert(tk.END, record['line'] + '\n', f'live_{key}')
+        self.logs_text.see(tk.END)
+        
+        # Limit total lines to prevent memory issues (keep last 1000 lines)
+        total_lines = int(self.logs_text.index('end-1c').split('.')[0])
+        if total_lines > 1000:
+            self.logs_text.delete('1.0', f'{total_lines - 1000}.0')
+    
+    @staticmethod
+    def _parse_log_range_time(text):
+        """Epoch seconds for a time typed as in the logs (dd-mm-yy HH:MM[:SS])"""
+        for fmt in ('%d-%m-%y %H:%M:%S', '%d-%m-%y %H:%M'):
+            try:
+                return datetime.strptime(text.strip(), fmt).timestamp()
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid time: {text}")
+    
+    def show_log_range(self):
+        """Show the log records (current and archived logs) matching the range and filters"""
+        server_path = self.server_path.get()
+        log_dir = self.path_cache.find_one(server_path, 'logs') if server_path and os.path.isdir(server_path) else None
+        if not log_dir:
+            messagebox.showwarning("Logs Not Found", "Please set the server path to view logs")
+            return
+        from_text = self.log_range_from.get().strip()
+        to_text = self.log_range_to.get().strip()
+        try:
+            start = self._parse_log_range_time(from_text) if from_text else None
+            end = self._parse_log_range_time(to_text) if to_text else None
+        except ValueError:
+            messagebox.showwarning("Invalid Time",
+                "Enter times as they appear in the logs: dd-mm-yy HH:MM or dd-mm-yy HH:MM:SS")
+            return
+        category = self.log_category_var.get()
+        categories = None if category == 'All' else [category]
+        player = self.log_player_var.get().strip() or None
+        pattern = self.log_pattern_var.get().strip() or None
+        if pattern:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                messagebox.showwarning("Invalid Pattern", f"Match is not a valid regular expression: {e}")
+                return
+        if self.live_logs_var.get():
+            # Leave the live stream running and show the range in its own window
+            window = tk.Toplevel(self)
+            window.title(f"Logs: {from_text or 'start'} to {to_text or 'now'}")
+            window.geometry("1000x600")
+            self.apply_dialog_theme(window)
+            output = scrolledtext.ScrolledText(window, wrap=tk.WORD, **self.get_text_colors())
+            output.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        else:
+            output = self.logs_text
+        limit = self.LOG_RANGE_MAX_LINES
+        
+        def collect():
+            sections = []
+            total = 0
+            for record in read_log_records(find_log_files(log_dir), start, end, categories, player, pattern):
+                if not sections or sections[-1][0] != record['path']:
+                    sections.append((record['path'], []))
+                sections[-1][1].append(record['line'])
+                total += 1
+                if total >= limit:
+                    break
+            return sections, total >= limit
+        
+        def show(result):
+            if not output.winfo_exists():
+                return  # range window closed while reading
+            sections, truncated = result
+            filters = [f"{name}: {value}" for name, value in
+                       (('category', category if categories else None), ('player', player),
+                        ('match', pattern)) if value]
+            output.delete(1.0, tk.END)
+            output.insert(tk.END, f"=== {from_text or 'start'} to {to_text or 'now'} ===\n")
+            if filters:
+                output.insert(tk.END, f"=== {', '.join(filters)} ===\n")
+            output.insert(tk.END, f"=== Path: {log_dir} ===\n")
+            for path, lines in sections:
+                output.insert(tk.END, f"\n=== {path.relative_to(log_dir)} ({len(lines)} records) ===\n")
+                output.insert(tk.END, ''.join(line + '\n' for line in lines))
+            if not sections:
+                output.insert(tk.END, "\nNo log records match.\n")
+            if truncated:
+                output.insert(tk.END, f"\n--- [Stopped after {limit} records; narrow the search] ---\n")
+            output.see('1.0')
+        
+        output.delete(1.0, tk.END)
+        output.insert(tk.END, "Reading logs...\n")
+        future = self._fleet_executor.submit(collect)
+        self._deliver_to_ui(future, show,
+                            lambda e: messagebox.showerror("Error", f"Failed to read logs: {e}"))
+    
+    def _stop_log_tailer(self):
+        """Stop following the live log, if it is being followed"""
+        if self.log_tailer is not None:
+            self.log_tailer.stop()
+            self.log_tailer = None
+    
+    def _append_live_log_lines(self, tailer, lines):
+        """Show lines from the live log tailer (Tk thread)"""
+        if tailer is not self.log_tailer or not self.live_logs_active:
+            return  # queued before streaming stopped
+        self.log_file_position = tailer.offset
+        self.logs_text.insert(tk.END, '\n'.join(lines) + '\n')
+        self.logs_text.see(tk.END)
+        
+        # Limit total lines to prevent memory issues (keep last 1000 lines)
+        total_lines = int(self.logs_text.index('end-1c').split('.')[0])
+        if total_lines > 1000:
+            self.logs_text.delete('1.0', f'{total_lines - 1000}.0')
+    
+    def _on_live_log_reset(self, tailer, reason):
+        """Mark a rotated or truncated live log (Tk thread)"""
+        if tailer is self.log_tailer and self.live_logs_active:
+            self.logs_text.insert(tk.END, f"\n--- [Log file {reason}] ---\n\n")
+    
+    def start_log_search(self):
+        """Search every current and archived log, showing matches as they are found"""
+        query = self.log_search_var.get()
+        if not query:
+            return
+        server_path = self.server_path.get()
+        log_dir = self.path_cache.find_one(server_path, 'logs') if server_path and os.path.isdir(server_path) else None
+        if not log_dir:
+            messagebox.showwarning("Logs Not Found", "Please set the server path to search logs")
+            return
+        regex = self.log_search_regex_var.get()
+        ignore_case = not self.log_search_case_var.get()
+        flags = re.IGNORECASE if ignore_case else 0
+        try:
+            highlight = re.compile(query if regex else re.escape(query), flags)
+        except re.error as e:
+            messagebox.showwarning("Invalid Pattern", f"Search is not a valid regular expression: {e}")
+            return
+        try:
+            context = max(0, int(self.log_search_context_var.get()))
+        except ValueError:
+            context = 0
+        limit = self.LOG_SEARCH_MAX_MATCHES
+        
+        self.stop_log_search()
+        stop = threading.Event()
+        self._log_search_stop = stop
+        with self._log_search_lock:
+            self._log_search_pending = []
+        self._log_search_shown = (None, 0)  # (last file shown, matches shown)
+        self.log_search_text.delete(1.0, tk.END)
+        self.log_search_status.config(text=f"Searching {log_dir}...")
+        
+        def search():
+            started = time.monotonic()
+            paths = find_log_files(log_dir)
+            size = 0
+            for path in paths:
+                try:
+                    size += path.stat().st_size
+                except OSError:
+                    pass
+            found = 0
+            for match in search_logs(paths, query, regex, ignore_case, context, limit, cancel=stop):
+                if stop.is_set():
+                    break
+                found += 1
+                with self._log_search_lock:
+                    self._log_search_pending.append(match)
+                    first = len(self._log_search_pending) == 1
+                if first:
+                    # One drain per batch: later matches join the pending list
+                    self.call_in_ui(self._show_log_search_matches, stop, log_dir, highlight)
+            return found, len(paths), size, time.monotonic() - started
+        
+        def done(result):
+            if stop is not self._log_search_stop:
+                return  # a newer search replaced this one
+            self._show_log_search_matches(stop, log_dir, highlight)
+            found, files, size, elapsed = result
+            summary = f"{found} matches in {files} files ({size / 1048576:.1f} MB) in {elapsed:.1f}s"
+            if stop.is_set():
+                summary = "Stopped: " + summary
+            elif found >= limit:
+                summary += f" (stopped at {limit}; narrow the search)"
+            self.log_search_status.config(text=summary)
+            if not found:
+                self.log_search_text.insert(tk.END, "No matches.\n")
+        
+        def failed(e):
+            if stop is self._log_search_stop:
+                self.log_search_status.config(text=f"Search failed: {e}")
+        
+        future = self._fleet_executor.submit(search)
+        self._deliver_to_ui(future, done, failed)
+    
+    def stop_log_search(self):
+        """Stop the running log search, if any"""
+        if self._log_search_stop is not None:
+            self._log_search_stop.set()
+    
+    def _show_log_search_matches(self, stop, log_dir, highlight):
+        """Show the matches found since the last call (Tk thread)"""
+        with self._log_search_lock:
+            matches, self._log_search_pending = self._log_search_pending, []
+        if stop is not self._log_search_stop:
+            return  # from a search that was replaced
+        text = self.log_search_text
+        last_path, shown = self._log_search_shown
+        for match in matches:
+            if match['path'] != last_path:
+                last_path = match['path']
+                try:
+                    name = last_path.relative_to(log_dir)
+                except ValueError:
+                    name = last_path
+                text.insert(tk.END, f"\n=== {name} ===\n", 'file')
+            elif match['before'] or match['after']:
+                text.insert(tk.END, "--\n", 'context')
+            line_no = match['line_no']
+            for i, line in enumerate(match['before']):
+                text.insert(tk.END, f"{line_no - len(match['before']) + i}- {line}\n", 'context')
+            text.insert(tk.END, f"{line_no}: ")
+            line = match['line']
+            hit = highlight.search(line)
+            if hit and hit.end() > hit.start():
+                text.insert(tk.END, line[:hit.start()])
+                text.insert(tk.END, hit.group(), 'hit')
+                text.insert(tk.END, line[hit.end():] + '\n')
+            else:
+                text.insert(tk.END, line + '\n')
+            for i, line in enumerate(match['after']):
+                text.insert(tk.END, f"{line_no + 1 + i}- {line}\n", 'context')
+            shown += 1
+        self._log_search_shown = (last_path, shown)
+        if matches and not stop.is_set():
+            self.log_search_status.config(text=f"Searching... {shown} matches so far")
     
     def refresh_banlist(self):
         """Refresh the ban list from server files"""
@@ -2634,29 +4143,18 @@ Screen:
         try:
             server_path = Path(self.server_path.get())
             
-            # Try multiple possible locations for banlist
-            banlist_paths = [
-                server_path / 'Server' / 'banlist.txt',
-                server_path / 'banlist.txt',
-                Path.home() / 'Zomboid' / 'Server' / 'banlist.txt',
-                Path.home() / '.local' / 'share' / 'Zomboid' / 'Server' / 'banlist.txt',
-            ]
-            
-            banlist_file = None
-            for path in banlist_paths:
-                if path.exists():
-                    banlist_file = path
-                    break
+            banlist_file = self.path_cache.find_one(server_path, 'banlist')
             
             if not banlist_file:
                 self.banlist_tree.insert('', tk.END, text='0',
                                         values=('No bans found', '', '', ''))
                 self.log_command_output(f"Ban list file not found. Tried:\n" + 
-                                       "\n".join(f"  - {p}" for p in banlist_paths[:3]))
+                                       "\n".join(f"  - {d / 'banlist.txt'}" for d in _config_dirs(server_path)[:3]))
                 return
             
             # Parse ban list using utils
             bans = parse_banlist(banlist_file)
+            self.player_names.add_many(username for username, _, _, _ in bans)
             
             if not bans:
                 self.banlist_tree.insert('', tk.END, text='0',
@@ -2680,13 +4178,23 @@ Screen:
             messagebox.showwarning("No Selection", "Please select a user to unban")
             return
         
-        # Get username from selected item
-        item = selection[0]
-        username = self.banlist_tree.item(item)['values'][0]
+        # Get usernames from selected items
+        usernames = [self.banlist_tree.item(item)['values'][0] for item in selection]
+        usernames = [u for u in usernames if u not in ['No bans found', 'No bans']]
+        if not usernames:
+            return
         
-        if username in ['No bans found', 'No bans']:
+        if len(usernames) > 1:
+            if not self._ensure_connected():
+                return
+            if not messagebox.askyesno("Confirm Unban", f"Unban {len(usernames)} selected users?"):
+                return
+            self.run_bulk_commands(f"Unban {len(usernames)} users",
+                                   [f'unbanuser "{u}"' for u in usernames])
             return
         
+        username = usernames[0]
+        
         # Confirm unban
         if not messagebox.askyesno("Confirm Unban", f"Unban user '{username}'?"):
             return
@@ -2708,16 +4216,20 @@ Screen:
             messagebox.showwarning("Not Connected", "Please connect to the server first")
             return
         
-        try:
-            response = self.rcon.execute_command(f'unbanuser "{username}"')
+        def done(response):
             self.log_command_output(f"Unban command for '{username}':\n{response}")
             messagebox.showinfo("Success", f"Unbanned '{username}'\n\nRefresh the ban list to see changes.")
             
             # Clear the manual entry field
             self.unban_username_entry.delete(0, tk.END)
-            
-        except Exception as e:
+        
+        def failed(e):
             messagebox.showerror("Error", f"Failed to unban user: {str(e)}")
+        
+        try:
+            self.run_rcon(f'unbanuser "{username}"', on_done=done, on_error=failed)
+        except Exception as e:
+            failed(e)
     
     def clear_all_bans(self):
         """Clear all bans (with confirmation)"""
@@ -2740,24 +4252,16 @@ Screen:
             messagebox.showwarning("Not Connected", "Please connect to the server first")
             return
         
-        try:
-            # Get all usernames
-            unbanned = []
-            for item in self.banlist_tree.get_children():
-                username = self.banlist_tree.item(item)['values'][0]
-                if username not in ['No bans found', 'No bans']:
-                    try:
-                        self.rcon.execute_command(f'unbanuser "{username}"')
-                        unbanned.append(username)
-                    except Exception as e:
-                        pass  # Continue trying to unban others
-            
-            self.log_command_output(f"Cleared all bans. Unbanned {len(unbanned)} users:\n" + 
-                                   "\n".join(f"  - {u}" for u in unbanned))
-            messagebox.showinfo("Success", f"Unbanned {len(unbanned)} users\n\nRefresh the ban list to verify.")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to clear bans: {str(e)}")
+        # Get all usernames
+        usernames = []
+        for item in self.banlist_tree.get_children():
+            username = self.banlist_tree.item(item)['values'][0]
+            if username not in ['No bans found', 'No bans']:
+                usernames.append(username)
+        
+        # One pipelined batch; every failure is reported, none are swallowed
+        self.run_bulk_commands(f"Clear all bans ({len(usernames)} users)",
+                               [f'unbanuser "{u}"' for u in usernames])
             
     def refresh_all(self):
         """Refresh all tabs"""
@@ -3096,18 +4600,23 @@ Screen:
             if not task['enabled']:
                 return
             
+            def failed(e):
+                self.log_command_output(f"[Scheduled Task Error] {str(e)}")
+            
             try:
                 if task['type'] == 'announcement':
                     if self.rcon:
                         cmd = f'servermsg "{task["message"]}"'
-                        self.rcon.execute_command(cmd)
-                        self.log_command_output(f"[Scheduled] Announcement: {task['message']}")
+                        self.run_rcon(cmd, on_error=failed, priority=PRIORITY_BULK,
+                                      on_done=lambda _: self.log_command_output(
+                                          f"[Scheduled] Announcement: {task['message']}"))
                 elif task['type'] == 'command':
                     if self.rcon:
-                        self.rcon.execute_command(task['command'])
-                        self.log_command_output(f"[Scheduled] Command: {task['command']}")
+                        self.run_rcon(task['command'], on_error=failed, priority=PRIORITY_BULK,
+                                      on_done=lambda _: self.log_command_output(
+                                          f"[Scheduled] Command: {task['command']}"))
             except Exception as e:
-                self.log_command_output(f"[Scheduled Task Error] {str(e)}")
+                failed(e)
             
             # Reschedule
             if task['enabled']:
@@ -3157,8 +4666,25 @@ Screen:
             'host': self.host_entry.get(),
             'port': self.port_entry.get(),
             'server_path': self.server_path.get(),
-            'pz_version': self.pz_version.get()
+            'pz_version': self.pz_version.get(),
+            'rcon_rate': self.rcon_rate,
+            'rcon_burst': self.rcon_burst,
+            'active_server': self.active_server,
+            'servers': [],
         }
+        if self.active_server and self.fleet.get(self.active_server):
+            self.fleet.get(self.active_server)['info'].update(
+                server_path=self.server_path.get(), pz_version=self.pz_version.get())
+        for name in self.fleet.names():
+            server = self.fleet.get(name)
+            config['servers'].append({
+                'name': name,
+                'host': server['host'],
+                'port': server['port'],
+                'server_path': server['info'].get('server_path', ''),
+                'pz_version': server['info'].get('pz_version', 'build42'),
+                'password_env': server['info'].get('password_env') or self._fleet_password_env(name),
+            })
         
         try:
             with open('pz_admin_config.json', 'w') as f:
@@ -3184,6 +4710,29 @@ Screen:
                 # Load PZ version (default to build42)
                 pz_ver = config.get('pz_version', 'build42')
                 self.pz_version.set(pz_ver)
+                
+                self.rcon_rate = config.get('rcon_rate', self.DEFAULT_RCON_RATE)
+                self.rcon_burst = config.get('rcon_burst', self.DEFAULT_RCON_BURST)
+                
+                # Fleet servers; passwords only ever come from the environment
+                for entry in config.get('servers', []):
+                    try:
+                        name = entry['name']
+                        port = int(entry['port'])
+                        host = entry['host']
+                    except (KeyError, TypeError, ValueError):
+                        logger.warning("Skipping invalid server entry in config: %r", entry)
+                        continue
+                    password_env = entry.get('password_env') or self._fleet_password_env(name)
+                    self.fleet.add(name, host, port, os.environ.get(password_env),
+                                   password_env=password_env,
+                                   server_path=entry.get('server_path', ''),
+                                   pz_version=entry.get('pz_version', 'build42'))
+                active = config.get('active_server')
+                if active and self.fleet.get(active):
+                    self.set_active_server(active)
+                self.refresh_fleet_grid()
+                self.after(1000, self.connect_fleet)
         except (IOError, OSError, json.JSONDecodeError) as e:
             logger.debug("Failed to load main config, using defaults: %s", e)
     
@@ -3193,46 +4742,100 @@ Screen:
             messagebox.showwarning("No Server Path", "Please set the server path first")
             return
         
-        # Try to auto-detect config files from multiple locations
+        # Config files from the usual locations (cached per server path)
         server_path = Path(self.server_path.get())
-        
-        # Possible locations for config files
-        search_dirs = [
-            server_path / 'Server',              # ~/Zomboid/Server (most common)
-            server_path,                          # Direct path if user pointed to Server folder
-            Path.home() / 'Zomboid' / 'Server',  # Fallback to home
-            Path.home() / '.local' / 'share' / 'Zomboid' / 'Server',  # Alternative Linux
-        ]
-        
-        # Search for .ini files
-        ini_files = []
-        found_server_dir = None
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                found_ini = list(search_dir.glob('*.ini'))
-                if found_ini:
-                    ini_files.extend(found_ini)
-                    if not found_server_dir:
-                        found_server_dir = search_dir
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        ini_files = [f for f in ini_files if not (f in seen or seen.add(f))]
-        
-        # Search for _SandboxVars.lua files in same locations
-        lua_files = []
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                lua_files.extend(list(search_dir.glob('*_SandboxVars.lua')))
-        
-        # Remove duplicates
-        seen = set()
-        lua_files = [f for f in lua_files if not (f in seen or seen.add(f))]
+        search_dirs = _config_dirs(server_path)
+        ini_files = self.path_cache.find(server_path, 'config')
+        lua_files = self.path_cache.find(server_path, 'sandbox')
         
         # Show file selection dialog with search info
         FileSelectionDialog(self, server_path, ini_files, lua_files, search_dirs)
 
 
+class NameCompleter:
+    """Drop-down suggestions from a NameIndex under an Entry as the user types.
+    
+    Down moves into the list, Return or a click picks a name, Escape closes it.
+    """
+    
+    def __init__(self, entry, index, limit=8):
+        self.entry = entry
+        self.index = index
+        self.limit = limit
+        self.popup = None
+        self.listbox = None
+        entry.bind('<KeyRelease>', self._on_key, add='+')
+        entry.bind('<Down>', self._enter_list, add='+')
+        entry.bind('<Escape>', self.hide, add='+')
+        entry.bind('<FocusOut>', lambda e: entry.after(150, self._hide_unless_focused), add='+')
+    
+    def _on_key(self, event):
+        """Refresh the suggestions for the new text"""
+        if event.keysym in ('Down', 'Up', 'Return', 'Escape', 'Tab') or event.keysym.endswith(('_L', '_R')):
+            return
+        text = self.entry.get()
+        matches = self.index.complete(text, self.limit)
+        if not matches or matches == [text]:
+            self.hide()
+        else:
+            self._show(matches)
+    
+    def _show(self, matches):
+        """Show (creating on first use) the suggestion list under the entry"""
+        if self.popup is None:
+            self.popup = tk.Toplevel(self.entry)
+            self.popup.wm_overrideredirect(True)
+            self.listbox = tk.Listbox(self.popup, exportselection=False, activestyle='dotbox')
+            self.listbox.pack(fill=tk.BOTH, expand=True)
+            self.listbox.bind('<ButtonRelease-1>', self._choose)
+            self.listbox.bind('<Return>', self._choose)
+            self.listbox.bind('<Escape>', lambda e: (self.hide(), self.entry.focus_set()))
+            self.listbox.bind('<FocusOut>', lambda e: self.entry.after(150, self._hide_unless_focused))
+        self.listbox.delete(0, tk.END)
+        for name in matches:
+            self.listbox.insert(tk.END, name)
+        self.listbox.config(height=len(matches))
+        x = self.entry.winfo_rootx()
+        y = self.entry.winfo_rooty() + self.entry.winfo_height()
+        self.popup.geometry(f"{max(self.entry.winfo_width(), 150)}x{self.listbox.winfo_reqheight()}+{x}+{y}")
+        self.popup.deiconify()
+        self.popup.lift()
+    
+    def _enter_list(self, event=None):
+        """Move keyboard focus into the suggestions"""
+        if self.popup is None or not self.popup.winfo_viewable():
+            return None
+        self.listbox.focus_set()
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(0)
+        self.listbox.activate(0)
+        return 'break'
+    
+    def _choose(self, event=None):
+        """Put the selected suggestion in the entry"""
+        selection = self.listbox.curselection()
+        if selection:
+            self.entry.delete(0, tk.END)
+            self.entry.insert(0, self.listbox.get(selection[0]))
+            self.entry.icursor(tk.END)
+        self.hide()
+        self.entry.focus_set()
+    
+    def _hide_unless_focused(self):
+        """Close the list once focus has left both the entry and the list"""
+        try:
+            focus = self.entry.focus_get()
+        except (KeyError, tk.TclError):
+            focus = None
+        if focus not in (self.entry, self.listbox):
+            self.hide()
+    
+    def hide(self, event=None):
+        """Close the suggestion list"""
+        if self.popup is not None:
+            self.popup.withdraw()
+
+
 class FileSelectionDialog(tk.Toplevel):
     """Dialog to select config files before opening settings editor"""
     
@@ -6981,6 +8584,8 @@ class RawFileViewer(tk.Toplevel):
 
 
 if __name__ == "__main__":
+    # Log search workers re-run this file (or the frozen .exe) as children
+    multiprocessing.freeze_support()
     import tkinter.simpledialog
     app = PZServerAdmin()
     app.mainloop()
@@ -5,9 +5,6 @@ A comprehensive GUI tool for managing Project Zomboid servers
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, font
-import socket
-import struct
-import threading
 import time
 import sqlite3
 import os
@@ -17,157 +14,7 @@ import subprocess
 import webbrowser
 from pathlib import Path
 from datetime import datetime
-
-
-class RCONClient:
-    """RCON client for communicating with Project Zomboid server"""
-    
-    SERVERDATA_AUTH = 3
-    SERVERDATA_AUTH_RESPONSE = 2
-    SERVERDATA_EXECCOMMAND = 2
-    SERVERDATA_RESPONSE_VALUE = 0
-    
-    def __init__(self, host, port, password):
-        self.host = host
-        self.port = port
-        self.password = password
-        self.sock = None
-        self.request_id = 0
-        self.authenticated = False
-        
-    def connect(self):
-        """Establish connection to RCON server and authenticate"""
-        try:
-            
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.settimeout(10)
-            self.sock.connect((self.host, self.port))
-            
-            # Authenticate
-            self.request_id += 1
-            auth_id = self.request_id
-            
-            # CRITICAL: Body needs password + 2 null terminators (not 1!)
-            auth_body = self.password.encode('utf-8')
-            packet_data = auth_body + b'\x00\x00'  # Two null terminators
-            packet_size = 4 + 4 + len(packet_data)  # id + type + data
-            
-            packet = struct.pack('<i', packet_size)   # size
-            packet += struct.pack('<i', auth_id)      # id  
-            packet += struct.pack('<i', self.SERVERDATA_AUTH)  # type
-            packet += packet_data
-            
-            
-            self.sock.sendall(packet)
-            
-            # Read first packet (might be empty SERVERDATA_RESPONSE_VALUE)
-            size_data = self._recv_all(4)
-            if not size_data:
-                raise Exception("Auth failed - no response")
-            
-            response_size = struct.unpack('<i', size_data)[0]
-            response_data = self._recv_all(response_size)
-            
-            if not response_data or len(response_data) < 8:
-                raise Exception("Auth failed - incomplete response")
-            
-            first_packet_type = struct.unpack('<i', response_data[4:8])[0]
-            
-            # If first packet is empty response (type 0), read the auth response
-            if first_packet_type == self.SERVERDATA_RESPONSE_VALUE:
-                size_data = self._recv_all(4)
-                if not size_data:
-                    raise Exception("Auth failed - no auth response")
-                
-                response_size = struct.unpack('<i', size_data)[0]
-                response_data = self._recv_all(response_size)
-                
-                if not response_data or len(response_data) < 4:
-                    raise Exception("Auth failed - incomplete auth response")
-            
-            # Check auth result
-            response_id = struct.unpack('<i', response_data[:4])[0]
-            if response_id == -1:
-                raise Exception("Authentication failed - wrong password")
-            
-            self.authenticated = True
-            return True
-            
-        except socket.timeout:
-            raise Exception("Connection timed out - check host and port")
-        except ConnectionRefusedError:
-            raise Exception("Connection refused - is RCON enabled and server running?")
-        except Exception as e:
-            if self.sock:
-                self.sock.close()
-                self.sock = None
-            raise
-    
-    def disconnect(self):
-        """Close RCON connection"""
-        if self.sock:
-            try:
-                self.sock.close()
-            except (OSError, socket.error):
-                pass  # Socket already closed, ignore
-            self.sock = None
-            self.authenticated = False
-    
-    def execute_command(self, command):
-        """Execute a command on the server using existing connection"""
-        if not self.sock or not self.authenticated:
-            raise Exception("Not connected to server")
-        
-        try:
-            # Send command
-            self.request_id += 1
-            cmd_id = self.request_id
-            
-            # Build command packet with 2 null terminators
-            cmd_body = command.encode('utf-8')
-            packet_data = cmd_body + b'\x00\x00'
-            packet_size = 4 + 4 + len(packet_data)
-            
-            packet = struct.pack('<i', packet_size)
-            packet += struct.pack('<i', cmd_id)
-            packet += struct.pack('<i', self.SERVERDATA_EXECCOMMAND)
-            packet += packet_data
-            
-            self.sock.sendall(packet)
-            
-            # Read response
-            response_text = ""
-            
-            size_data = self._recv_all(4)
-            if size_data:
-                response_size = struct.unpack('<i', size_data)[0]
-                response_data = self._recv_all(response_size)
-                
-                if response_data and len(response_data) >= 8:
-                    response_text = response_data[8:].rstrip(b'\x00').decode('utf-8', errors='ignore')
-            
-            return response_text
-            
-        except (BrokenPipeError, ConnectionResetError):
-            self.authenticated = False
-            raise Exception("Connection lost - please reconnect")
-        except socket.timeout:
-            raise Exception("Command timed out")
-        except Exception as e:
-            raise Exception(f"Command failed: {str(e)}")
-    
-    def _recv_all(self, n):
-        """Receive exactly n bytes from socket"""
-        data = b''
-        while len(data) < n:
-            try:
-                chunk = self.sock.recv(n - len(data))
-                if not chunk:
-                    return None
-                data += chunk
-            except socket.error:
-                return None
-        return data
+from rcon import RCONClient
 
 
 class PZServerAdmin(tk.Tk):
@@ -1689,8 +1536,10 @@ Screen:
                         self.rcon.execute_command('servermsg "Server restarting in 30 seconds!"')
                         status_label.config(text="⚠️ 30 second warning sent")
                         warnings_sent.add('30sec')
-                except Exception:
-                    pass  # Continue countdown even if message fails
+                except Exception as e:
+                    # Continue countdown even if message fails, but say so
+                    status_label.config(text=f"❌ Warning not delivered: {e}")
+                    self.log_command_output(f"⚠️ Restart warning failed: {e}")
             
             # Countdown complete
             if self.restart_time_remaining <= 0:
@@ -1,21 +1,337 @@
 """RCON client module extracted from the main UI file.
-Provides `RCONClient` for communicating with Project Zomboid RCON.
+Provides `RCONClient` for communicating with Project Zomboid RCON,
+`RCONConnectionPool` for sharing several authenticated sessions between
+callers, `ResilientRCONSession` for riding out server restarts,
+`RCONResponseCache` for answering repeated read-only commands from memory,
+`RCONWorker` for running commands off the GUI thread, `RCONFleet` for
+managing connections to several servers at once, and
+`AsyncRCONClient` for driving many servers from a single asyncio loop.
+`LatencyTracker` keeps per-command latency histograms that the clients use
+to derive adaptive command timeouts, and `RCONRateLimiter` paces outgoing
+commands by priority class.
 """
+import asyncio
+import bisect
+import heapq
+import itertools
+import queue
+import select
 import socket
-import struct
 import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from rcon_codec import (PacketReader, encode_packet, encode_batch, decode_packet,
+                        SIZE, MAX_PACKET_SIZE)
 
 # Set up logger for RCON operations
 logger = logging.getLogger(__name__)
 
 
+class RCONConnectionError(Exception):
+    """The connection is unusable (refused, timed out, closed or never opened).
+    
+    Raised instead of a plain Exception for transport failures so callers can
+    tell them apart from rejected passwords and command errors.
+    """
+
+
+# Priority classes for pacing and queueing, most urgent first
+PRIORITY_URGENT = 0        # restart warnings, kicks and bans
+PRIORITY_INTERACTIVE = 1   # commands an admin is waiting on
+PRIORITY_BULK = 2          # bulk actions and scheduled announcements
+PRIORITY_NAMES = {
+    PRIORITY_URGENT: 'urgent',
+    PRIORITY_INTERACTIVE: 'interactive',
+    PRIORITY_BULK: 'bulk',
+}
+
+
+def command_verb(command):
+    """Lower-cased first word of a command ('' for a blank command)."""
+    parts = command.split(None, 1)
+    return parts[0].lower() if parts else ''
+
+
+class LatencyTracker:
+    """Rolling per-command latency samples and the timeouts derived from them.
+    
+    The last `window` round-trip times are kept for every command verb
+    (`players`, `save`, ...). Percentiles and a bucketed histogram are
+    computed on demand, and `timeout_for` turns a verb's p99 into a command
+    timeout so a hung command is noticed in seconds rather than after a
+    fixed worst-case wait, while verbs that are legitimately slow
+    (`save` on a large map) get proportionally more time.
+    
+    One tracker may be shared by several clients (the pool does this), so
+    all methods are thread-safe.
+    """
+    
+    # Upper bucket bounds in seconds; a final open bucket catches the rest
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    
+    def __init__(self, window=500, min_samples=20, multiplier=3,
+                 floor=2.0, ceiling=60.0, default_timeout=10.0):
+        """Initialize the tracker.
+        
+        Args:
+            window (int): Samples kept per verb
+            min_samples (int): Samples needed before the timeout adapts
+            multiplier (float): Timeout as a multiple of the verb's p99
+            floor (float): Shortest adaptive timeout in seconds
+            ceiling (float): Longest adaptive timeout in seconds
+            default_timeout (float): Timeout while a verb has too few samples
+        """
+        self.window = max(1, window)
+        self.min_samples = max(1, min_samples)
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+        self.default_timeout = default_timeout
+        
+        self._lock = threading.Lock()
+        self._samples = {}    # verb -> deque of recent seconds
+        self._counts = {}     # verb -> samples recorded since start
+    
+    def record(self, verb, seconds):
+        """Add one round-trip time for a verb.
+        
+        Args:
+            verb (str): Command verb (see `command_verb`)
+            seconds (float): Time from send to complete reply
+        """
+        with self._lock:
+            samples = self._samples.get(verb)
+            if samples is None:
+                samples = self._samples[verb] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._counts[verb] = self._counts.get(verb, 0) + 1
+    
+    def percentile(self, verb, pct):
+        """Nearest-rank percentile of a verb's recent samples.
+        
+        Args:
+            verb (str): Command verb
+            pct (float): Percentile, 0-100
+            
+        Returns:
+            float: Latency in seconds, or None if the verb has no samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(verb, ()))
+        return self._percentile(samples, pct)
+    
+    def timeout_for(self, verb):
+        """Seconds to wait for a verb's reply before treating it as hung.
+        
+        Args:
+            verb (str): Command verb
+            
+        Returns:
+            float: `multiplier` x p99 clamped to [floor, ceiling] once the verb
+            has `min_samples` samples, otherwise `default_timeout`
+        """
+        with self._lock:
+            samples = self._samples.get(verb, ())
+            if len(samples) < self.min_samples:
+                return self.default_timeout
+            samples = sorted(samples)
+        return self._adaptive_timeout(samples)
+    
+    def snapshot(self):
+        """Summary of every verb seen so far.
+        
+        Returns:
+            dict: verb -> dict with `count` (all-time samples), `samples`
+            (in the window), `p50`, `p95`, `p99` and `max` in seconds,
+            `timeout` (current value of `timeout_for`) and `histogram`, a
+            list of (upper bound in seconds or None for the open bucket,
+            count) pairs over the window
+        """
+        with self._lock:
+            data = {verb: (self._counts[verb], sorted(samples))
+                    for verb, samples in self._samples.items()}
+        
+        summary = {}
+        for verb, (count, samples) in data.items():
+            histogram = [0] * (len(self.BUCKETS) + 1)
+            for value in samples:
+                histogram[bisect.bisect_left(self.BUCKETS, value)] += 1
+            if len(samples) < self.min_samples:
+                timeout = self.default_timeout
+            else:
+                timeout = self._adaptive_timeout(samples)
+            summary[verb] = {
+                'count': count,
+                'samples': len(samples),
+                'p50': self._percentile(samples, 50),
+                'p95': self._percentile(samples, 95),
+                'p99': self._percentile(samples, 99),
+                'max': samples[-1] if samples else None,
+                'timeout': timeout,
+                'histogram': list(zip(self.BUCKETS + (None,), histogram)),
+            }
+        return summary
+    
+    def reset(self):
+        """Forget all samples (e.g. after switching servers)."""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+    
+    def _adaptive_timeout(self, sorted_samples):
+        """Clamp multiplier x p99 of already sorted samples to [floor, ceiling]."""
+        p99 = self._percentile(sorted_samples, 99)
+        return min(self.ceiling, max(self.floor, p99 * self.multiplier))
+    
+    @staticmethod
+    def _percentile(sorted_samples, pct):
+        """Nearest-rank percentile of an already sorted list (None if empty)."""
+        if not sorted_samples:
+            return None
+        rank = max(1, int(round(pct / 100.0 * len(sorted_samples))))
+        return sorted_samples[min(rank, len(sorted_samples)) - 1]
+
+
+class RCONRateLimiter:
+    """Token bucket that paces commands sent to one server, by priority.
+    
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second; each command costs one token. When the bucket runs dry callers
+    queue, and tokens go to the most urgent waiter first (then in arrival
+    order), so a restart warning or kick submitted during a bulk unban
+    jumps straight to the front instead of waiting for the batch.
+    
+    A rate of 0 disables pacing; callers are still counted.
+    """
+    
+    def __init__(self, rate=20, burst=40):
+        """Initialize the limiter with a full bucket.
+        
+        Args:
+            rate (float): Commands per second, sustained (0 = unlimited)
+            burst (int): Commands that may be sent back to back
+        """
+        self.rate = max(0.0, float(rate))
+        self.burst = max(1, int(burst))
+        
+        self._cond = threading.Condition()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._waiters = []               # heap of (priority, seq)
+        self._seq = itertools.count()
+        self._counters = {p: self._new_counters() for p in PRIORITY_NAMES}
+    
+    def configure(self, rate=None, burst=None):
+        """Change the rate and/or burst size; takes effect for waiting callers too.
+        
+        Args:
+            rate (float): Commands per second (0 = unlimited)
+            burst (int): Bucket size
+        """
+        with self._cond:
+            self._refill()
+            if rate is not None:
+                self.rate = max(0.0, float(rate))
+            if burst is not None:
+                self.burst = max(1, int(burst))
+                self._tokens = min(self._tokens, self.burst)
+            self._cond.notify_all()
+    
+    def acquire(self, priority=PRIORITY_INTERACTIVE, tokens=1):
+        """Block until `tokens` commands may be sent.
+        
+        Args:
+            priority (int): PRIORITY_URGENT, PRIORITY_INTERACTIVE or PRIORITY_BULK
+            tokens (int): Commands about to be sent (capped at `burst`)
+            
+        Returns:
+            float: Seconds spent waiting
+        """
+        start = time.monotonic()
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._waiters, entry)
+            # Wake the current head so it notices it has been overtaken
+            self._cond.notify_all()
+            try:
+                while True:
+                    self._refill()
+                    needed = min(tokens, self.burst)
+                    if self._waiters[0] == entry:
+                        if not self.rate:
+                            break
+                        if self._tokens >= needed:
+                            self._tokens -= needed
+                            break
+                        self._cond.wait((needed - self._tokens) / self.rate)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+            
+            waited = time.monotonic() - start
+            counters = self._counters.setdefault(priority, self._new_counters())
+            counters['calls'] += 1
+            counters['granted'] += tokens
+            counters['total_wait'] += waited
+            counters['max_wait'] = max(counters['max_wait'], waited)
+        if waited > 1:
+            logger.debug("RCON %s traffic waited %.1fs for rate limit",
+                         PRIORITY_NAMES.get(priority, priority), waited)
+        return waited
+    
+    def stats(self):
+        """Snapshot of the bucket and of each priority class.
+        
+        Returns:
+            dict: rate, burst, tokens (currently available), waiting (total
+            callers queued) and classes, mapping each class name to its
+            `waiting` callers, `granted` commands and `avg_wait`/`max_wait`
+            in seconds
+        """
+        with self._cond:
+            self._refill()
+            classes = {}
+            for priority, counters in sorted(self._counters.items()):
+                calls = counters['calls']
+                classes[PRIORITY_NAMES.get(priority, str(priority))] = {
+                    'waiting': sum(1 for p, _ in self._waiters if p == priority),
+                    'granted': counters['granted'],
+                    'avg_wait': counters['total_wait'] / calls if calls else 0.0,
+                    'max_wait': counters['max_wait'],
+                }
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'tokens': self._tokens,
+                'waiting': len(self._waiters),
+                'classes': classes,
+            }
+    
+    @staticmethod
+    def _new_counters():
+        return {'calls': 0, 'granted': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+    
+    def _refill(self):
+        """Add the tokens earned since the last refill (call with `_cond` held)."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
 class RCONClient:
     """RCON client for communicating with Project Zomboid server.
     
     Implements the RCON (Remote Console) protocol as used by Source engine and
     Project Zomboid. The protocol uses TCP sockets with a binary packet format.
     
-    Packet Structure:
+    Packet Structure (encoded/decoded by rcon_codec):
         All multi-byte integers are little-endian.
         - Size (4 bytes): total bytes in packet (id + type + body)
         - ID (4 bytes): request/response id for pairing
@@ -31,6 +347,31 @@ class RCONClient:
         6. Server responds with RESPONSE_VALUE packets
         7. Client calls disconnect to close
     
+    Pipelining:
+        Responses echo the request id, so several EXECCOMMAND packets may be
+        in flight on one socket. `send_command` / `read_response` split the
+        round trip and `execute_pipelined` runs a whole batch in roughly one
+        round trip instead of one per command.
+    
+    Timeouts:
+        Each `execute_command` waits for its reply for as long as the
+        `latency` tracker allows for that command verb (see
+        `LatencyTracker.timeout_for`), rather than a fixed ten seconds, so
+        a hung command fails fast while slow verbs still get enough time.
+    
+    Multi-packet responses:
+        Long replies may be split over several RESPONSE_VALUE packets with the
+        same id. Each command is followed by an empty RESPONSE_VALUE sentinel;
+        the server answers commands in order, so the sentinel's mirror marks
+        the end of the reply (PZ runs commands on its main thread, so a
+        mirror that overtakes the reply ends it at its first packet).
+        `iter_response` yields chunks as they arrive.
+        Whether the server mirrors sentinels is learned from the first
+        replies, without a probe round trip: a mirrored sentinel turns
+        reassembly on, and a reply that overtakes an unanswered sentinel
+        turns it off (every reply is then read as a single packet). Until
+        then a reply ends at its first packet unless that packet is full.
+    
     Critical Notes:
         - Packets always end with exactly 2 null bytes, not 1
         - SERVERDATA_EXECCOMMAND and SERVERDATA_AUTH_RESPONSE both use type value 2
@@ -42,13 +383,27 @@ class RCONClient:
     SERVERDATA_EXECCOMMAND = 2
     SERVERDATA_RESPONSE_VALUE = 0
     
-    def __init__(self, host, port, password):
+    # Maximum EXECCOMMAND packets in flight during execute_pipelined
+    PIPELINE_WINDOW = 32
+    
+    # Reply bodies of at least this many bytes may be continued in another
+    # packet (Source-style servers split replies into 4096-byte packets)
+    FULL_PACKET_BODY = 4000
+    
+    # Socket timeout for connecting, and the reply timeout for batches
+    DEFAULT_TIMEOUT = 10
+    
+    def __init__(self, host, port, password, multi_packet=None, latency=None):
         """Initialize RCON client.
         
         Args:
             host (str): Server hostname or IP address
             port (int): RCON port (typically 16261)
             password (str): RCON password (not trimmed; spaces are intentional)
+            multi_packet (bool): Use sentinel packets to reassemble split
+                replies; None learns it from the first replies
+            latency (LatencyTracker): Where to record round-trip times and
+                take command timeouts from; a private tracker by default
         """
         self.host = host
         self.port = port
@@ -56,6 +411,23 @@ class RCONClient:
         self.sock = None
         self.request_id = 0
         self.authenticated = False
+        self.multi_packet = multi_packet
+        self.latency = latency or LatencyTracker(default_timeout=self.DEFAULT_TIMEOUT)
+        
+        # Pipelining state: chunks received per in-flight id, ids whose reply
+        # is complete, and sentinel id -> command id
+        self._send_lock = threading.Lock()
+        self._recv_lock = threading.Lock()
+        self._pending = {}
+        self._complete = set()
+        self._sentinels = {}
+        # Ids that have had a reply packet, and ids whose sentinel came back
+        # before any of their reply did
+        self._answered = set()
+        self._echoed = set()
+        # Sentinel ids sent while multi_packet is still unknown
+        self._probe_ids = set()
+        self._packet_reader = PacketReader()
         
     def connect(self):
         """Establish connection to RCON server and authenticate.
@@ -70,54 +442,36 @@ class RCONClient:
         Raises:
             Exception: If connection fails, times out, or authentication is rejected
         """
+        self._packet_reader.reset()
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.settimeout(10)
+            self.sock.settimeout(self.DEFAULT_TIMEOUT)
+            # Pipelined commands are small back-to-back writes; don't let
+            # Nagle hold them until the previous reply's ACK
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.sock.connect((self.host, self.port))
             
             # Authenticate
             self.request_id += 1
             auth_id = self.request_id
             
-            # CRITICAL: Body needs password + 2 null terminators (not 1!)
-            auth_body = self.password.encode('utf-8')
-            packet_data = auth_body + b'\x00\x00'  # Two null terminators
-            packet_size = 4 + 4 + len(packet_data)  # id + type + data
-            
-            packet = struct.pack('<i', packet_size)   # size
-            packet += struct.pack('<i', auth_id)      # id  
-            packet += struct.pack('<i', self.SERVERDATA_AUTH)  # type
-            packet += packet_data
-            
-            self.sock.sendall(packet)
+            # CRITICAL: Body needs password + 2 null terminators (not 1!);
+            # encode_packet appends them
+            self.sock.sendall(encode_packet(auth_id, self.SERVERDATA_AUTH, self.password))
             
             # Read first packet (might be empty SERVERDATA_RESPONSE_VALUE)
-            size_data = self._recv_all(4)
-            if not size_data:
+            response = self._read_packet()
+            if not response:
                 raise Exception("Auth failed - no response")
             
-            response_size = struct.unpack('<i', size_data)[0]
-            response_data = self._recv_all(response_size)
-            
-            if not response_data or len(response_data) < 8:
-                raise Exception("Auth failed - incomplete response")
-            
-            first_packet_type = struct.unpack('<i', response_data[4:8])[0]
-            
             # If first packet is empty response (type 0), read the auth response
-            if first_packet_type == self.SERVERDATA_RESPONSE_VALUE:
-                size_data = self._recv_all(4)
-                if not size_data:
+            if response[1] == self.SERVERDATA_RESPONSE_VALUE:
+                response = self._read_packet()
+                if not response:
                     raise Exception("Auth failed - no auth response")
-                
-                response_size = struct.unpack('<i', size_data)[0]
-                response_data = self._recv_all(response_size)
-                
-                if not response_data or len(response_data) < 4:
-                    raise Exception("Auth failed - incomplete auth response")
             
             # Check auth result
-            response_id = struct.unpack('<i', response_data[:4])[0]
+            response_id = response[0]
             if response_id == -1:
                 raise Exception("Authentication failed - wrong password")
             
@@ -126,17 +480,18 @@ class RCONClient:
             
         except socket.timeout:
             logger.error("RCON connection timed out to %s:%d", self.host, self.port)
-            raise Exception("Connection timed out - check host and port")
+            self._close_failed_socket()
+            raise RCONConnectionError("Connection timed out - check host and port")
         except ConnectionRefusedError:
             logger.error("RCON connection refused to %s:%d - is RCON enabled?", self.host, self.port)
-            raise Exception("Connection refused - is RCON enabled and server running?")
+            self._close_failed_socket()
+            raise RCONConnectionError("Connection refused - is RCON enabled and server running?")
+        except OSError as e:
+            logger.error("RCON connection to %s:%d failed: %s", self.host, self.port, e)
+            self._close_failed_socket()
+            raise RCONConnectionError(f"Connection failed: {e}")
         except Exception:
-            if self.sock:
-                try:
-                    self.sock.close()
-                except Exception as e:
-                    logger.debug("Error closing socket during auth failure: %s", e)
-                self.sock = None
+            self._close_failed_socket()
             raise
     
     def disconnect(self):
@@ -149,16 +504,26 @@ class RCONClient:
                 logger.debug("Error closing RCON socket: %s", e)
             self.sock = None
             self.authenticated = False
+        self._pending.clear()
+        self._complete.clear()
+        self._sentinels.clear()
+        self._answered.clear()
+        self._echoed.clear()
+        self._probe_ids.clear()
     
-    def execute_command(self, command):
+    def execute_command(self, command, priority=None):
         """Execute a command on the server using existing connection.
         
         Sends an EXECCOMMAND packet and waits for the server's response.
         The command string is encoded as UTF-8 and padded with 2 null bytes
-        per RCON protocol.
+        per RCON protocol. The round-trip time is recorded in `latency`, and
+        the wait is bounded by the adaptive timeout for the command's verb.
         
         Args:
             command (str): RCON command to execute (e.g. 'players', 'save')
+            priority (int): Accepted so a bare client can stand in for a
+                pool (e.g. behind `RCONWorker`); a single session has no
+                lanes or pacing, so it is ignored
             
         Returns:
             str: Command output (empty string if no response body)
@@ -167,54 +532,465 @@ class RCONClient:
             Exception: If not connected, socket errors, or timeouts occur
         """
         if not self.sock or not self.authenticated:
-            raise Exception("Not connected to server")
+            raise RCONConnectionError("Not connected to server")
         
+        verb = command_verb(command)
+        timeout = self.latency.timeout_for(verb)
+        start = time.monotonic()
         try:
-            # Send command
-            self.request_id += 1
-            cmd_id = self.request_id
+            cmd_id = self.send_command(command)
+            response = self.read_response(cmd_id, timeout=timeout)
+            self.latency.record(verb, time.monotonic() - start)
+            return response
+            
+        except (BrokenPipeError, ConnectionResetError):
+            logger.error("RCON connection lost while executing command")
+            self.authenticated = False
+            raise RCONConnectionError("Connection lost - please reconnect")
+        except socket.timeout:
+            # Count the wait so a verb that keeps timing out earns more time
+            self.latency.record(verb, time.monotonic() - start)
+            logger.error("RCON command '%s' timed out after %.1fs", verb, timeout)
+            raise Exception("Command timed out")
+        except RCONConnectionError:
+            raise
+        except Exception as e:
+            logger.error("RCON command failed: %s", e)
+            raise Exception(f"Command failed: {str(e)}")
+    
+    def execute_pipelined(self, commands, window=None):
+        """Execute several commands with their packets in flight together.
+        
+        Up to `window` EXECCOMMAND packets are written in a single send before
+        the first reply is read; each reply is matched back to its command by
+        request id. A batch of N commands therefore costs about one network
+        round trip instead of N.
+        
+        Args:
+            commands (iterable of str): RCON commands to execute, in order
+            window (int): Maximum packets in flight (default PIPELINE_WINDOW)
             
-            # Build command packet with 2 null terminators
-            cmd_body = command.encode('utf-8')
-            packet_data = cmd_body + b'\x00\x00'
-            packet_size = 4 + 4 + len(packet_data)
+        Returns:
+            list of str: Responses in the same order as `commands`
+            
+        Raises:
+            Exception: If not connected, socket errors, or timeouts occur
+        """
+        if not self.sock or not self.authenticated:
+            raise RCONConnectionError("Not connected to server")
+        
+        commands = list(commands)
+        window = max(1, window or self.PIPELINE_WINDOW)
+        results = [""] * len(commands)
+        in_flight = deque()
+        next_index = 0
+        
+        try:
+            while next_index < len(commands) or in_flight:
+                # Top up the window with one write for all new packets
+                batch = []
+                with self._send_lock:
+                    while next_index < len(commands) and len(in_flight) < window:
+                        cmd_id = self._queue_command(commands[next_index], batch)
+                        in_flight.append((next_index, cmd_id))
+                        next_index += 1
+                    if batch:
+                        self.sock.sendall(encode_batch(batch))
+                
+                index, cmd_id = in_flight.popleft()
+                results[index] = self.read_response(cmd_id)
             
-            packet = struct.pack('<i', packet_size)
-            packet += struct.pack('<i', cmd_id)
-            packet += struct.pack('<i', self.SERVERDATA_EXECCOMMAND)
-            packet += packet_data
+            return results
             
-            self.sock.sendall(packet)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.error("RCON connection lost during pipelined batch")
+            self.authenticated = False
+            raise RCONConnectionError("Connection lost - please reconnect")
+        except socket.timeout:
+            logger.error("RCON pipelined batch timed out")
+            raise Exception("Command timed out")
+        except RCONConnectionError:
+            raise
+        except Exception as e:
+            logger.error("RCON pipelined batch failed: %s", e)
+            raise Exception(f"Command failed: {str(e)}")
+    
+    def execute_many(self, commands, window=None, progress=None):
+        """Execute a batch of commands, reporting each one's outcome and timing.
+        
+        Commands are pipelined like `execute_pipelined`, but instead of
+        raising on the first failure every command gets its own result. If the
+        connection fails part way, the commands already answered keep their
+        responses and the rest carry the error.
+        
+        Args:
+            commands (iterable of str): RCON commands to execute, in order
+            window (int): Maximum packets in flight (default PIPELINE_WINDOW)
+            progress (callable): Called as progress(done, total) after each
+                reply; runs on the calling thread
             
-            # Read response
-            response_text = ""
+        Returns:
+            list of dict: One per command, in order, with keys `command`,
+            `response` (str or None), `error` (str or None) and `elapsed`
+            (seconds from send to complete reply, or None)
             
-            size_data = self._recv_all(4)
-            if size_data:
-                response_size = struct.unpack('<i', size_data)[0]
-                response_data = self._recv_all(response_size)
+        Raises:
+            Exception: If not connected
+        """
+        if not self.sock or not self.authenticated:
+            raise RCONConnectionError("Not connected to server")
+        
+        commands = list(commands)
+        window = max(1, window or self.PIPELINE_WINDOW)
+        results = [{'command': cmd, 'response': None, 'error': None, 'elapsed': None}
+                   for cmd in commands]
+        in_flight = deque()
+        sent_at = {}
+        next_index = 0
+        done = 0
+        
+        try:
+            while next_index < len(commands) or in_flight:
+                batch = []
+                with self._send_lock:
+                    first_new = next_index
+                    while next_index < len(commands) and len(in_flight) < window:
+                        cmd_id = self._queue_command(commands[next_index], batch)
+                        in_flight.append((next_index, cmd_id))
+                        next_index += 1
+                    if batch:
+                        self.sock.sendall(encode_batch(batch))
+                        now = time.monotonic()
+                        for index in range(first_new, next_index):
+                            sent_at[index] = now
                 
-                if response_data and len(response_data) >= 8:
-                    response_text = response_data[8:].rstrip(b'\x00').decode('utf-8', errors='ignore')
+                index, cmd_id = in_flight[0]
+                results[index]['response'] = self.read_response(cmd_id)
+                results[index]['elapsed'] = time.monotonic() - sent_at[index]
+                in_flight.popleft()
+                done += 1
+                if progress:
+                    progress(done, len(commands))
+            
+        except (BrokenPipeError, ConnectionResetError):
+            logger.error("RCON connection lost during batch")
+            self.authenticated = False
+            self._fail_remaining(results, in_flight, "Connection lost - please reconnect")
+        except socket.timeout:
+            logger.error("RCON batch timed out")
+            self._fail_remaining(results, in_flight, "Command timed out")
+        except Exception as e:
+            logger.error("RCON batch failed: %s", e)
+            self._fail_remaining(results, in_flight, f"Command failed: {str(e)}")
+        
+        if done < len(commands) and progress:
+            progress(len(commands), len(commands))
+        return results
+    
+    def iter_response(self, command):
+        """Execute a command and yield its output chunk by chunk.
+        
+        Each RESPONSE_VALUE packet is yielded as soon as it arrives, so long
+        outputs (`help`, `players` on a full server) can be shown while the
+        rest is still in transit. Stopping early still drains the remaining
+        packets so the socket stays in sync. The whole reply must arrive
+        within the command verb's adaptive timeout, as for `execute_command`.
+        
+        Args:
+            command (str): RCON command to execute
             
-            return response_text
+        Yields:
+            str: Response body of each packet, in order
             
+        Raises:
+            Exception: If not connected, the command cannot be sent, or the
+                reply (or its remainder) times out
+        """
+        verb = command_verb(command)
+        start = time.monotonic()
+        deadline = start + self.latency.timeout_for(verb)
+        try:
+            cmd_id = self.send_command(command)
         except (BrokenPipeError, ConnectionResetError):
             logger.error("RCON connection lost while executing command")
             self.authenticated = False
-            raise Exception("Connection lost - please reconnect")
+            raise RCONConnectionError("Connection lost - please reconnect")
         except socket.timeout:
             logger.error("RCON command timed out")
             raise Exception("Command timed out")
-        except Exception as e:
-            logger.error("RCON command failed: %s", e)
-            raise Exception(f"Command failed: {str(e)}")
+        
+        finished = False
+        received = False
+        try:
+            while True:
+                with self._recv_lock:
+                    chunks = self._pending.get(cmd_id, [])
+                    ready = chunks[:]
+                    del chunks[:]
+                    done = cmd_id in self._complete
+                    if not ready and not done:
+                        remaining = deadline - time.monotonic()
+                        packet = self._read_packet(remaining) if remaining > 0 else None
+                        if packet is not None:
+                            self._dispatch_packet(packet)
+                            continue
+                        if self._connection_dropped():
+                            finished = True
+                            self._forget(cmd_id)
+                            raise RCONConnectionError("Connection lost - please reconnect")
+                        if time.monotonic() < deadline:
+                            # Timed out mid-packet; re-check the deadline
+                            continue
+                        if received and self.multi_packet is None:
+                            # A full packet was never continued and its
+                            # sentinel never came back: the reply is whole
+                            self._sentinels_unsupported()
+                            done = True
+                        else:
+                            finished = True
+                            self._forget(cmd_id)
+                            self.latency.record(verb, time.monotonic() - start)
+                            logger.error("RCON command '%s' timed out while streaming", verb)
+                            raise Exception("Command timed out")
+                
+                received = received or bool(ready)
+                for chunk in ready:
+                    yield chunk
+                if done:
+                    finished = True
+                    with self._recv_lock:
+                        self._forget(cmd_id)
+                    self.latency.record(verb, time.monotonic() - start)
+                    return
+        finally:
+            if not finished:
+                try:
+                    self.read_response(cmd_id)
+                except (OSError, socket.timeout):
+                    pass
+    
+    def send_command(self, command):
+        """Send an EXECCOMMAND packet without waiting for the reply.
+        
+        When the server mirrors sentinels, an empty RESPONSE_VALUE packet is
+        sent in the same write to mark the end of the reply.
+        
+        Args:
+            command (str): RCON command to execute
+            
+        Returns:
+            int: Request id to pass to `read_response`
+            
+        Raises:
+            Exception: If not connected; socket errors propagate unchanged
+        """
+        if not self.sock or not self.authenticated:
+            raise RCONConnectionError("Not connected to server")
+        
+        with self._send_lock:
+            batch = []
+            cmd_id = self._queue_command(command, batch)
+            self.sock.sendall(encode_batch(batch))
+        return cmd_id
+    
+    def read_response(self, request_id, timeout=None):
+        """Wait for the complete reply to a previously sent command.
+        
+        Packets belonging to other in-flight requests are read off the socket
+        and kept until their own caller asks for them, so replies may be
+        collected in any order and from any thread. Split replies are
+        reassembled before returning.
+        
+        Args:
+            request_id (int): Id returned by `send_command`
+            timeout (float): Seconds to wait for the reply (default
+                DEFAULT_TIMEOUT)
+            
+        Returns:
+            str: Command output (empty string if no response body)
+            
+        Raises:
+            ConnectionResetError: If the server closed the connection first
+            socket.timeout: If the whole reply did not arrive before the
+                timeout
+        """
+        deadline = time.monotonic() + (self.DEFAULT_TIMEOUT if timeout is None else timeout)
+        while True:
+            with self._recv_lock:
+                if request_id in self._complete or request_id not in self._pending:
+                    return ''.join(self._forget(request_id))
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    received = self._forget(request_id)
+                    if not received or self.multi_packet is not None:
+                        # Part of a split reply is not a reply; callers
+                        # (and the response cache) must not take it as one
+                        raise socket.timeout("Command timed out")
+                    # A full packet was never continued and its sentinel
+                    # never came back: the reply is whole
+                    self._sentinels_unsupported()
+                    return ''.join(received)
+                
+                packet = self._read_packet(remaining)
+                if packet is None:
+                    if self._connection_dropped():
+                        self._forget(request_id)
+                        raise ConnectionResetError("Connection closed by server")
+                    # Timed out (possibly mid-packet); re-check the deadline
+                    continue
+                
+                self._dispatch_packet(packet)
+    
+    def latency_stats(self):
+        """Per-command latency summary (see `LatencyTracker.snapshot`)."""
+        return self.latency.snapshot()
+    
+    def _queue_command(self, command, batch):
+        """Allocate ids for a command, register it and append its packets.
+        
+        Must be called with `_send_lock` held.
+        
+        Args:
+            command (str): RCON command
+            batch (list): (id, type, body) tuples to pass to encode_batch
+            
+        Returns:
+            int: Command request id
+        """
+        self.request_id += 1
+        cmd_id = self.request_id
+        self._pending[cmd_id] = []
+        batch.append((cmd_id, self.SERVERDATA_EXECCOMMAND, command))
+        
+        if self.multi_packet is not False:
+            self.request_id += 1
+            self._sentinels[self.request_id] = cmd_id
+            if self.multi_packet is None:
+                self._probe_ids.add(self.request_id)
+            batch.append((self.request_id, self.SERVERDATA_RESPONSE_VALUE, ''))
+        return cmd_id
+    
+    def _dispatch_packet(self, packet):
+        """File an incoming packet under its request (call with `_recv_lock` held).
+        
+        Args:
+            packet (tuple): (id, type, body_text) from `_read_packet`
+        """
+        response_id, _, body = packet
+        if self.multi_packet is None:
+            self._learn_multi_packet(response_id)
+        if response_id in self._pending and response_id not in self._complete:
+            self._pending[response_id].append(body)
+            self._answered.add(response_id)
+            if response_id in self._echoed or self.multi_packet is False or (
+                    self.multi_packet is None
+                    and len(body.encode('utf-8')) < self.FULL_PACKET_BODY):
+                self._complete.add(response_id)
+        elif response_id in self._sentinels:
+            cmd_id = self._sentinels.pop(response_id)
+            if cmd_id in self._answered:
+                self._complete.add(cmd_id)
+            else:
+                # The server runs commands on its main thread, so the echo
+                # can overtake the reply; the reply's first packet ends it
+                self._echoed.add(cmd_id)
+        else:
+            # Includes the trailing packet Source-style servers send after
+            # mirroring a sentinel
+            logger.debug("Dropping unsolicited RCON packet id=%d", response_id)
+    
+    def _fail_remaining(self, results, in_flight, error):
+        """Mark unanswered batch results as failed and drop their pending state.
+        
+        Args:
+            results (list of dict): Results from `execute_many`
+            in_flight (deque): (index, request id) pairs still awaiting replies
+            error (str): Error message for every unanswered command
+        """
+        for result in results:
+            if result['response'] is None:
+                result['error'] = error
+        with self._recv_lock:
+            for _, cmd_id in in_flight:
+                self._forget(cmd_id)
+    
+    def _forget(self, request_id):
+        """Drop all state for a request (call with `_recv_lock` held).
+        
+        Returns:
+            list of str: Chunks received but not yet consumed
+        """
+        self._complete.discard(request_id)
+        self._answered.discard(request_id)
+        self._echoed.discard(request_id)
+        for sentinel_id, cmd_id in list(self._sentinels.items()):
+            if cmd_id == request_id:
+                del self._sentinels[sentinel_id]
+        return self._pending.pop(request_id, [])
+    
+    def _learn_multi_packet(self, response_id):
+        """Settle `multi_packet` from an incoming packet (call with `_recv_lock` held).
+        
+        The server answers in order, so a reply to a command sent after a
+        sentinel means that sentinel was dropped rather than mirrored.
+        
+        Args:
+            response_id (int): Id of the packet just read
+        """
+        if response_id in self._probe_ids:
+            self.multi_packet = True
+            self._probe_ids.clear()
+            logger.debug("RCON server %s:%d mirrors sentinel packets", self.host, self.port)
+        elif (response_id in self._pending and self._probe_ids
+              and min(self._probe_ids) < response_id):
+            self._sentinels_unsupported()
+    
+    def _sentinels_unsupported(self):
+        """Fall back to one packet per reply (call with `_recv_lock` held)."""
+        self.multi_packet = False
+        self._probe_ids.clear()
+        # Replies held back in case a full packet was continued are done
+        self._complete.update(self._answered)
+        logger.debug("RCON server %s:%d does not mirror sentinel packets", self.host, self.port)
+    
+    def _connection_dropped(self):
+        """Mark the session dead if the last read hit EOF or a socket error.
+        
+        Returns:
+            bool: True if the server closed the connection
+        """
+        if self._packet_reader.closed:
+            self.authenticated = False
+            return True
+        return False
+    
+    def _read_packet(self, timeout=None):
+        """Read one packet from the socket into the reusable receive buffer.
+        
+        Args:
+            timeout (float): Socket timeout for this read only; the socket's
+                current timeout if None
+        
+        Returns:
+            tuple: (id, type, body_text), or None if peer closes, the read
+            times out or socket error
+        """
+        if timeout is None:
+            return self._packet_reader.read_packet(self.sock)
+        self.sock.settimeout(timeout)
+        try:
+            return self._packet_reader.read_packet(self.sock)
+        finally:
+            if self.sock:
+                self.sock.settimeout(self.DEFAULT_TIMEOUT)
     
     def _recv_all(self, n):
         """Receive exactly n bytes from socket.
         
-        Handles partial reads and EOF. Retries receiving data until
-        exactly n bytes are accumulated or an error occurs.
+        Handles partial reads and EOF. Bytes are received with `recv_into`
+        into the client's reusable buffer and copied out once, rather than
+        accumulated chunk by chunk.
         
         Args:
             n (int): number of bytes to receive
@@ -222,13 +998,1471 @@ class RCONClient:
         Returns:
             bytes: Exactly n bytes, or None if peer closes or socket error
         """
-        data = b''
-        while len(data) < n:
+        view = self._packet_reader.recv_exact(self.sock, n)
+        if view is None:
+            return None
+        return bytes(view)
+    
+    def _close_failed_socket(self):
+        """Close the socket left over from a failed connect attempt."""
+        if self.sock:
+            try:
+                self.sock.close()
+            except Exception as e:
+                logger.debug("Error closing socket during auth failure: %s", e)
+            self.sock = None
+
+
+class RCONConnectionPool:
+    """Bounded pool of authenticated `RCONClient` sessions to one server.
+    
+    Callers lease a connection for the duration of a command so a slow reply
+    (`help`, a bulk unban) only ties up its own socket. Part of the pool is
+    reserved for urgent traffic such as restart warnings, which therefore
+    never queue behind ordinary commands.
+    
+    Connections are created lazily up to `size`, health-checked when handed
+    out, and silently replaced when found dead. The pool exposes the same
+    `execute_command` / `authenticated` / `disconnect` surface as
+    `RCONClient`, so it can be used wherever a single client was.
+    
+    With a `limiter`, every command is paced through it at the caller's
+    priority before a connection is leased; batches are sent in chunks so
+    more urgent traffic can cut in between them.
+    """
+    
+    def __init__(self, host, port, password, size=3, reserved=1,
+                 acquire_timeout=15, client_factory=None, limiter=None):
+        """Initialize the pool (no sockets are opened until `connect`).
+        
+        Args:
+            host (str): Server hostname or IP address
+            port (int): RCON port (typically 16261)
+            password (str): RCON password (not trimmed; spaces are intentional)
+            size (int): Maximum number of open connections
+            reserved (int): Connections only urgent callers may use
+            acquire_timeout (float): Seconds to wait for a free connection
+            client_factory (callable): Builds a client from (host, port, password);
+                defaults to `RCONClient`
+            limiter (RCONRateLimiter): Paces outgoing commands; None sends
+                them as fast as connections allow
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self.size = max(1, size)
+        self.reserved = min(max(0, reserved), self.size - 1)
+        self.acquire_timeout = acquire_timeout
+        self.client_factory = client_factory or RCONClient
+        self.limiter = limiter
+        
+        self._cond = threading.Condition()
+        self._idle = []
+        self._total = 0
+        self._closed = True
+        self.created_count = 0
+        self.discarded_count = 0
+        self._multi_packet = None
+        # Shared by every session so timeouts adapt from all traffic
+        self.latency = LatencyTracker(default_timeout=RCONClient.DEFAULT_TIMEOUT)
+    
+    @property
+    def authenticated(self):
+        """bool: True while the pool is open (dead sessions are recreated on demand)."""
+        return not self._closed
+    
+    def connect(self):
+        """Open the pool and authenticate the first session.
+        
+        Connecting eagerly surfaces wrong passwords and unreachable hosts
+        immediately instead of on the first command.
+        
+        Returns:
+            bool: True if authentication successful
+            
+        Raises:
+            Exception: If the first connection fails (same errors as `RCONClient.connect`)
+        """
+        with self._cond:
+            self._closed = False
+        try:
+            client = self._create_client()
+        except Exception:
+            with self._cond:
+                self._closed = True
+            raise
+        self.release(client)
+        return True
+    
+    def disconnect(self):
+        """Close every idle session; leased sessions close when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for client in idle:
+            client.disconnect()
+        logger.info("RCON pool for %s:%d closed", self.host, self.port)
+    
+    def acquire(self, urgent=False, timeout=None):
+        """Lease a healthy, authenticated client.
+        
+        Args:
+            urgent (bool): Allow use of the reserved connections
+            timeout (float): Seconds to wait (default `acquire_timeout`)
+            
+        Returns:
+            RCONClient: Client that must be handed back with `release`
+            
+        Raises:
+            Exception: If the pool is closed or no connection frees up in time
+        """
+        limit = self.size if urgent else self.size - self.reserved
+        deadline = time.monotonic() + (self.acquire_timeout if timeout is None else timeout)
+        
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RCONConnectionError("Not connected to server")
+                    if self._idle:
+                        client = self._idle.pop()
+                        break
+                    if self._total < limit:
+                        # Reserve the slot, then connect outside the lock
+                        self._total += 1
+                        client = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise Exception("No RCON connection available - server busy")
+                    self._cond.wait(remaining)
+            
+            if client is None:
+                try:
+                    return self._open_client()
+                except Exception:
+                    with self._cond:
+                        self._total -= 1
+                        self._cond.notify()
+                    raise
+            
+            if self._is_healthy(client):
+                return client
+            self._discard(client)
+    
+    def release(self, client, discard=False):
+        """Return a leased client to the pool.
+        
+        Args:
+            client (RCONClient): Client obtained from `acquire`
+            discard (bool): Close it instead of reusing it
+        """
+        if discard or not client.authenticated:
+            self._discard(client)
+            return
+        with self._cond:
+            if self._multi_packet is None:
+                self._multi_packet = getattr(client, 'multi_packet', None)
+            if self._closed:
+                self._total -= 1
+                close_now = True
+            else:
+                self._idle.append(client)
+                close_now = False
+            self._cond.notify()
+        if close_now:
+            client.disconnect()
+    
+    @contextmanager
+    def lease(self, urgent=False):
+        """Context manager around `acquire`/`release`.
+        
+        A client whose session died while leased is discarded on exit.
+        """
+        client = self.acquire(urgent=urgent)
+        try:
+            yield client
+        finally:
+            self.release(client)
+    
+    def execute_command(self, command, urgent=False, priority=None):
+        """Execute a command on a pooled connection.
+        
+        Args:
+            command (str): RCON command to execute
+            urgent (bool): Use the reserved connections if the others are busy
+            priority (int): Pacing class (see PRIORITY_NAMES); defaults to
+                PRIORITY_URGENT when urgent, else PRIORITY_INTERACTIVE.
+                PRIORITY_URGENT also implies urgent
+            
+        Returns:
+            str: Command output
+        """
+        priority = self._pace(urgent, priority, 1)
+        with self.lease(urgent=priority == PRIORITY_URGENT) as client:
+            return client.execute_command(command)
+    
+    def execute_pipelined(self, commands, window=None, urgent=False, priority=None):
+        """Run `RCONClient.execute_pipelined` on pooled connections, chunked by the limiter."""
+        results = []
+        for chunk, priority in self._paced_chunks(commands, window, urgent, priority):
+            with self.lease(urgent=priority == PRIORITY_URGENT) as client:
+                results.extend(client.execute_pipelined(chunk, window=window))
+        return results
+    
+    def execute_many(self, commands, window=None, progress=None, urgent=False,
+                     priority=None):
+        """Run `RCONClient.execute_many` on pooled connections, chunked by the limiter.
+        
+        If no connection can be had for a later chunk, its commands are
+        reported as failed rather than losing the results already collected.
+        """
+        commands = list(commands)
+        results = []
+        for chunk, priority in self._paced_chunks(commands, window, urgent, priority):
+            offset = len(results)
+            chunk_progress = None
+            if progress:
+                def chunk_progress(done, total, offset=offset):
+                    progress(offset + done, len(commands))
+            try:
+                with self.lease(urgent=priority == PRIORITY_URGENT) as client:
+                    results.extend(client.execute_many(chunk, window=window,
+                                                       progress=chunk_progress))
+            except Exception as e:
+                if not results:
+                    raise
+                results.extend({'command': cmd, 'response': None, 'error': str(e), 'elapsed': None}
+                               for cmd in commands[offset:])
+                if progress:
+                    progress(len(commands), len(commands))
+                break
+        return results
+    
+    def iter_response(self, command, urgent=False, priority=None):
+        """Run `RCONClient.iter_response`, holding the connection until exhausted."""
+        priority = self._pace(urgent, priority, 1)
+        with self.lease(urgent=priority == PRIORITY_URGENT) as client:
+            for chunk in client.iter_response(command):
+                yield chunk
+    
+    def stats(self):
+        """Snapshot of pool usage.
+        
+        Returns:
+            dict: open, idle, in_use, size, reserved, created and discarded counts
+        """
+        with self._cond:
+            return {
+                'open': self._total,
+                'idle': len(self._idle),
+                'in_use': self._total - len(self._idle),
+                'size': self.size,
+                'reserved': self.reserved,
+                'created': self.created_count,
+                'discarded': self.discarded_count,
+            }
+    
+    def latency_stats(self):
+        """Per-command latency summary for this server (see `LatencyTracker.snapshot`)."""
+        return self.latency.snapshot()
+    
+    def _pace(self, urgent, priority, count):
+        """Wait for the limiter to allow `count` commands; returns the resolved priority."""
+        if priority is None:
+            priority = PRIORITY_URGENT if urgent else PRIORITY_INTERACTIVE
+        if self.limiter:
+            self.limiter.acquire(priority, count)
+        return priority
+    
+    def _paced_chunks(self, commands, window, urgent, priority):
+        """Yield (chunk, priority) slices of a batch, each once the limiter allows it.
+        
+        Without a limiter the whole batch is one chunk.
+        """
+        commands = list(commands)
+        size = len(commands) or 1
+        if self.limiter:
+            size = max(1, min(window or RCONClient.PIPELINE_WINDOW, self.limiter.burst))
+        for start in range(0, len(commands), size):
+            chunk = commands[start:start + size]
+            yield chunk, self._pace(urgent, priority, len(chunk))
+    
+    def _create_client(self):
+        """Reserve a slot and open a new session (used by `connect`)."""
+        with self._cond:
+            self._total += 1
+        try:
+            return self._open_client()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+            raise
+    
+    def _open_client(self):
+        """Open and authenticate one session for an already reserved slot."""
+        client = self.client_factory(self.host, self.port, self.password)
+        if self._multi_packet is not None and getattr(client, 'multi_packet', None) is None:
+            # Reuse what another session learned; they all talk to the same server
+            client.multi_packet = self._multi_packet
+        if hasattr(client, 'latency'):
+            client.latency = self.latency
+        client.connect()
+        self.created_count += 1
+        logger.debug("RCON pool opened connection %d to %s:%d",
+                     self.created_count, self.host, self.port)
+        return client
+    
+    def _discard(self, client):
+        """Close a dead or unwanted session and free its slot."""
+        client.disconnect()
+        with self._cond:
+            self._total -= 1
+            self.discarded_count += 1
+            self._cond.notify()
+        logger.debug("RCON pool discarded connection to %s:%d", self.host, self.port)
+    
+    def _is_healthy(self, client):
+        """Cheap liveness check on an idle session without a server round trip.
+        
+        An idle socket that is readable with nothing to read has been closed
+        by the server (e.g. after a restart).
+        """
+        if not client.sock or not client.authenticated:
+            return False
+        try:
+            readable, _, _ = select.select([client.sock], [], [], 0)
+            if readable and not client.sock.recv(1, socket.MSG_PEEK):
+                return False
+        except (OSError, ValueError):
+            return False
+        return True
+
+
+class ResilientRCONSession:
+    """Keeps an RCON connection usable across server restarts.
+    
+    Wraps an `RCONClient` or `RCONConnectionPool` and exposes the same
+    `connect` / `execute_command` / `authenticated` / `disconnect` surface.
+    When the server goes away the session notices (on a failed command or an
+    idle keepalive), reconnects with exponential backoff, and transparently
+    replays commands that are safe to send twice. Other commands fail with
+    `RCONConnectionError` so the caller decides whether to retry.
+    
+    Every outage is recorded with its duration and number of reconnect
+    attempts, so the time the tool is blind after each restart is visible
+    in `stats()`.
+    """
+    
+    # Command verbs that are safe to replay after a reconnect: queries, and
+    # commands that set a value rather than toggle or append one
+    IDEMPOTENT_COMMANDS = frozenset([
+        'players', 'help', 'showoptions', 'save', 'reloadoptions',
+        'changeoption', 'setaccesslevel', 'checkmodsneedupdate',
+    ])
+    
+    # Cheap read-only command used to probe an idle connection
+    KEEPALIVE_COMMAND = 'players'
+    
+    # Seconds between keepalive thread wake-ups
+    KEEPALIVE_TICK = 1.0
+    
+    def __init__(self, connection, keepalive_interval=30, initial_backoff=1,
+                 max_backoff=60, history_size=20):
+        """Initialize the session (nothing is opened until `connect`).
+        
+        Args:
+            connection: `RCONClient` or `RCONConnectionPool` to manage
+            keepalive_interval (float): Idle seconds before a keepalive probe
+            initial_backoff (float): Delay after the first failed reconnect
+            max_backoff (float): Upper bound for the reconnect delay
+            history_size (int): Number of past outages kept for `stats()`
+        """
+        self.connection = connection
+        self.keepalive_interval = keepalive_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        
+        self._lock = threading.Lock()
+        self._reconnect_lock = threading.Lock()
+        self._closed = True
+        self._down_since = None
+        self._down_wall = None
+        self._attempts = 0
+        self._next_attempt = 0.0
+        self._last_activity = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+        
+        self.reconnect_count = 0
+        self.replay_count = 0
+        self.outages = deque(maxlen=history_size)
+    
+    @property
+    def host(self):
+        """str: Host of the wrapped connection."""
+        return self.connection.host
+    
+    @property
+    def port(self):
+        """int: Port of the wrapped connection."""
+        return self.connection.port
+    
+    @property
+    def authenticated(self):
+        """bool: True until `disconnect`, including while reconnecting."""
+        return not self._closed
+    
+    @property
+    def connected(self):
+        """bool: True if the session is open and the server is reachable."""
+        return not self._closed and self._down_since is None
+    
+    @classmethod
+    def is_idempotent(cls, command):
+        """Check whether a command may be sent again after a reconnect.
+        
+        Args:
+            command (str): RCON command
+            
+        Returns:
+            bool: True if the command's verb is in IDEMPOTENT_COMMANDS
+        """
+        parts = command.split(None, 1)
+        return bool(parts) and parts[0].lower() in cls.IDEMPOTENT_COMMANDS
+    
+    def connect(self):
+        """Connect the wrapped connection and start tracking its health.
+        
+        Returns:
+            bool: True if authentication successful
+            
+        Raises:
+            Exception: Same errors as the wrapped connection's `connect`
+        """
+        self.connection.connect()
+        with self._lock:
+            self._closed = False
+            self._down_since = None
+            self._attempts = 0
+        self._touch()
+        return True
+    
+    def disconnect(self):
+        """Stop the keepalive thread and close the wrapped connection."""
+        with self._lock:
+            self._closed = True
+            self._down_since = None
+        self.stop_keepalive()
+        self.connection.disconnect()
+    
+    def start_keepalive(self):
+        """Start the background thread that probes and reconnects."""
+        if self._thread and self._thread.is_alive():
+            return
+        # A fresh event per thread, so a stopped thread can't be revived
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._keepalive_loop, args=(self._stop,),
+                                        name='rcon-keepalive', daemon=True)
+        self._thread.start()
+    
+    def stop_keepalive(self):
+        """Ask the keepalive thread to exit (it may finish a probe first)."""
+        self._stop.set()
+        self._thread = None
+    
+    def execute_command(self, command, **kwargs):
+        """Execute a command, reconnecting and replaying it if safe.
+        
+        Args:
+            command (str): RCON command to execute
+            **kwargs: Passed to the wrapped `execute_command` (e.g. urgent)
+            
+        Returns:
+            str: Command output
+            
+        Raises:
+            RCONConnectionError: If the server is unreachable, or the connection
+                dropped during a command that is not safe to replay
+            Exception: Other command errors from the wrapped connection
+        """
+        return self._call(self.is_idempotent(command),
+                          lambda: self.connection.execute_command(command, **kwargs))
+    
+    def execute_pipelined(self, commands, **kwargs):
+        """Run `execute_pipelined`; the batch is replayed only if every command is safe to."""
+        commands = list(commands)
+        replayable = all(self.is_idempotent(cmd) for cmd in commands)
+        return self._call(replayable,
+                          lambda: self.connection.execute_pipelined(commands, **kwargs))
+    
+    def execute_many(self, commands, **kwargs):
+        """Run `execute_many`; never replayed since it reports per-command errors itself."""
+        commands = list(commands)
+        return self._call(False, lambda: self.connection.execute_many(commands, **kwargs))
+    
+    def iter_response(self, command, **kwargs):
+        """Run `iter_response`; never replayed since chunks may already be consumed."""
+        self._ensure_connected()
+        try:
+            for chunk in self.connection.iter_response(command, **kwargs):
+                yield chunk
+        except RCONConnectionError as e:
+            self._mark_down(e)
+            raise
+        self._touch()
+    
+    def stats(self):
+        """Snapshot of connection health and reconnect history.
+        
+        Returns:
+            dict: connected, reconnects, replays, down_for (seconds, or None),
+            attempts, last_outage and total_downtime (seconds), outages (list
+            of dicts with started, duration and attempts)
+        """
+        with self._lock:
+            down_for = None
+            if self._down_since is not None:
+                down_for = time.monotonic() - self._down_since
+            outages = list(self.outages)
+            return {
+                'connected': self.connected,
+                'reconnects': self.reconnect_count,
+                'replays': self.replay_count,
+                'down_for': down_for,
+                'attempts': self._attempts,
+                'last_outage': outages[-1]['duration'] if outages else None,
+                'total_downtime': sum(o['duration'] for o in outages),
+                'outages': outages,
+            }
+    
+    def latency_stats(self):
+        """Per-command latency summary from the wrapped connection."""
+        return self.connection.latency_stats()
+    
+    def _call(self, replayable, operation):
+        """Run operation, reconnecting and retrying once if replayable."""
+        self._ensure_connected()
+        try:
+            result = operation()
+        except RCONConnectionError as e:
+            self._mark_down(e)
+            if not replayable:
+                raise
+            self._reconnect()
+            self.replay_count += 1
+            result = operation()
+        self._touch()
+        return result
+    
+    def _ensure_connected(self):
+        """Reconnect if the backoff delay has passed, otherwise fail fast.
+        
+        Raises:
+            RCONConnectionError: If closed or still waiting to retry
+        """
+        if self._closed:
+            raise RCONConnectionError("Not connected to server")
+        if self._down_since is None:
+            return
+        wait = self._next_attempt - time.monotonic()
+        if wait > 0:
+            raise RCONConnectionError(f"Server unreachable - reconnecting in {wait:.0f}s")
+        self._reconnect()
+    
+    def _mark_down(self, error):
+        """Record the start of an outage (no-op if one is already open)."""
+        with self._lock:
+            if self._closed or self._down_since is not None:
+                return
+            self._down_since = time.monotonic()
+            self._down_wall = time.time()
+            self._attempts = 0
+            self._next_attempt = 0.0
+        logger.warning("RCON connection to %s:%d lost: %s", self.host, self.port, error)
+    
+    def _reconnect(self):
+        """Try to reopen the connection once, scheduling the next attempt on failure.
+        
+        Raises:
+            RCONConnectionError: If the server is still unreachable
+        """
+        with self._reconnect_lock:
+            if self._down_since is None:
+                return
+            if self._closed:
+                raise RCONConnectionError("Not connected to server")
+            
+            self._attempts += 1
+            try:
+                try:
+                    self.connection.disconnect()
+                except Exception as e:
+                    logger.debug("Error closing dead RCON connection: %s", e)
+                self.connection.connect()
+            except Exception as e:
+                delay = min(self.max_backoff, self.initial_backoff * 2 ** (self._attempts - 1))
+                self._next_attempt = time.monotonic() + delay
+                logger.debug("RCON reconnect attempt %d to %s:%d failed (%s); next in %.1fs",
+                             self._attempts, self.host, self.port, e, delay)
+                if isinstance(e, RCONConnectionError):
+                    raise
+                raise RCONConnectionError(f"Reconnect failed: {e}")
+            
+            with self._lock:
+                duration = time.monotonic() - self._down_since
+                self.outages.append({
+                    'started': self._down_wall,
+                    'duration': duration,
+                    'attempts': self._attempts,
+                })
+                self.reconnect_count += 1
+                attempts = self._attempts
+                self._down_since = None
+                self._attempts = 0
+            self._touch()
+            logger.info("RCON reconnected to %s:%d after %.1fs (%d attempts)",
+                        self.host, self.port, duration, attempts)
+    
+    def _touch(self):
+        """Note successful traffic so the keepalive stays quiet."""
+        self._last_activity = time.monotonic()
+    
+    def _keepalive_loop(self, stop):
+        """Background loop: probe idle connections and retry dead ones."""
+        while not stop.wait(self.KEEPALIVE_TICK):
+            if self._closed:
+                return
+            try:
+                if self._down_since is not None:
+                    if time.monotonic() >= self._next_attempt:
+                        self._reconnect()
+                elif time.monotonic() - self._last_activity >= self.keepalive_interval:
+                    self.execute_command(self.KEEPALIVE_COMMAND)
+            except Exception as e:
+                logger.debug("RCON keepalive for %s:%d: %s", self.host, self.port, e)
+
+
+class RCONResponseCache:
+    """Short-lived cache for read-only RCON commands.
+    
+    Wraps a client, pool or session and answers repeated read-only commands
+    (`players`, `help`, `showoptions`) from memory for a per-command TTL.
+    Concurrent identical requests are collapsed into a single server round
+    trip. Mutating commands invalidate the cached entries they affect, and
+    a read that overlaps an invalidation is never cached.
+    
+    Every other attribute (`connect`, `disconnect`, `authenticated`,
+    `start_keepalive`, `stats`, ...) is passed through to the wrapped
+    connection, so the cache can sit in front of anything with an
+    `execute_command` method.
+    """
+    
+    # Seconds each read-only command verb stays fresh
+    DEFAULT_TTLS = {
+        'players': 5,
+        'help': 300,
+        'showoptions': 30,
+    }
+    
+    # Mutating command verb -> cached verbs whose output it changes
+    INVALIDATES = {
+        'kickuser': ('players',),
+        'banuser': ('players',),
+        'banid': ('players',),
+        'changeoption': ('showoptions',),
+        'reloadoptions': ('showoptions',),
+    }
+    
+    def __init__(self, connection, ttls=None):
+        """Initialize the cache.
+        
+        Args:
+            connection: Object with `execute_command` (client, pool or session)
+            ttls (dict): Verb -> TTL in seconds, replacing DEFAULT_TTLS
+        """
+        self.connection = connection
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        
+        self._lock = threading.Lock()
+        self._entries = {}        # command -> (expires_at, response)
+        self._inflight = {}       # command -> Future shared by concurrent callers
+        self._generations = {}    # verb -> invalidation count
+        self._counters = {}       # verb -> {'hits', 'misses', 'collapsed', 'invalidations'}
+    
+    def __getattr__(self, name):
+        # Only called for attributes not found on the cache itself
+        return getattr(self.connection, name)
+    
+    command_verb = staticmethod(command_verb)
+    
+    def execute_command(self, command, **kwargs):
+        """Execute a command, answering cacheable ones from memory when fresh.
+        
+        Args:
+            command (str): RCON command to execute
+            **kwargs: Passed to the wrapped `execute_command` on a miss
+            
+        Returns:
+            str: Command output
+        """
+        key = command.strip()
+        verb = self.command_verb(key)
+        ttl = self.ttls.get(verb)
+        if not ttl:
+            return self._execute_uncached(verb, command, **kwargs)
+        
+        with self._lock:
+            counters = self._counters_for(verb)
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                counters['hits'] += 1
+                return entry[1]
+            
+            future = self._inflight.get(key)
+            if future is not None:
+                counters['collapsed'] += 1
+                owner = False
+            else:
+                counters['misses'] += 1
+                future = Future()
+                self._inflight[key] = future
+                generation = self._generations.get(verb, 0)
+                owner = True
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            response = self.connection.execute_command(command, **kwargs)
+        except Exception as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._lock:
+            del self._inflight[key]
+            if self._generations.get(verb, 0) == generation:
+                self._entries[key] = (time.monotonic() + ttl, response)
+        future.set_result(response)
+        return response
+    
+    def execute_pipelined(self, commands, **kwargs):
+        """Run `execute_pipelined` uncached, then invalidate what the batch changed."""
+        commands = list(commands)
+        verbs = set(self.command_verb(cmd) for cmd in commands)
+        self._invalidate_for(verbs, count=False)
+        try:
+            return self.connection.execute_pipelined(commands, **kwargs)
+        finally:
+            self._invalidate_for(verbs)
+    
+    def execute_many(self, commands, **kwargs):
+        """Run `execute_many` uncached, then invalidate what the batch changed."""
+        commands = list(commands)
+        verbs = set(self.command_verb(cmd) for cmd in commands)
+        self._invalidate_for(verbs, count=False)
+        try:
+            return self.connection.execute_many(commands, **kwargs)
+        finally:
+            self._invalidate_for(verbs)
+    
+    def iter_response(self, command, **kwargs):
+        """Stream a command; a fresh cached reply is yielded as one chunk.
+        
+        A streamed cacheable reply is stored once it has been read completely.
+        """
+        key = command.strip()
+        verb = self.command_verb(key)
+        ttl = self.ttls.get(verb)
+        if not ttl:
+            self._invalidate_for((verb,), count=False)
+            try:
+                for chunk in self.connection.iter_response(command, **kwargs):
+                    yield chunk
+            finally:
+                self._invalidate_for((verb,))
+            return
+        
+        with self._lock:
+            counters = self._counters_for(verb)
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                counters['hits'] += 1
+                cached = entry[1]
+            else:
+                counters['misses'] += 1
+                cached = None
+                generation = self._generations.get(verb, 0)
+        
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks = []
+        for chunk in self.connection.iter_response(command, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        with self._lock:
+            if self._generations.get(verb, 0) == generation:
+                self._entries[key] = (time.monotonic() + ttl, ''.join(chunks))
+    
+    def invalidate(self, verb=None):
+        """Drop cached replies for one verb, or everything if verb is None."""
+        verbs = [verb] if verb else list(self.ttls)
+        with self._lock:
+            self._drop(verbs)
+            for v in verbs:
+                self._counters_for(v)['invalidations'] += 1
+    
+    def cache_stats(self):
+        """Snapshot of cache effectiveness.
+        
+        Returns:
+            dict: Totals for hits, misses, collapsed and invalidations, the
+            number of cached entries, and a `verbs` dict with the same
+            counters per command verb
+        """
+        with self._lock:
+            verbs = {verb: dict(counters) for verb, counters in self._counters.items()}
+            totals = {'hits': 0, 'misses': 0, 'collapsed': 0, 'invalidations': 0}
+            for counters in verbs.values():
+                for name in totals:
+                    totals[name] += counters[name]
+            totals['entries'] = len(self._entries)
+            totals['verbs'] = verbs
+            return totals
+    
+    def _execute_uncached(self, verb, command, **kwargs):
+        """Pass a command through, invalidating around it if it mutates state."""
+        self._invalidate_for((verb,), count=False)
+        try:
+            return self.connection.execute_command(command, **kwargs)
+        finally:
+            self._invalidate_for((verb,))
+    
+    def _invalidate_for(self, verbs, count=True):
+        """Invalidate the cached verbs affected by the given mutating verbs.
+        
+        Mutations invalidate both before and after they run, so a read that
+        overlaps the mutation is not cached; only the second is counted.
+        """
+        affected = set()
+        for verb in verbs:
+            affected.update(self.INVALIDATES.get(verb, ()))
+        if not affected:
+            return
+        with self._lock:
+            self._drop(affected)
+            if count:
+                for verb in affected:
+                    self._counters_for(verb)['invalidations'] += 1
+    
+    def _drop(self, verbs):
+        """Bump the generation of verbs and delete their entries (hold `_lock`)."""
+        for verb in verbs:
+            self._generations[verb] = self._generations.get(verb, 0) + 1
+        for key in list(self._entries):
+            if self.command_verb(key) in verbs:
+                del self._entries[key]
+    
+    def _counters_for(self, verb):
+        """Counter dict for a verb (call with `_lock` held)."""
+        counters = self._counters.get(verb)
+        if counters is None:
+            counters = {'hits': 0, 'misses': 0, 'collapsed': 0, 'invalidations': 0}
+            self._counters[verb] = counters
+        return counters
+
+
+class RCONWorker:
+    """Runs RCON calls on background threads and hands back futures.
+    
+    Lets a GUI thread queue commands without ever waiting on the network.
+    Ordinary work is served by `threads` threads from a priority queue, so
+    interactive commands are picked up before queued bulk work and
+    scheduled announcements (in submission order within a class). Urgent
+    commands (restart warnings, kicks) have their own queue and thread so
+    they never wait behind a slow `help` or a bulk unban.
+    
+    Results are delivered as `concurrent.futures.Future` objects; callbacks
+    added with `add_done_callback` run on the worker thread, so GUI code must
+    marshal them back to its own thread.
+    """
+    
+    def __init__(self, connection, threads=2):
+        """Start the worker threads.
+        
+        Args:
+            connection: Object with `execute_command` (client, pool or session)
+            threads (int): Threads serving ordinary (non-urgent) work
+        """
+        self.connection = connection
+        self._queue = queue.PriorityQueue()
+        self._urgent_queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._closed = False
+        self._threads = []
+        self._lock = threading.Lock()
+        self._counters = {}       # priority -> queued, started, total_wait, max_wait
+        # One lane entry per thread; each thread serves a single queue
+        self._lanes = [self._queue] * max(1, threads) + [self._urgent_queue]
+        for i, lane in enumerate(self._lanes):
+            thread = threading.Thread(target=self._run, args=(lane,),
+                                      name=f'rcon-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    @property
+    def pending(self):
+        """int: Queued calls not yet picked up by a thread."""
+        with self._lock:
+            return sum(c['queued'] for c in self._counters.values())
+    
+    def submit(self, command, urgent=False, priority=None):
+        """Queue an RCON command.
+        
+        Args:
+            command (str): RCON command to execute
+            urgent (bool): Shorthand for priority=PRIORITY_URGENT
+            priority (int): PRIORITY_URGENT uses the urgent lane (and the
+                connection's reserved slots); other classes are ordered in
+                the ordinary queue and passed on for rate limiting
+            
+        Returns:
+            Future: Resolves to the command output or its exception
+        """
+        if priority is None:
+            priority = PRIORITY_URGENT if urgent else PRIORITY_INTERACTIVE
+        kwargs = {} if priority == PRIORITY_INTERACTIVE else {'priority': priority}
+        return self._enqueue(priority, self.connection.execute_command, (command,), kwargs)
+    
+    def submit_call(self, fn, *args, priority=PRIORITY_INTERACTIVE, **kwargs):
+        """Queue an arbitrary callable.
+        
+        Args:
+            fn (callable): Called as fn(*args, **kwargs) on a worker thread
+            priority (int): Queue position class; only orders the worker's
+                queue, it is not passed to fn
+        
+        Returns:
+            Future: Resolves to fn's return value or its exception
+        """
+        return self._enqueue(priority, fn, args, kwargs)
+    
+    def stats(self):
+        """Queue depth and queueing delay per priority class.
+        
+        Returns:
+            dict: class name -> `queued` (waiting for a thread), `started`
+            (picked up so far) and `avg_wait`/`max_wait` in seconds
+        """
+        with self._lock:
+            return {
+                PRIORITY_NAMES.get(priority, str(priority)): {
+                    'queued': c['queued'],
+                    'started': c['started'],
+                    'avg_wait': c['total_wait'] / c['started'] if c['started'] else 0.0,
+                    'max_wait': c['max_wait'],
+                }
+                for priority, c in sorted(self._counters.items())
+            }
+    
+    def shutdown(self, wait=False):
+        """Stop accepting work; threads exit once their queue is drained.
+        
+        Args:
+            wait (bool): Block until every thread has exited
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for lane in self._lanes:
+            # Sorts after every real priority, so queued work runs first
+            lane.put((float('inf'), next(self._seq), None))
+        if wait:
+            for thread in self._threads:
+                thread.join()
+    
+    def _enqueue(self, priority, fn, args, kwargs):
+        """Wrap a call in a Future and put it on the lane for its priority."""
+        if self._closed:
+            raise Exception("RCON worker has been shut down")
+        future = Future()
+        lane = self._urgent_queue if priority == PRIORITY_URGENT else self._queue
+        with self._lock:
+            counters = self._counters.setdefault(
+                priority, {'queued': 0, 'started': 0, 'total_wait': 0.0, 'max_wait': 0.0})
+            counters['queued'] += 1
+        lane.put((priority, next(self._seq), (time.monotonic(), future, fn, args, kwargs)))
+        return future
+    
+    def _run(self, lane):
+        """Thread loop: run queued calls until the shutdown marker."""
+        while True:
+            priority, _, item = lane.get()
+            if item is None:
+                return
+            queued_at, future, fn, args, kwargs = item
+            waited = time.monotonic() - queued_at
+            with self._lock:
+                counters = self._counters[priority]
+                counters['queued'] -= 1
+                counters['started'] += 1
+                counters['total_wait'] += waited
+                counters['max_wait'] = max(counters['max_wait'], waited)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
+def build_connection(host, port, password, limiter=None):
+    """Build the standard connection stack for one server (not yet connected).
+    
+    A pool of sessions (paced by `limiter`), kept alive across server
+    restarts by `ResilientRCONSession`, behind an `RCONResponseCache`.
+    
+    Args:
+        host (str): Server hostname or IP address
+        port (int): RCON port
+        password (str): RCON password (not trimmed; spaces are intentional)
+        limiter (RCONRateLimiter): Paces outgoing commands; a default
+            limiter if None
+        
+    Returns:
+        RCONResponseCache: Call `connect()` (and `start_keepalive()`) to use it
+    """
+    pool = RCONConnectionPool(host, port, password, limiter=limiter or RCONRateLimiter())
+    return RCONResponseCache(ResilientRCONSession(pool))
+
+
+class RCONFleet:
+    """Registry of named servers, each with its own connection and worker.
+    
+    Every server gets an independent connection stack (see
+    `build_connection`) and `RCONWorker`, so a slow or unreachable server
+    never holds up the others. Connecting, refreshing and running commands
+    across the fleet happen concurrently, one thread per server.
+    
+    Servers are plain dicts with `name`, `host`, `port`, `password`, `info`
+    (caller-defined metadata such as the server path), `connection`,
+    `worker` (both None while disconnected) and `error` (last connect
+    failure, or None).
+    """
+    
+    def __init__(self, connection_factory=None, max_parallel=8):
+        """Initialize an empty fleet.
+        
+        Args:
+            connection_factory (callable): Builds an unconnected connection
+                from (host, port, password); defaults to `build_connection`
+            max_parallel (int): Most servers contacted at the same time
+        """
+        self.connection_factory = connection_factory or build_connection
+        self.max_parallel = max(1, max_parallel)
+        self._lock = threading.RLock()
+        self._servers = {}
+    
+    def add(self, name, host, port, password, **info):
+        """Register a server, or update an existing one.
+        
+        Changing the address or password of a connected server disconnects
+        it; `info` is merged into the existing metadata.
+        
+        Args:
+            name (str): Unique display name
+            host (str): Server hostname or IP address
+            port (int): RCON port
+            password (str): RCON password, or None if not known yet
+            **info: Metadata to store with the server
+            
+        Returns:
+            dict: The server entry
+        """
+        with self._lock:
+            server = self._servers.get(name)
+            if server is None:
+                server = self._servers[name] = {
+                    'name': name, 'host': host, 'port': port, 'password': password,
+                    'info': {}, 'connection': None, 'worker': None, 'error': None,
+                }
+            elif (server['host'], server['port'], server['password']) != (host, port, password):
+                self.disconnect(name)
+                server.update(host=host, port=port, password=password)
+            server['info'].update(info)
+            return server
+    
+    def remove(self, name):
+        """Disconnect and forget a server (no-op if unknown)."""
+        with self._lock:
+            if name not in self._servers:
+                return
+            self.disconnect(name)
+            del self._servers[name]
+    
+    def get(self, name):
+        """Return the server entry for name, or None."""
+        with self._lock:
+            return self._servers.get(name)
+    
+    def names(self):
+        """Return server names in the order they were added."""
+        with self._lock:
+            return list(self._servers)
+    
+    def connected_names(self):
+        """Return the names of servers with an open connection."""
+        with self._lock:
+            return [name for name, server in self._servers.items() if server['connection']]
+    
+    def connect(self, name):
+        """Open (or reopen) the connection to one server.
+        
+        Args:
+            name (str): Server name
+            
+        Returns:
+            The connected connection stack
+            
+        Raises:
+            KeyError: If the server is unknown
+            Exception: If connecting fails (also recorded in `error`)
+        """
+        with self._lock:
+            server = self._servers[name]
+            host, port, password = server['host'], server['port'], server['password']
+        self.disconnect(name)
+        
+        connection = self.connection_factory(host, port, password or '')
+        try:
+            connection.connect()
+        except Exception as e:
+            with self._lock:
+                server['error'] = str(e)
+            raise
+        if hasattr(connection, 'start_keepalive'):
+            connection.start_keepalive()
+        
+        with self._lock:
+            server.update(connection=connection, worker=RCONWorker(connection), error=None)
+        logger.info("Fleet server '%s' connected (%s:%s)", name, host, port)
+        return connection
+    
+    def disconnect(self, name):
+        """Close one server's connection and stop its worker (queued work still drains)."""
+        with self._lock:
+            server = self._servers.get(name)
+            if not server or not server['connection']:
+                return
+            connection, worker = server['connection'], server['worker']
+            server.update(connection=None, worker=None)
+        if worker:
+            worker.shutdown()
+        connection.disconnect()
+    
+    def connect_all(self, names=None):
+        """Connect several servers concurrently.
+        
+        Args:
+            names (list): Servers to connect (default: all)
+            
+        Returns:
+            dict: name -> None on success, or the error message
+        """
+        outcome = self.run_all(lambda server: self.connect(server['name']),
+                               names=names, connected_only=False)
+        return {name: result['error'] for name, result in outcome.items()}
+    
+    def disconnect_all(self):
+        """Disconnect every server."""
+        for name in self.names():
+            self.disconnect(name)
+    
+    def execute_all(self, command, names=None, priority=PRIORITY_INTERACTIVE):
+        """Send one command to several servers at the same moment.
+        
+        The command is queued on every server's worker before any reply is
+        awaited, so each server's copy goes out as soon as its own worker is
+        free instead of one after another; a network-wide announcement
+        reaches all servers within the slowest single round trip.
+        
+        Args:
+            command (str): RCON command to send
+            names (list): Servers to send to (default: all connected)
+            priority (int): Worker and rate-limiter priority for every copy
+            
+        Returns:
+            dict: name -> {'result', 'error' (str or None), 'elapsed'
+            (seconds from queueing to the reply)}, in the order of names;
+            servers that are unknown or not connected get an error
+        """
+        with self._lock:
+            wanted = self.connected_names() if names is None else list(names)
+            workers = [(name, (self._servers.get(name) or {}).get('worker')) for name in wanted]
+        
+        start = time.monotonic()
+        pending = []
+        for name, worker in workers:
+            finished = []
+            if worker is None:
+                pending.append((name, None, finished))
+                continue
+            future = worker.submit(command, priority=priority)
+            future.add_done_callback(lambda f, finished=finished: finished.append(time.monotonic()))
+            pending.append((name, future, finished))
+        
+        results = {}
+        for name, future, finished in pending:
+            if future is None:
+                error = 'Unknown server' if self.get(name) is None else 'Not connected'
+                results[name] = {'result': None, 'error': error, 'elapsed': 0.0}
+                continue
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, str(e) or e.__class__.__name__
+            results[name] = {'result': result, 'error': error,
+                             'elapsed': (finished[0] if finished else time.monotonic()) - start}
+        logger.info("Fleet command %r sent to %d servers (%d failed)", command_verb(command),
+                    len(results), sum(1 for r in results.values() if r['error']))
+        return results
+    
+    def run_all(self, fn, names=None, connected_only=True):
+        """Call fn(server) for several servers at once, one thread each.
+        
+        Args:
+            fn (callable): Takes a server entry; runs on a pool thread
+            names (list): Servers to include (default: all)
+            connected_only (bool): Skip servers without an open connection
+            
+        Returns:
+            dict: name -> {'result', 'error' (str or None), 'elapsed'
+            (seconds)}, in fleet order
+        """
+        with self._lock:
+            wanted = self.names() if names is None else [n for n in names if n in self._servers]
+            servers = [self._servers[n] for n in wanted
+                       if self._servers[n]['connection'] or not connected_only]
+        if not servers:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(servers)),
+                                thread_name_prefix='rcon-fleet') as executor:
+            futures = [(server['name'], executor.submit(self._timed_call, fn, server))
+                       for server in servers]
+            return {name: future.result() for name, future in futures}
+    
+    @staticmethod
+    def _timed_call(fn, server):
+        """Run fn(server), capturing its result or error and how long it took."""
+        start = time.monotonic()
+        try:
+            result, error = fn(server), None
+        except Exception as e:
+            result, error = None, str(e) or e.__class__.__name__
+        return {'result': result, 'error': error, 'elapsed': time.monotonic() - start}
+
+
+class AsyncRCONClient:
+    """asyncio-native RCON client for Project Zomboid.
+    
+    Speaks the same protocol and handshake as `RCONClient`, but on asyncio
+    streams so one event loop can hold connections to many servers without a
+    thread per socket. A background reader task dispatches each reply to the
+    awaiting caller by request id, so concurrent `execute_command` calls on
+    one connection are pipelined automatically.
+    
+    Usage:
+        async with AsyncRCONClient(host, port, password) as rcon:
+            players = await rcon.execute_command('players')
+    """
+    
+    SERVERDATA_AUTH = RCONClient.SERVERDATA_AUTH
+    SERVERDATA_AUTH_RESPONSE = RCONClient.SERVERDATA_AUTH_RESPONSE
+    SERVERDATA_EXECCOMMAND = RCONClient.SERVERDATA_EXECCOMMAND
+    SERVERDATA_RESPONSE_VALUE = RCONClient.SERVERDATA_RESPONSE_VALUE
+    
+    def __init__(self, host, port, password, timeout=10):
+        """Initialize async RCON client.
+        
+        Args:
+            host (str): Server hostname or IP address
+            port (int): RCON port (typically 16261)
+            password (str): RCON password (not trimmed; spaces are intentional)
+            timeout (float): Seconds to wait for connect, auth and each reply
+        """
+        self.host = host
+        self.port = port
+        self.password = password
+        self.timeout = timeout
+        self.request_id = 0
+        self.authenticated = False
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        self._waiters = {}
+    
+    async def __aenter__(self):
+        await self.connect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+    
+    async def connect(self):
+        """Open the connection and authenticate.
+        
+        Handles the empty RESPONSE_VALUE packet that the server may send
+        before the AUTH_RESPONSE, exactly like `RCONClient.connect`.
+        
+        Returns:
+            bool: True if authentication successful
+            
+        Raises:
+            Exception: If connection fails, times out, or authentication is rejected
+        """
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout)
+            
+            self.request_id += 1
+            auth_id = self.request_id
+            self._writer.write(encode_packet(auth_id, self.SERVERDATA_AUTH, self.password))
+            await self._writer.drain()
+            
+            # Read first packet (might be empty SERVERDATA_RESPONSE_VALUE)
+            response_id, response_type, _ = await asyncio.wait_for(self._read_packet(), self.timeout)
+            if response_type == self.SERVERDATA_RESPONSE_VALUE:
+                response_id, _, _ = await asyncio.wait_for(self._read_packet(), self.timeout)
+            
+            if response_id == -1:
+                raise Exception("Authentication failed - wrong password")
+            
+            self.authenticated = True
+            self._reader_task = asyncio.ensure_future(self._dispatch_responses())
+            return True
+            
+        except asyncio.TimeoutError:
+            logger.error("Async RCON connection timed out to %s:%d", self.host, self.port)
+            await self._close_transport()
+            raise RCONConnectionError("Connection timed out - check host and port")
+        except ConnectionRefusedError:
+            logger.error("Async RCON connection refused to %s:%d - is RCON enabled?", self.host, self.port)
+            await self._close_transport()
+            raise RCONConnectionError("Connection refused - is RCON enabled and server running?")
+        except asyncio.IncompleteReadError:
+            await self._close_transport()
+            raise Exception("Auth failed - incomplete response")
+        except Exception:
+            await self._close_transport()
+            raise
+    
+    async def disconnect(self):
+        """Close the connection and fail any commands still awaiting a reply."""
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader_task = None
+        self._fail_waiters(Exception("Connection closed"))
+        await self._close_transport()
+        logger.info("Async RCON disconnected from %s:%d", self.host, self.port)
+    
+    async def execute_command(self, command):
+        """Execute a command and await its response.
+        
+        Args:
+            command (str): RCON command to execute (e.g. 'players', 'save')
+            
+        Returns:
+            str: Command output (empty string if no response body)
+            
+        Raises:
+            Exception: If not connected, the connection drops, or the reply times out
+        """
+        if not self._writer or not self.authenticated:
+            raise RCONConnectionError("Not connected to server")
+        
+        self.request_id += 1
+        cmd_id = self.request_id
+        future = asyncio.get_event_loop().create_future()
+        self._waiters[cmd_id] = future
+        
+        try:
+            self._writer.write(encode_packet(cmd_id, self.SERVERDATA_EXECCOMMAND, command))
+            await self._writer.drain()
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            logger.error("Async RCON command timed out: %s", command)
+            raise Exception("Command timed out")
+        except (BrokenPipeError, ConnectionResetError):
+            logger.error("Async RCON connection lost while executing command")
+            self.authenticated = False
+            raise RCONConnectionError("Connection lost - please reconnect")
+        finally:
+            self._waiters.pop(cmd_id, None)
+    
+    async def _dispatch_responses(self):
+        """Reader task: route every incoming packet to its waiting caller."""
+        try:
+            while True:
+                response_id, _, body = await self._read_packet()
+                future = self._waiters.get(response_id)
+                if future is not None and not future.done():
+                    future.set_result(body)
+                else:
+                    logger.debug("Dropping unsolicited async RCON packet id=%d", response_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Async RCON connection lost: %s", e)
+            self.authenticated = False
+            self._fail_waiters(Exception("Connection lost - please reconnect"))
+    
+    async def _read_packet(self):
+        """Read one packet from the stream.
+        
+        Returns:
+            tuple: (id, type, body_text)
+            
+        Raises:
+            asyncio.IncompleteReadError: If the peer closes mid-packet
+        """
+        size_data = await self._reader.readexactly(SIZE.size)
+        response_size = SIZE.unpack(size_data)[0]
+        if response_size < 0 or response_size > MAX_PACKET_SIZE:
+            raise Exception("Malformed response packet")
+        packet = decode_packet(await self._reader.readexactly(response_size))
+        if packet is None:
+            raise Exception("Incomplete response packet")
+        return packet
+    
+    def _fail_waiters(self, exc):
+        """Propagate `exc` to every command still awaiting a reply."""
+        for future in self._waiters.values():
+            if not future.done():
+                future.set_exception(exc)
+        self._waiters.clear()
+    
+    async def _close_transport(self):
+        """Close the stream writer, ignoring errors from a dead socket."""
+        self.authenticated = False
+        if self._writer:
             try:
-                chunk = self.sock.recv(n - len(data))
-                if not chunk:
-                    return None
-                data += chunk
-            except socket.error:
-                return None
-        return data
+                self._writer.close()
+                if hasattr(self._writer, 'wait_closed'):
+                    await self._writer.wait_closed()
+            except (OSError, ConnectionError) as e:
+                logger.debug("Error closing async RCON stream: %s", e)
+            self._writer = None
+            self._reader = None
@@ -0,0 +1,210 @@
+"""RCON packet codec shared by the blocking and async clients.
+
+Packets are encoded with a precompiled `struct.Struct` header written
+directly into a preallocated buffer, and received with `recv_into` into a
+reusable bytearray, so neither direction builds intermediate bytes objects
+by concatenation.
+
+Wire format (all integers little-endian):
+    size (4) | id (4) | type (4) | body (N) | 0x00 0x00
+where size counts everything after the size field itself.
+"""
+import socket
+import struct
+
+# Header structs, compiled once
+SIZE = struct.Struct('<i')
+ID_TYPE = struct.Struct('<ii')
+HEADER = struct.Struct('<iii')
+
+# Bytes counted by the size field besides the body: id + type + 2 nulls
+PACKET_OVERHEAD = ID_TYPE.size + 2
+
+# Source-style servers never send more than 4096 bytes of body per packet;
+# anything wildly larger means the stream is out of sync
+MAX_PACKET_SIZE = 1024 * 1024
+
+
+def encode_packet(packet_id, packet_type, body):
+    """Encode a single packet.
+
+    Args:
+        packet_id (int): Request id
+        packet_type (int): Packet type constant
+        body (str or bytes): Packet body (str is encoded as UTF-8)
+
+    Returns:
+        bytearray: Complete packet including the size prefix
+    """
+    return encode_batch(((packet_id, packet_type, body),))
+
+
+def encode_batch(packets):
+    """Encode several packets into one contiguous send buffer.
+
+    The buffer is sized up front and every header is packed in place, so a
+    pipelined batch goes out in a single `sendall` with no concatenation.
+
+    Args:
+        packets (iterable): (packet_id, packet_type, body) tuples
+
+    Returns:
+        bytearray: All packets back to back
+    """
+    encoded = []
+    total = 0
+    for packet_id, packet_type, body in packets:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        encoded.append((packet_id, packet_type, body))
+        total += SIZE.size + PACKET_OVERHEAD + len(body)
+
+    buf = bytearray(total)
+    offset = 0
+    for packet_id, packet_type, body in encoded:
+        HEADER.pack_into(buf, offset, PACKET_OVERHEAD + len(body), packet_id, packet_type)
+        offset += HEADER.size
+        buf[offset:offset + len(body)] = body
+        # The two null terminators are already zero in the fresh buffer
+        offset += len(body) + 2
+    return buf
+
+
+def decode_packet(data):
+    """Decode the id, type and body of a packet without its size prefix.
+
+    Args:
+        data (bytes-like): id + type + body bytes (as counted by the size field)
+
+    Returns:
+        tuple: (id, type, body_text), or None if shorter than a header
+    """
+    if len(data) < ID_TYPE.size:
+        return None
+    packet_id, packet_type = ID_TYPE.unpack_from(data, 0)
+    return packet_id, packet_type, _decode_body(data, ID_TYPE.size, len(data))
+
+
+def _decode_body(buf, start, end):
+    """Decode buf[start:end] as UTF-8 with trailing nulls stripped."""
+    while end > start and buf[end - 1] == 0:
+        end -= 1
+    return str(memoryview(buf)[start:end], 'utf-8', 'ignore')
+
+
+class PacketReader:
+    """Reads RCON packets from a socket into one reusable buffer.
+
+    The buffer only grows (to the largest packet seen), so steady-state
+    reads allocate nothing but the decoded body string. A read that times
+    out part way through a packet keeps what it has received, and the next
+    `read_packet` resumes from there, so short timeouts never desync the
+    stream.
+
+    Attributes:
+        closed (bool): Set once the peer has closed the connection, the
+            socket failed with anything other than a timeout, or a size
+            field was out of range (the stream cannot be resynchronised), so
+            callers can tell a dead connection from a slow one
+    """
+
+    def __init__(self, initial_size=4096 + HEADER.size + 2):
+        """Initialize the reader.
+
+        Args:
+            initial_size (int): Starting buffer size in bytes
+        """
+        self._buf = bytearray(initial_size)
+        self._view = memoryview(self._buf)
+        self._filled = 0
+        self.closed = False
+
+    def reset(self):
+        """Forget buffered bytes and the closed flag, for a new connection."""
+        self._filled = 0
+        self.closed = False
+
+    def recv_exact(self, sock, n):
+        """Receive exactly the next n bytes of the stream.
+
+        Bytes held from a read that timed out part way through come first,
+        and a timed-out `recv_exact` keeps what it received in the same way.
+
+        Args:
+            sock: Connected socket
+            n (int): Number of bytes to receive
+
+        Returns:
+            memoryview: View of the n bytes (valid until the next read), or
+            None if peer closes, the read times out or socket error
+        """
+        self._ensure(n)
+        if not self._fill(sock, n):
+            return None
+        extra = self._filled - n
+        if extra <= 0:
+            self._filled = 0
+            return self._view[:n]
+        # A held partial packet was longer than n: keep its tail buffered
+        data = bytes(self._view[:n])
+        self._buf[:extra] = self._buf[n:n + extra]
+        self._filled = extra
+        return memoryview(data)
+
+    def read_packet(self, sock):
+        """Read one complete packet.
+
+        Args:
+            sock: Connected socket
+
+        Returns:
+            tuple: (id, type, body_text), or None if peer closes, the read
+            times out, socket error, or the packet is malformed
+        """
+        if not self._fill(sock, SIZE.size):
+            return None
+
+        size = SIZE.unpack_from(self._buf, 0)[0]
+        if size < 0 or size > MAX_PACKET_SIZE:
+            # There is no way to find the next packet boundary
+            self._filled = 0
+            self.closed = True
+            return None
+
+        end = SIZE.size + size
+        self._ensure(end)
+        if not self._fill(sock, end):
+            return None
+        self._filled = 0
+        if size < ID_TYPE.size:
+            return None
+
+        packet_id, packet_type = ID_TYPE.unpack_from(self._buf, SIZE.size)
+        return packet_id, packet_type, _decode_body(self._buf, HEADER.size, end)
+
+    def _ensure(self, n):
+        """Grow the buffer to at least n bytes, keeping its contents."""
+        if n <= len(self._buf):
+            return
+        new_buf = bytearray(max(n, 2 * len(self._buf)))
+        new_buf[:len(self._buf)] = self._buf
+        self._buf = new_buf
+        self._view = memoryview(new_buf)
+
+    def _fill(self, sock, target):
+        """recv_into the buffer until it holds target bytes; False on EOF, timeout or error."""
+        view = self._view
+        while self._filled < target:
+            n = target - self._filled
+            try:
+                got = sock.recv_into(view[self._filled:target], n)
+            except socket.timeout:
+                return False
+            except socket.error:
+                self.closed = True
+                return False
+            if not got:
+                self.closed = True
+                return False
+            self._filled += got
+        return True
@@ -21,12 +21,10 @@ def test_execute_command_packet():
         client.authenticated = True
         client.request_id = 42
 
-        # Monkeypatch _recv_all to avoid waiting for a response
-        client._recv_all = lambda n: None
-
-        # Call execute_command which will send a packet
+        # Send the packet without waiting for a response (nothing answers
+        # on the other end, so execute_command would just time out)
         cmd = 'test_command'
-        _ = client.execute_command(cmd)
+        client.send_command(cmd)
 
         # Read bytes from the other end
         s2.settimeout(1.0)
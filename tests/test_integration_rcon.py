@@ -1,35 +1,40 @@
 import sys
 import os
-import socket
-import struct
-import threading
-import sys
-import os
+import queue
 import socket
 import struct
 import threading
 import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from rcon import RCONClient
+from rcon import (LatencyTracker, RCONClient, AsyncRCONClient, RCONConnectionPool, ResilientRCONSession,
+                  RCONConnectionError, RCONFleet, RCONRateLimiter, RCONWorker,
+                  PRIORITY_BULK, PRIORITY_URGENT)
 
 
 class MockRCONServer:
     """Simple mock RCON server for testing the RCONClient."""
     
-    def __init__(self, port=9999, password='testpass'):
+    def __init__(self, port=9999, password='testpass', split_size=None, mirror_sentinel=False,
+                 latency=0, reply_delay=0, tail_delay=0):
         self.port = port
         self.password = password
+        self.latency = latency                  # seconds each reply spends "on the wire"
+        self.split_size = split_size            # split replies into packets of this many bytes
+        self.mirror_sentinel = mirror_sentinel  # echo empty RESPONSE_VALUE packets like Source
+        self.reply_delay = reply_delay          # answer commands late, after mirroring sentinels
+        self.tail_delay = tail_delay            # hold back the last packet of a split reply
         self.sock = None
         self.running = False
         self.thread = None
+        self.clients = []
         
     def start(self):
         """Start the mock server in a background thread."""
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.sock.bind(('127.0.0.1', self.port))
-        self.sock.listen(1)
+        self.sock.listen(5)
         self.running = True
         self.thread = threading.Thread(target=self._run)
         self.thread.daemon = True
@@ -40,7 +45,17 @@ class MockRCONServer:
         """Stop the mock server."""
         self.running = False
         if self.sock:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)  # wake the blocked accept()
+            except OSError:
+                pass
             self.sock.close()
+        # Drop live sessions too, like a real server restart
+        for client in self.clients:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
         if self.thread:
             self.thread.join(timeout=1)
     
@@ -49,23 +64,29 @@ class MockRCONServer:
         while self.running:
             try:
                 client, addr = self.sock.accept()
-                self._handle_client(client)
+                self.clients.append(client)
+                handler = threading.Thread(target=self._handle_client, args=(client,))
+                handler.daemon = True
+                handler.start()
             except Exception:
                 break
     
     def _handle_client(self, client):
         """Handle a single client connection."""
+        send, stop_sending = self._make_sender(client)
         try:
             authenticated = False
             
             while self.running:
                 # Read size
-                size_data = client.recv(4)
+                size_data = self._recv_exact(client, 4)
                 if not size_data:
                     break
                     
                 size = struct.unpack('<i', size_data)[0]
-                data = client.recv(size)
+                data = self._recv_exact(client, size)
+                if data is None:
+                    break
                 
                 if len(data) < 8:
                     continue
@@ -83,7 +104,7 @@ class MockRCONServer:
                     resp += struct.pack('<i', 0)  # id
                     resp += struct.pack('<i', 0)  # type = RESPONSE_VALUE
                     resp += b'\x00\x00'
-                    client.sendall(resp)
+                    send(resp)
                     
                     if password == self.password:
                         authenticated = True
@@ -92,48 +113,118 @@ class MockRCONServer:
                         resp += struct.pack('<i', req_id)  # id = request id (auth success)
                         resp += struct.pack('<i', 0)  # type = RESPONSE_VALUE
                         resp += b'\x00\x00'
-                        client.sendall(resp)
+                        send(resp)
                     else:
                         # Send failure response (id = -1)
                         resp = struct.pack('<i', 10)  # size = 10
                         resp += struct.pack('<i', -1)  # id = -1 (auth failed)
                         resp += struct.pack('<i', 0)  # type = RESPONSE_VALUE
                         resp += b'\x00\x00'
-                        client.sendall(resp)
+                        send(resp)
                         break
                 
                 # Handle EXECCOMMAND (type 2)
                 elif pkt_type == 2 and authenticated:
                     command = body.decode('utf-8', errors='ignore')
                     response = self._handle_command(command)
+                    if response is None:
+                        continue
                     
-                    # Send response with proper packet format
-                    # Data is: id + type + body
                     resp_body = response.encode('utf-8')
-                    packet_data = struct.pack('<i', req_id)
-                    packet_data += struct.pack('<i', 0)  # RESPONSE_VALUE type
-                    packet_data += resp_body + b'\x00\x00'
-                    
-                    # Packet is: size + data
-                    packet = struct.pack('<i', len(packet_data))
-                    packet += packet_data
-                    client.sendall(packet)
+                    chunks = [resp_body]
+                    if self.split_size:
+                        chunks = [resp_body[i:i + self.split_size]
+                                  for i in range(0, len(resp_body), self.split_size)] or [b'']
+                    if self.reply_delay:
+                        # Like PZ handing the command to its main thread
+                        threading.Timer(self.reply_delay, self._send_reply,
+                                        (send, req_id, chunks)).start()
+                    else:
+                        self._send_reply(send, req_id, chunks)
+                
+                # Handle sentinel RESPONSE_VALUE (type 0)
+                elif pkt_type == 0 and authenticated and self.mirror_sentinel:
+                    send(self._packet(req_id, b''))
+                    send(self._packet(req_id, b'\x00\x01\x00\x00'))
         except Exception as e:
             import traceback
             print(f"Server error: {e}")
             print(traceback.format_exc())
         finally:
+            stop_sending()
             try:
                 client.close()
             except:
                 pass
     
+    def _send_reply(self, send, req_id, chunks):
+        """Send a reply's packets, pausing `tail_delay` before the last one."""
+        for i, chunk in enumerate(chunks):
+            if self.tail_delay and i and i == len(chunks) - 1:
+                time.sleep(self.tail_delay)
+            send(self._packet(req_id, chunk))
+    
+    def _make_sender(self, client):
+        """Return (send, stop) for a client; replies are delayed by `latency`.
+        
+        Delayed replies go through a queue drained by their own thread, so the
+        delay models network round-trip time: pipelined requests overlap.
+        The queue also keeps replies sent from `reply_delay` timers whole.
+        """
+        if not self.latency and not self.reply_delay:
+            return client.sendall, lambda: None
+        
+        outbox = queue.Queue()
+        
+        def pump():
+            while True:
+                item = outbox.get()
+                if item is None:
+                    return
+                due, data = item
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                try:
+                    client.sendall(data)
+                except OSError:
+                    return
+        
+        threading.Thread(target=pump, daemon=True).start()
+        return (lambda data: outbox.put((time.monotonic() + self.latency, data)),
+                lambda: outbox.put(None))
+    
+    def _packet(self, req_id, body):
+        """Build a RESPONSE_VALUE packet: size + id + type + body + 2 nulls."""
+        packet_data = struct.pack('<i', req_id)
+        packet_data += struct.pack('<i', 0)  # RESPONSE_VALUE type
+        packet_data += body + b'\x00\x00'
+        return struct.pack('<i', len(packet_data)) + packet_data
+    
+    def _recv_exact(self, client, n):
+        """Read exactly n bytes (pipelined clients send many packets at once)."""
+        data = b''
+        while len(data) < n:
+            chunk = client.recv(n - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+    
     def _handle_command(self, command):
         """Simulate handling a command."""
         if command == 'test':
             return 'test response'
         elif command == 'players':
             return 'Players connected (1):\nTestPlayer'
+        elif command.startswith('echo '):
+            return command[5:]
+        elif command.startswith('payload '):
+            return 'x' * int(command[8:])
+        elif command == 'help':
+            return '\n'.join(f'command{i} : description of command {i}' for i in range(300))
+        elif command == 'hang':
+            return None  # never answered, like a wedged server
         else:
             return f'Unknown command: {command}'
 
@@ -188,3 +279,545 @@ def test_rcon_execute_command():
     finally:
         server.stop()
         time.sleep(0.2)
+
+
+def test_rcon_execute_pipelined():
+    """Test pipelined execution returns replies in command order."""
+    server = MockRCONServer(port=19996)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = RCONClient('127.0.0.1', 19996, 'testpass')
+        client.connect()
+        
+        commands = [f'echo {i}' for i in range(50)]
+        responses = client.execute_pipelined(commands, window=8)
+        assert responses == [str(i) for i in range(50)]
+        assert not client._pending
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_read_response_out_of_order():
+    """Test replies are correlated by request id, not arrival order."""
+    server = MockRCONServer(port=19995)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = RCONClient('127.0.0.1', 19995, 'testpass')
+        client.connect()
+        
+        first = client.send_command('echo first')
+        second = client.send_command('echo second')
+        assert client.read_response(second) == 'second'
+        assert client.read_response(first) == 'first'
+        
+        # Blocking API still works on the same socket afterwards
+        assert client.execute_command('test') == 'test response'
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_async_rcon_concurrent_commands():
+    """Test AsyncRCONClient auth handshake and concurrent commands."""
+    import asyncio
+    server = MockRCONServer(port=19994)
+    server.start()
+    time.sleep(0.2)
+    
+    async def run():
+        async with AsyncRCONClient('127.0.0.1', 19994, 'testpass', timeout=2) as client:
+            assert client.authenticated
+            replies = await asyncio.gather(*(client.execute_command(f'echo {i}') for i in range(20)))
+            assert list(replies) == [str(i) for i in range(20)]
+        assert not client.authenticated
+    
+    try:
+        asyncio.run(run())
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_async_rcon_wrong_password():
+    """Test AsyncRCONClient reports authentication failure."""
+    import asyncio
+    import pytest
+    server = MockRCONServer(port=19993)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = AsyncRCONClient('127.0.0.1', 19993, 'wrongpass', timeout=2)
+        with pytest.raises(Exception) as exc:
+            asyncio.run(client.connect())
+        assert 'Authentication failed' in str(exc.value)
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_pool_reuses_and_recreates_connections():
+    """Test the pool reuses idle sessions and replaces dead ones."""
+    server = MockRCONServer(port=19992)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        pool = RCONConnectionPool('127.0.0.1', 19992, 'testpass', size=2, reserved=1)
+        pool.connect()
+        for _ in range(5):
+            assert pool.execute_command('test') == 'test response'
+        assert pool.stats()['created'] == 1
+        
+        # Kill the idle session behind the pool's back
+        client = pool.acquire()
+        pool.release(client)
+        client.disconnect()
+        assert pool.execute_command('test') == 'test response'
+        assert pool.stats()['created'] == 2
+        assert pool.stats()['discarded'] == 1
+        
+        pool.disconnect()
+        assert not pool.authenticated
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_pool_reserves_connection_for_urgent_traffic():
+    """Test urgent commands get through while normal slots are busy."""
+    import pytest
+    server = MockRCONServer(port=19991)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        pool = RCONConnectionPool('127.0.0.1', 19991, 'testpass', size=2, reserved=1)
+        pool.connect()
+        busy = pool.acquire()
+        
+        with pytest.raises(Exception) as exc:
+            pool.acquire(timeout=0.2)
+        assert 'No RCON connection available' in str(exc.value)
+        
+        assert pool.execute_command('echo restart', urgent=True) == 'restart'
+        pool.release(busy)
+        pool.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+HELP_TEXT = '\n'.join(f'command{i} : description of command {i}' for i in range(300))
+
+
+def test_rcon_multi_packet_reassembly():
+    """Test split replies are reassembled using the sentinel packet."""
+    server = MockRCONServer(port=19990, split_size=4096, mirror_sentinel=True)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = RCONClient('127.0.0.1', 19990, 'testpass')
+        client.connect()
+        assert client.multi_packet is None  # no probe round trip at connect
+        
+        # The first reply already fills whole packets and is still reassembled
+        assert client.execute_command('help') == HELP_TEXT
+        # Nothing left on the socket for the next command, and the mirrored
+        # sentinel read on the way has settled multi-packet support
+        assert client.execute_command('test') == 'test response'
+        assert client.multi_packet is True
+        assert client.execute_pipelined(['help', 'echo x', 'help']) == [HELP_TEXT, 'x', HELP_TEXT]
+        
+        chunks = list(client.iter_response('help'))
+        assert len(chunks) > 1
+        assert ''.join(chunks) == HELP_TEXT
+        
+        # Abandoning the stream early still leaves the socket in sync
+        stream = client.iter_response('help')
+        next(stream)
+        stream.close()
+        assert client.execute_command('echo after') == 'after'
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_sentinel_echo_before_reply():
+    """Test a sentinel mirrored ahead of its command's reply does not end it empty."""
+    server = MockRCONServer(port=19979, mirror_sentinel=True, reply_delay=0.05)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = RCONClient('127.0.0.1', 19979, 'testpass')
+        client.connect()
+        assert client.execute_command('test') == 'test response'
+        assert client.multi_packet is True
+        assert client.execute_command('echo x') == 'x'
+        assert client.execute_pipelined(['echo a', 'players', 'echo b']) == [
+            'a', 'Players connected (1):\nTestPlayer', 'b']
+        assert list(client.iter_response('echo streamed')) == ['streamed']
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_split_reply_times_out_when_tail_is_late():
+    """Test a split reply whose last packet misses the timeout is not returned partial."""
+    import pytest
+    server = MockRCONServer(port=19978, split_size=4096, mirror_sentinel=True, tail_delay=0.6)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = RCONClient('127.0.0.1', 19978, 'testpass', multi_packet=True,
+                            latency=LatencyTracker(default_timeout=0.3))
+        client.connect()
+        with pytest.raises(Exception, match='timed out'):
+            client.execute_command('help')
+        
+        # The late tail is discarded rather than taken for the next reply
+        time.sleep(0.5)
+        assert client.execute_command('test') == 'test response'
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_without_sentinel_support_reads_single_packet():
+    """Test servers that ignore sentinels fall back to one packet per reply."""
+    server = MockRCONServer(port=19989)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = RCONClient('127.0.0.1', 19989, 'testpass')
+        client.connect()
+        assert client.execute_command('test') == 'test response'
+        # The second reply overtakes the first command's unanswered sentinel
+        assert client.execute_command('echo x') == 'x'
+        assert client.multi_packet is False
+        assert list(client.iter_response('help')) == [HELP_TEXT]
+        client.disconnect()
+        
+        # A full first reply waits for a continuation only until its timeout
+        client = RCONClient('127.0.0.1', 19989, 'testpass',
+                            latency=LatencyTracker(default_timeout=0.3))
+        client.connect()
+        assert client.execute_command('help') == HELP_TEXT
+        assert client.multi_packet is False
+        assert client.execute_command('test') == 'test response'
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_resilient_session_replays_idempotent_commands_after_restart():
+    """Test the session reconnects, replays safe commands and records outages."""
+    import pytest
+    server = MockRCONServer(port=19988)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        session = ResilientRCONSession(RCONClient('127.0.0.1', 19988, 'testpass'),
+                                       initial_backoff=0.1, max_backoff=0.2)
+        session.connect()
+        assert session.execute_command('players').startswith('Players connected')
+        
+        # Quick restart: a read-only command is replayed transparently
+        server.stop()
+        server = MockRCONServer(port=19988)
+        server.start()
+        assert session.execute_command('players').startswith('Players connected')
+        assert session.stats()['replays'] == 1
+        assert session.stats()['reconnects'] == 1
+        
+        # Server down: other commands fail instead of being sent twice
+        server.stop()
+        with pytest.raises(RCONConnectionError):
+            session.execute_command('echo hi')
+        assert not session.connected
+        with pytest.raises(RCONConnectionError):
+            session.execute_command('players')
+        
+        server = MockRCONServer(port=19988)
+        server.start()
+        time.sleep(0.3)
+        assert session.execute_command('echo back') == 'back'
+        stats = session.stats()
+        assert stats['connected']
+        assert stats['reconnects'] == 2
+        assert stats['outages'][-1]['attempts'] >= 2
+        assert stats['last_outage'] > 0
+        session.disconnect()
+        assert not session.authenticated
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_resilient_session_keepalive_recovers_without_traffic():
+    """Test the keepalive thread notices a restart and reconnects on its own."""
+    server = MockRCONServer(port=19987)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        pool = RCONConnectionPool('127.0.0.1', 19987, 'testpass')
+        session = ResilientRCONSession(pool, keepalive_interval=0.1,
+                                       initial_backoff=0.1, max_backoff=0.2)
+        session.KEEPALIVE_TICK = 0.05
+        session.connect()
+        session.start_keepalive()
+        
+        server.stop()
+        time.sleep(0.5)
+        assert not session.connected
+        
+        server = MockRCONServer(port=19987)
+        server.start()
+        deadline = time.time() + 3
+        while not session.connected and time.time() < deadline:
+            time.sleep(0.05)
+        assert session.connected
+        assert session.stats()['reconnects'] == 1
+        session.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_worker_runs_commands_in_background():
+    """Test the worker resolves futures and keeps an urgent lane free."""
+    import pytest
+    server = MockRCONServer(port=19986)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        pool = RCONConnectionPool('127.0.0.1', 19986, 'testpass')
+        pool.connect()
+        worker = RCONWorker(pool, threads=2)
+        
+        futures = [worker.submit(f'echo {i}') for i in range(10)]
+        assert [f.result(timeout=5) for f in futures] == [str(i) for i in range(10)]
+        
+        # Both ordinary threads busy: urgent commands still go straight through
+        release = threading.Event()
+        busy = [worker.submit_call(release.wait, 5) for _ in range(2)]
+        assert worker.submit('echo restart', urgent=True).result(timeout=2) == 'restart'
+        release.set()
+        assert all(f.result(timeout=5) for f in busy)
+        
+        # Errors are delivered through the future, not raised in the thread
+        pool.disconnect()
+        with pytest.raises(RCONConnectionError):
+            worker.submit('test').result(timeout=5)
+        
+        worker.shutdown(wait=True)
+        with pytest.raises(Exception):
+            worker.submit('test')
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_worker_accepts_bare_client_at_any_priority():
+    """Test a worker wrapping a plain RCONClient takes urgent and bulk work."""
+    server = MockRCONServer(port=19982)
+    server.start()
+    time.sleep(0.2)
+
+    try:
+        client = RCONClient('127.0.0.1', 19982, 'testpass')
+        client.connect()
+        worker = RCONWorker(client, threads=1)
+
+        assert worker.submit('echo urgent', urgent=True).result(timeout=5) == 'urgent'
+        assert worker.submit('echo bulk', priority=PRIORITY_BULK).result(timeout=5) == 'bulk'
+        assert worker.submit('echo plain').result(timeout=5) == 'plain'
+
+        worker.shutdown(wait=True)
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_execute_many_reports_each_command():
+    """Test execute_many returns per-command results, timings and progress."""
+    server = MockRCONServer(port=19985)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        client = RCONClient('127.0.0.1', 19985, 'testpass')
+        client.connect()
+        commands = [f'echo user{i}' for i in range(500)]
+        progress = []
+        
+        start = time.time()
+        results = client.execute_many(commands, progress=lambda done, total: progress.append(done))
+        assert time.time() - start < 5
+        
+        assert [r['command'] for r in results] == commands
+        assert [r['response'] for r in results] == [f'user{i}' for i in range(500)]
+        assert all(r['error'] is None and r['elapsed'] >= 0 for r in results)
+        assert progress == list(range(1, 501))
+        
+        # A dropped connection fails the unanswered commands, not the whole call
+        server.stop()
+        results = client.execute_many(['echo a', 'echo b'])
+        assert all(r['error'] for r in results)
+        assert not client.authenticated
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_adaptive_timeout_detects_hung_command():
+    """Test per-verb latency is tracked and a hung command fails fast."""
+    import pytest
+    server = MockRCONServer(port=19984, latency=0.02)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        tracker = LatencyTracker(min_samples=5, floor=0.3)
+        client = RCONClient('127.0.0.1', 19984, 'testpass', latency=tracker)
+        client.connect()
+        for i in range(10):
+            client.execute_command(f'echo {i}')
+        
+        stats = client.latency_stats()['echo']
+        assert stats['count'] == 10
+        assert 0.015 < stats['p50'] <= stats['p99'] < 0.3
+        assert sum(count for _, count in stats['histogram']) == 10
+        assert stats['timeout'] == tracker.timeout_for('echo') == 0.3
+        # Verbs without enough samples keep the default
+        assert tracker.timeout_for('save') == tracker.default_timeout
+        
+        # A normally quick verb that stops answering is reported as hung
+        for _ in range(5):
+            tracker.record('hang', 0.02)
+        start = time.time()
+        with pytest.raises(Exception, match='timed out'):
+            client.execute_command('hang')
+        assert time.time() - start < 1
+        
+        # Streaming reports the hang too, rather than ending as if complete
+        start = time.time()
+        with pytest.raises(Exception, match='timed out'):
+            list(client.iter_response('hang'))
+        assert time.time() - start < 1
+        
+        # The session is still usable afterwards
+        assert client.execute_command('echo ok') == 'ok'
+        client.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_pool_paces_batches_through_rate_limiter():
+    """Test a limited pool sends batches in chunks at the configured rate."""
+    server = MockRCONServer(port=19983)
+    server.start()
+    time.sleep(0.2)
+    
+    try:
+        limiter = RCONRateLimiter(rate=200, burst=10)
+        pool = RCONConnectionPool('127.0.0.1', 19983, 'testpass', limiter=limiter)
+        pool.connect()
+        progress = []
+        
+        start = time.time()
+        results = pool.execute_many([f'echo {i}' for i in range(50)], priority=PRIORITY_BULK,
+                                    progress=lambda done, total: progress.append((done, total)))
+        elapsed = time.time() - start
+        
+        assert [r['response'] for r in results] == [str(i) for i in range(50)]
+        assert progress[-1] == (50, 50) and progress == sorted(progress)
+        # 10 free in the burst, the other 40 at 200/s
+        assert 0.15 <= elapsed < 2
+        
+        assert pool.execute_command('echo now', priority=PRIORITY_URGENT) == 'now'
+        classes = limiter.stats()['classes']
+        assert classes['bulk']['granted'] == 50
+        assert classes['urgent']['granted'] == 1
+        pool.disconnect()
+    finally:
+        server.stop()
+        time.sleep(0.2)
+
+
+def test_rcon_fleet_connects_and_queries_servers_concurrently():
+    """Test the fleet talks to every server in parallel and isolates failures."""
+    servers = [MockRCONServer(port=port, latency=0.3) for port in (19982, 19981)]
+    for server in servers:
+        server.start()
+    time.sleep(0.2)
+    
+    fleet = RCONFleet()
+    try:
+        fleet.add('alpha', '127.0.0.1', 19982, 'testpass', server_path='/srv/alpha')
+        fleet.add('beta', '127.0.0.1', 19981, 'testpass')
+        fleet.add('gamma', '127.0.0.1', 19980, 'testpass')  # nothing listening
+        
+        start = time.time()
+        errors = fleet.connect_all()
+        connect_time = time.time() - start
+        assert errors['alpha'] is None and errors['beta'] is None
+        assert 'refused' in errors['gamma'].lower()
+        assert fleet.get('gamma')['error'] == errors['gamma']
+        assert fleet.connected_names() == ['alpha', 'beta']
+        assert fleet.get('alpha')['info'] == {'server_path': '/srv/alpha'}
+        
+        start = time.time()
+        results = fleet.run_all(lambda server: server['connection'].execute_command('echo ' + server['name']))
+        assert time.time() - start < 0.6  # one round trip, not two
+        assert {name: r['result'] for name, r in results.items()} == {'alpha': 'alpha', 'beta': 'beta'}
+        assert all(r['elapsed'] >= 0.3 for r in results.values())
+        
+        # Each server has its own worker
+        assert fleet.get('alpha')['worker'].submit('test').result(timeout=5) == 'test response'
+        # Each connect takes ~0.8s here (auth plus sentinel probe); serially 1.6s
+        assert connect_time < 1.4
+        
+        # Fan-out: both copies are in flight together, failures are reported per server
+        start = time.time()
+        report = fleet.execute_all('echo restarting', names=['alpha', 'beta', 'gamma', 'delta'],
+                                   priority=PRIORITY_URGENT)
+        assert time.time() - start < 0.6
+        assert list(report) == ['alpha', 'beta', 'gamma', 'delta']
+        assert report['alpha']['result'] == report['beta']['result'] == 'restarting'
+        assert 0.3 <= report['alpha']['elapsed'] < 0.6
+        assert report['gamma']['error'] == 'Not connected'
+        assert report['delta']['error'] == 'Unknown server'
+        assert list(fleet.execute_all('test')) == ['alpha', 'beta']
+        
+        # Changing the password drops the old connection
+        fleet.add('beta', '127.0.0.1', 19981, 'other')
+        assert fleet.connected_names() == ['alpha']
+        fleet.remove('alpha')
+        assert fleet.names() == ['beta', 'gamma']
+    finally:
+        fleet.disconnect_all()
+        for server in servers:
+            server.stop()
+        time.sleep(0.2)
+
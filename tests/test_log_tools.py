@@ -0,0 +1,349 @@
+import sys
+import os
+import queue
+import time
+import tempfile
+import shutil
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import log_tools
+from log_tools import (LogIndex, LogTailer, MultiLogTailer, filter_categories, filter_pattern, filter_player, filter_time,
+                       iter_records, log_category, parse_log_line, parse_log_time, read_log_records, search_logs,
+                       tail_lines)
+
+
+@pytest.fixture(autouse=True)
+def index_cache(tmp_path, monkeypatch):
+    # Keep LogIndex files out of the real home directory
+    cache = tmp_path / 'index-cache'
+    monkeypatch.setattr(LogIndex, 'CACHE_DIR', cache)
+    return cache
+
+
+def _append(path, text):
+    with open(path, 'a', newline='') as f:
+        f.write(text)
+
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_tailer_follows_appends_and_resets(use_inotify):
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'server-console.txt')
+        _append(path, 'old line\n')
+        events = queue.Queue()
+        tailer = LogTailer(path, on_lines=lambda lines: events.put(('lines', lines)),
+                           on_reset=lambda reason: events.put(('reset', reason)),
+                           use_inotify=use_inotify)
+        tailer.start()
+        try:
+            if use_inotify and sys.platform.startswith('linux'):
+                assert tailer.using_inotify
+
+            started = time.monotonic()
+            _append(path, 'first\r\nsecond\npart')
+            assert events.get(timeout=2) == ('lines', ['first', 'second'])
+            assert time.monotonic() - started < 0.5
+
+            _append(path, 'ial\n')
+            assert events.get(timeout=2) == ('lines', ['partial'])
+
+            # Truncated in place
+            with open(path, 'w') as f:
+                f.write('')
+            _append(path, 'after truncate\n')
+            assert events.get(timeout=2) == ('reset', 'truncated')
+            assert events.get(timeout=2) == ('lines', ['after truncate'])
+
+            # Replaced by a new file (new inode)
+            new = os.path.join(tmp, 'new.txt')
+            _append(new, 'rotated in\n')
+            os.replace(new, path)
+            assert events.get(timeout=2) == ('reset', 'rotated')
+            assert events.get(timeout=2) == ('lines', ['rotated in'])
+        finally:
+            tailer.stop()
+        assert not tailer.running
+        _append(path, 'ignored\n')
+        time.sleep(0.3)
+        assert events.empty()
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_tailer_delivers_quickly_with_inotify():
+    if not sys.platform.startswith('linux'):
+        pytest.skip("inotify is Linux-only")
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'DebugLog-server.txt')
+        _append(path, '')
+        got = queue.Queue()
+        tailer = LogTailer(path, on_lines=lambda lines: got.put(time.monotonic()))
+        tailer.start()
+        try:
+            latencies = []
+            for i in range(20):
+                sent = time.monotonic()
+                _append(path, f'line {i}\n')
+                latencies.append(got.get(timeout=2) - sent)
+            latencies.sort()
+            assert latencies[len(latencies) // 2] < 0.05
+        finally:
+            tailer.stop()
+    finally:
+        shutil.rmtree(tmp)
+
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_multi_tailer_merges_files_by_time(use_inotify):
+    tmp = tempfile.mkdtemp()
+    try:
+        chat = os.path.join(tmp, '2024-04-19_02-00_chat.txt')
+        user = os.path.join(tmp, '2024-04-19_02-00_user.txt')
+        _append(chat, f"{_stamp(0)} old chat\n")
+        _append(user, '')
+        batches = queue.Queue()
+        tailer = MultiLogTailer(tmp, on_records=batches.put, merge_delay=0.2, use_inotify=use_inotify)
+        tailer.start()
+        try:
+            # Written out of order to two files, delivered in time order
+            started = time.monotonic()
+            _append(user, f'{_stamp(20)} 76561198000000001 "Alice" fully connected (1,2,0).\n')
+            _append(chat, f"{_stamp(10)} [info] Got message:ChatMessage{{chat=General, author='Bob', text='hi'}}.\n")
+            _append(user, '\tcontinued\n')
+            records = batches.get(timeout=2)
+            assert time.monotonic() - started < 1.0
+            assert [(r['category'], r['username']) for r in records] == [('chat', 'Bob'), ('user', 'Alice')]
+            assert records[1]['line'].endswith('(1,2,0).\n\tcontinued')
+
+            # A file created later is followed from its start
+            pvp = os.path.join(tmp, '2024-04-19_02-00_pvp.txt')
+            _append(pvp, f'{_stamp(30)} user "Carl" hit user "Dana"\n')
+            records = batches.get(timeout=2)
+            assert [(r['category'], r['username']) for r in records] == [('pvp', 'Carl')]
+
+            # A file moved away is dropped
+            os.makedirs(os.path.join(tmp, 'logs_19-04-24'))
+            os.replace(chat, os.path.join(tmp, 'logs_19-04-24', os.path.basename(chat)))
+            deadline = time.monotonic() + 2
+            while Path(chat) in tailer.offsets and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert sorted(p.name for p in tailer.offsets) == [os.path.basename(pvp), os.path.basename(user)]
+        finally:
+            tailer.stop()
+        assert not tailer.running
+        assert batches.empty()
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_tail_lines_reads_backwards():
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'DebugLog-server.txt')
+        lines = [f'[19-04-24 02:00:{i % 60:02d}.000] LOG  : General     , line {i} é' for i in range(5000)]
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write('\r\n'.join(lines[:10]) + '\r\n' + '\n'.join(lines[10:]) + '\nstill being wri')
+
+        complete = os.path.getsize(path) - len('still being wri')
+        for block_size in (7, 100, 64 * 1024):
+            assert tail_lines(path, 3, block_size) == (lines[-3:], complete)
+            assert tail_lines(path, 4995, block_size) == (lines[5:], complete)
+            assert tail_lines(path, 10000, block_size) == (lines, complete)
+        assert tail_lines(path, 0) == ([], complete)
+
+        with open(path, 'w') as f:
+            f.write('')
+        assert tail_lines(path, 10) == ([], 0)
+    finally:
+        shutil.rmtree(tmp)
+
+
+def _stamp(seconds):
+    return (datetime(2024, 4, 19, 2, 0, 0) + timedelta(seconds=seconds)).strftime('[%d-%m-%y %H:%M:%S.%f')[:-3] + ']'
+
+
+def test_log_index_reads_time_ranges(index_cache):
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, '2024-04-19_02-00_DebugLog-server.txt')
+        with open(path, 'w') as f:
+            for i in range(20000):
+                f.write(f'{_stamp(i)} LOG  : General     , event {i}\n')
+                if i % 1000 == 0:
+                    f.write('    at zombie.Stack.trace(Unknown Source)\n')
+        base = datetime(2024, 4, 19, 2, 0, 0).timestamp()
+        assert parse_log_time(_stamp(61.5) + ' x') == base + 61.5
+        assert parse_log_time('    at zombie') is None
+
+        index = LogIndex(path, stride=4096)
+        assert index.update() > 100
+        assert index.span[0] == base
+        lines = list(index.lines_between(base + 5000, base + 5002))
+        assert lines == [
+            f'{_stamp(5000)} LOG  : General     , event 5000',
+            '    at zombie.Stack.trace(Unknown Source)',
+            f'{_stamp(5001)} LOG  : General     , event 5001',
+            f'{_stamp(5002)} LOG  : General     , event 5002',
+        ]
+        # One seek lands within a stride of the start
+        with open(path, 'rb') as f:
+            target = f.read().index(_stamp(5000).encode())
+        assert target - 4096 <= index.offset_for(base + 5000) < target
+
+        # The index is kept in the tool's cache, never beside the server's logs
+        assert os.listdir(tmp) == [os.path.basename(path)]
+        assert [p.name for p in index_cache.iterdir()] == [index.index_path.name]
+
+        # Appends are indexed incrementally, also by a fresh instance reading
+        # the index file
+        entries = len(index)
+        with open(path, 'a') as f:
+            for i in range(20000, 21000):
+                f.write(f'{_stamp(i)} LOG  : General     , event {i}\n')
+            f.write(f'{_stamp(21000)} LOG  : General     , half writ')
+        reloaded = LogIndex(path, stride=4096)
+        assert len(reloaded) == entries
+        assert reloaded.update() > 0
+        assert list(reloaded.lines_between(base + 20999)) == [
+            f'{_stamp(20999)} LOG  : General     , event 20999',
+            f'{_stamp(21000)} LOG  : General     , half writ']
+        assert len(reloaded) == len(LogIndex(path, stride=4096)) > entries
+
+        # A replaced file is indexed from scratch
+        with open(path + '.new', 'w') as f:
+            f.write(f'{_stamp(0)} LOG  : General     , restarted\n')
+        os.replace(path + '.new', path)
+        assert list(reloaded.lines_between(base - 1, base + 1)) == [
+            f'{_stamp(0)} LOG  : General     , restarted']
+        assert len(reloaded) == 1
+        assert reloaded.index_path != index.index_path
+
+        # An unusable cache directory leaves the index in memory
+        blocked = os.path.join(tmp, 'not-a-dir')
+        open(blocked, 'w').close()
+        in_memory = LogIndex(path, stride=4096, cache_dir=blocked)
+        assert in_memory.update() == 1
+        assert not in_memory.persistent
+        assert list(in_memory.lines_between(base - 1, base + 1)) == [
+            f'{_stamp(0)} LOG  : General     , restarted']
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_records_pipeline():
+    tmp = tempfile.mkdtemp()
+    try:
+        def write(name, lines):
+            path = os.path.join(tmp, name)
+            with open(path, 'w') as f:
+                f.write(''.join(line + '\n' for line in lines))
+            return path
+
+        chat = write('2024-04-19_02-00_chat.txt', [
+            f"{_stamp(10)} [info] Got message:ChatMessage{{chat=General, author='Alice', text='anyone near muldraugh?'}}.",
+            f"{_stamp(70)} [info] Got message:ChatMessage{{chat=General, author='Bob', text='yes'}}.",
+        ])
+        user = write('2024-04-19_02-00_user.txt', [
+            f'{_stamp(5)} 76561198000000001 "Alice" fully connected (10,20,0).',
+            f'{_stamp(65)} 76561198000000002 "Bob" fully connected (30,40,0).',
+        ])
+        debug = write('2024-04-19_02-00_DebugLog-server.txt', [
+            f'{_stamp(0)} LOG  : General     , 1713492000000> 1,234> Server started.',
+            f'{_stamp(80)} ERROR: General     , 1713492080000> 2,345> Exception thrown',
+            '\tat zombie.core.Thing.run(Thing.java:42)',
+        ])
+        base = datetime(2024, 4, 19, 2, 0, 0).timestamp()
+
+        records = list(read_log_records([debug, user, chat]))
+        assert [(r['category'], r['username']) for r in records] == [
+            ('DebugLog', None), ('DebugLog', None), ('user', 'Alice'), ('user', 'Bob'),
+            ('chat', 'Alice'), ('chat', 'Bob')]
+        assert records[0]['message'] == 'Server started.'
+        assert records[1]['message'] == 'Exception thrown\n\tat zombie.core.Thing.run(Thing.java:42)'
+        assert records[2]['steamid'] == '76561198000000001'
+        assert records[2]['message'] == 'fully connected (10,20,0).'
+        assert records[2]['time'] == base + 5
+
+        alice = read_log_records([debug, user, chat], player='alice')
+        assert [r['category'] for r in alice] == ['user', 'chat']
+        assert [r['username'] for r in read_log_records([chat, user], categories=['chat'], pattern='MULDRAUGH')] == ['Alice']
+        window = read_log_records([debug, user, chat], start=base + 60, end=base + 75)
+        assert [(r['category'], r['time'] - base) for r in window] == [('user', 65), ('chat', 70)]
+
+        # Filters compose over any record stream
+        stream = filter_time(filter_categories(iter_records(debug), ['DebugLog']), start=base + 1)
+        assert [r['message'].split('\n')[0] for r in stream] == ['Exception thrown']
+        assert parse_log_line('\tat zombie') is None
+        assert log_category(debug) == 'DebugLog' and log_category(chat) == 'chat'
+    finally:
+        shutil.rmtree(tmp)
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_skipped_blocks_match_plain_filtering(monkeypatch, newline):
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, '2024-04-19_02-00_user.txt')
+        with open(path, 'w', newline=newline) as f:
+            for i in range(3000):
+                f.write(f'{_stamp(i)} 7656119800000{i % 50:04d} "User{i % 50}" did thing {i}.\n')
+                if i % 97 == 0:
+                    f.write(f'\tdetail for Rare{i}\n')
+        base = datetime(2024, 4, 19, 2, 0, 0).timestamp()
+        monkeypatch.setattr(log_tools, 'READ_BLOCK_SIZE', 512)
+
+        every = list(iter_records(path))
+        assert len(every) == 3000
+        cases = [
+            (dict(player='user7'), list(filter_player(every, 'user7'))),
+            (dict(pattern='rare1'), list(filter_pattern(every, 'rare1'))),
+            (dict(pattern=r'Rare\d*3$'), list(filter_pattern(every, r'Rare\d*3$'))),
+            (dict(pattern='rare', end=base + 1500), list(filter_time(filter_pattern(every, 'rare'), end=base + 1500))),
+        ]
+        for kwargs, expected in cases:
+            assert expected
+            assert list(read_log_records([path], **kwargs)) == expected
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_search_logs_in_chunks_and_archives():
+    tmp = tempfile.mkdtemp()
+    try:
+        os.makedirs(os.path.join(tmp, 'logs_19-04-24'))
+        old = os.path.join(tmp, 'logs_19-04-24', '2024-04-19_02-00_DebugLog-server.txt')
+        current = os.path.join(tmp, '2024-04-20_02-00_chat.txt')
+        with open(old, 'w', newline='') as f:
+            for i in range(5000):
+                f.write(f'{_stamp(i)} LOG  : General     , zombie update {i}\r\n')
+        with open(current, 'w') as f:
+            f.write("before\nAlice said Hello\nafter\nno newline: hello")
+        os.utime(old, (1, 1))
+        paths = log_tools.find_log_files(tmp)
+        assert paths == [Path(old), Path(current)]
+
+        expected = [(Path(old), 4201), (Path(old), 4202), (Path(current), 2), (Path(current), 4)]
+        query = r'update 420[01]$|HELLO'
+        # In this process, and in a pool with small chunks (line numbers
+        # carry across chunk boundaries)
+        for kwargs in (dict(processes=1), dict(processes=2, chunk_size=4096)):
+            matches = list(search_logs(paths, query, regex=True, **kwargs))
+            assert [(m['path'], m['line_no']) for m in matches] == expected
+        assert matches[0]['line'] == f'{_stamp(4200)} LOG  : General     , zombie update 4200'
+
+        literal = list(search_logs(paths, 'hello', context=1, chunk_size=4096))
+        assert [m['line'] for m in literal] == ['Alice said Hello', 'no newline: hello']
+        assert literal[0]['before'] == ['before'] and literal[0]['after'] == ['after']
+        assert literal[1]['after'] == []
+        assert [m['line'] for m in search_logs(paths, 'hello', ignore_case=False)] == ['no newline: hello']
+        assert [m['line_no'] for m in search_logs(paths, 'zombie update', max_matches=3)] == [1, 2, 3]
+        with pytest.raises(ValueError):
+            list(search_logs(paths, ''))
+    finally:
+        shutil.rmtree(tmp)
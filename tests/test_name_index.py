@@ -0,0 +1,40 @@
+import sys
+import os
+import random
+import string
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from utils import NameIndex
+
+
+def test_prefix_substring_and_typo_matches():
+    index = NameIndex(['Alice', 'alicia', 'Bob', 'MalIcEx', 'Zed'])
+    assert index.complete('ali') == ['Alice', 'alicia', 'MalIcEx']
+    assert index.complete('ALI', limit=1) == ['Alice']
+    assert index.complete('alcie') == []  # no shared trigram with a transposition this short
+    assert index.complete('alicja') == ['Alice', 'alicia', 'MalIcEx']  # one typo
+    assert index.complete('') == []
+    assert 'bob' in index and len(index) == 5
+
+
+def test_incremental_add():
+    index = NameIndex()
+    assert index.add('Charlie')
+    assert not index.add('  charlie ')
+    assert not index.add('')
+    assert index.add_many(['Charles', 'Charlie', 'Chad']) == 2
+    assert index.complete('cha') == ['Chad', 'Charles', 'Charlie']
+
+
+def test_completion_is_fast_on_large_index():
+    rng = random.Random(1)
+    names = {''.join(rng.choice(string.ascii_letters + string.digits + '_') for _ in range(rng.randint(4, 16)))
+             for _ in range(20000)}
+    index = NameIndex(names)
+    queries = [name[:n] for name in list(names)[:200] for n in (1, 3, 6)]
+    start = time.perf_counter()
+    for query in queries:
+        index.complete(query)
+    per_query = (time.perf_counter() - start) / len(queries)
+    assert per_query < 0.001
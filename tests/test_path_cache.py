@@ -0,0 +1,71 @@
+import sys
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from utils import ServerPathCache
+
+
+def _touch(path, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('')
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_locates_and_persists(monkeypatch):
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        monkeypatch.setattr(Path, 'home', classmethod(lambda cls: tmp / 'home'))
+        root = tmp / 'Zomboid'
+        _touch(root / 'Server' / 'servertest.ini')
+        _touch(root / 'Server' / 'servertest_SandboxVars.lua')
+        (root / 'Logs').mkdir()
+        _touch(root / 'Saves' / 'Multiplayer' / 'servertest' / 'players.db', mtime=1000)
+        _touch(root / 'Saves' / 'Multiplayer' / 'other' / 'players.db', mtime=2000)
+        cache_file = tmp / 'paths.json'
+
+        paths = ServerPathCache(cache_file)
+        assert paths.find(root, 'config') == [root / 'Server' / 'servertest.ini']
+        assert paths.find(root, 'sandbox') == [root / 'Server' / 'servertest_SandboxVars.lua']
+        assert paths.find_one(root, 'logs') == root / 'Logs'
+        # The save named after the config wins over a newer one
+        assert paths.find_one(root, 'players_db') == root / 'Saves' / 'Multiplayer' / 'servertest' / 'players.db'
+        assert paths.find_one(root, 'banlist') is None
+
+        # A new session uses the cached paths without searching
+        paths = ServerPathCache(cache_file)
+        paths._locate_players_db = None  # searching would fail
+        assert paths.find_one(root, 'players_db') == root / 'Saves' / 'Multiplayer' / 'servertest' / 'players.db'
+        del paths._locate_players_db
+
+        # A cached path that disappears triggers a new search
+        os.remove(root / 'Saves' / 'Multiplayer' / 'servertest' / 'players.db')
+        assert paths.find_one(root, 'players_db') == root / 'Saves' / 'Multiplayer' / 'other' / 'players.db'
+
+        # A listed directory that changes is listed again
+        _touch(root / 'Server' / 'backup.ini')
+        os.utime(root / 'Server', ns=(1, 1))
+        assert paths.find(root, 'config') == [root / 'Server' / 'backup.ini', root / 'Server' / 'servertest.ini']
+
+        # Misses are not cached
+        _touch(root / 'Server' / 'banlist.txt')
+        assert paths.find_one(root, 'banlist') == root / 'Server' / 'banlist.txt'
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_unreadable_cache_file_is_ignored(monkeypatch):
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        monkeypatch.setattr(Path, 'home', classmethod(lambda cls: tmp / 'home'))
+        cache_file = tmp / 'paths.json'
+        cache_file.write_text('{not json')
+        paths = ServerPathCache(cache_file)
+        assert paths.find(tmp / 'missing', 'logs') == []
+        paths.forget()
+        assert cache_file.read_text().strip() == '{}'
+    finally:
+        shutil.rmtree(tmp)
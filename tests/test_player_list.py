@@ -0,0 +1,20 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from utils import parse_player_list, diff_keyed
+
+
+def test_parse_player_list():
+    response = 'Players connected (3): \nAlice\n\n  Bob \nAlice\nCarol\n'
+    assert parse_player_list(response) == ['Alice', 'Bob', 'Carol']
+    assert parse_player_list('Players connected (0): ') == []
+    assert parse_player_list(None) == []
+
+
+def test_diff_keyed_reports_joins_and_leaves():
+    joined, left, unchanged = diff_keyed(['Alice', 'Bob', 'Carol'], ['Carol', 'Dave', 'Alice'])
+    assert joined == ['Dave']
+    assert left == ['Bob']
+    assert unchanged == ['Carol', 'Alice']
+    assert diff_keyed([], []) == ([], [], [])
@@ -0,0 +1,70 @@
+import sys
+import os
+import tempfile
+import shutil
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from player_sessions import PlayerSessionDB, parse_user_log_line
+
+BASE = datetime(2024, 4, 19, 2, 0, 0)
+
+
+def _line(minutes, steamid, name, event, coords='10892,9876,0'):
+    stamp = (BASE + timedelta(minutes=minutes)).strftime('%d-%m-%y %H:%M:%S.000')
+    return f'[{stamp}] {steamid} "{name}" {event} ({coords}).\n'
+
+
+def _ts(minutes):
+    return (BASE + timedelta(minutes=minutes)).timestamp()
+
+
+def test_parse_user_log_line():
+    event = parse_user_log_line(_line(5, '76561198000000001', 'Alice', 'fully connected', '10,-20,0'))
+    assert event == {'time': _ts(5), 'kind': 'connect', 'username': 'Alice',
+                     'steamid': '76561198000000001', 'x': 10.0, 'y': -20.0, 'z': 0.0}
+    assert parse_user_log_line(_line(6, '1', 'Bob', 'disconnected player'))['kind'] == 'disconnect'
+    assert parse_user_log_line('[19-04-24 02:00:00.000] 1 "Bob" attempting to join.\n') is None
+
+
+def test_sessions_from_backfill_and_tail():
+    tmp = tempfile.mkdtemp()
+    try:
+        archive = os.path.join(tmp, 'logs_18-04-24')
+        os.makedirs(archive)
+        with open(os.path.join(archive, '2024-04-18_23-00_user.txt'), 'w') as f:
+            f.write(_line(-120, '1', 'Alice', 'fully connected'))
+            f.write(_line(-60, '1', 'Alice', 'disconnected player'))
+        live = os.path.join(tmp, '2024-04-19_02-00_user.txt')
+        with open(live, 'w') as f:
+            f.write(_line(0, '1', 'Alice', 'fully connected'))
+            f.write(_line(10, '2', 'Bob', 'fully connected'))
+            f.write(_line(30, '1', 'Alice', 'disconnected player'))
+            f.write(_line(40, '3', 'Carol', 'fully connected', '1,2,0')[:-8])  # still being written
+        os.utime(live, (_ts(60), _ts(60)))
+
+        db = PlayerSessionDB(':memory:', tmp)
+        assert db.sync() == 3  # live file only, partial line left for later
+        assert [s['username'] for s in db.online_at(_ts(12))] == ['Alice', 'Bob']
+        assert [s['username'] for s in db.online_now()] == ['Bob']
+
+        # Older history arrives after tailing began; sessions are rebuilt in order
+        assert db.backfill() == 2
+        assert db.sync() == 0
+        assert [s['username'] for s in db.online_at(_ts(-90))] == ['Alice']
+        assert db.online_at(_ts(-30)) == []
+
+        with open(live, 'a') as f:
+            f.write(_line(40, '3', 'Carol', 'fully connected', '1,2,0')[-8:])
+            f.write(_line(50, '2', 'Bob', 'disconnected player'))
+        assert db.sync() == 2
+        carol = db.online_now()
+        assert [(s['username'], s['x'], s['y']) for s in carol] == [('Carol', 1.0, 2.0)]
+
+        top = db.top_playtime(since=_ts(-120), until=_ts(60))
+        assert [(t['username'], round(t['seconds']), t['sessions']) for t in top] == [
+            ('Alice', 90 * 60, 2), ('Bob', 40 * 60, 1), ('Carol', 20 * 60, 1)]
+        assert db.stats() == {'events': 7, 'sessions': 4, 'online': 1}
+        db.close()
+    finally:
+        shutil.rmtree(tmp)
@@ -0,0 +1,89 @@
+import sys
+import os
+import sqlite3
+import tempfile
+import shutil
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from players_db import PlayersDB
+
+
+def _make_db(path, rows=2500):
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE networkPlayers (id INTEGER PRIMARY KEY AUTOINCREMENT, world TEXT, '
+                 'username TEXT, playername TEXT, x FLOAT, y FLOAT, z FLOAT, data BLOB, isDead BOOLEAN)')
+    conn.execute('CREATE TABLE whitelist (id INTEGER PRIMARY KEY, username TEXT)')
+    conn.executemany(
+        'INSERT INTO networkPlayers (world, username, playername, x, y, z, data, isDead) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        [('Muldraugh', f'user{i}', f'Char {i}', 10000 + i, 9000 + i % 50, 0, b'\0' * 64, 0)
+         for i in range(rows)])
+    conn.commit()
+    conn.close()
+
+
+def test_keyset_pages_cover_table_once():
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'players.db')
+        _make_db(path)
+        db = PlayersDB(path)
+        assert db.tables() == ['networkPlayers', 'whitelist']
+
+        seen = []
+        page = db.page('networkPlayers', limit=300)
+        assert page['prev'] is None
+        assert page['columns'][:3] == ['rowid', 'id', 'world']
+        assert page['rows'][0][page['columns'].index('data')] == 64  # blob shown by size
+        while True:
+            seen.extend(row[0] for row in page['rows'])
+            if page['next'] is None:
+                break
+            page = db.page('networkPlayers', after=page['next'], limit=300)
+        assert seen == list(range(1, 2501))
+
+        # Paging backwards from the last page returns the page before it
+        back = db.page('networkPlayers', before=page['prev'], limit=300)
+        assert [row[0] for row in back['rows']] == list(range(2101, 2401))
+        assert back['next'] == 2400 and back['prev'] == 2101
+        first = db.page('networkPlayers', before=301, limit=300)
+        assert first['prev'] is None and first['rows'][0][0] == 1
+        db.close()
+    finally:
+        shutil.rmtree(tmp)
+
+
+def test_filters_and_read_only():
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'players.db')
+        _make_db(path)
+        db = PlayersDB(path)
+
+        page = db.page('networkPlayers', username='USER24', limit=5)
+        names = [row[page['columns'].index('username')] for row in page['rows']]
+        assert names == ['user24', 'user240', 'user241', 'user242', 'user243']
+        assert db.count('networkPlayers', username='user24') == 1 + 10 + 100
+        assert db.count('networkPlayers', username='50%') == 0  # wildcards are literal
+
+        near = db.page('networkPlayers', near=(10100, 9000, 1))
+        assert [row[0] for row in near['rows']] == [101]
+        with pytest.raises(ValueError):
+            db.page('whitelist', near=(0, 0, 1))
+        with pytest.raises(KeyError):
+            db.page('missing')
+        with pytest.raises(sqlite3.OperationalError):
+            db._execute('DELETE FROM whitelist')
+
+        # A rewritten file is picked up (the schema cache is keyed on it)
+        conn = sqlite3.connect(path)
+        conn.execute('CREATE TABLE bannedid (steamid TEXT)')
+        conn.commit()
+        conn.close()
+        os.utime(path, ns=(1, 1))
+        assert 'bannedid' in db.tables()
+        db.close()
+    finally:
+        shutil.rmtree(tmp)
@@ -0,0 +1,203 @@
+"""Throughput and latency benchmarks for the RCON clients.
+
+Drives `MockRCONServer` with configurable reply latency, response size and
+concurrency, and reports commands/sec and p50/p95/p99 latency for each
+client mode. Run directly to benchmark and write JSON, e.g.:
+
+    python tests/test_rcon_benchmark.py --latency-ms 20 --concurrency 8 \\
+        --json rcon-bench.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import os
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.dirname(__file__))
+from rcon import RCONClient, AsyncRCONClient
+from test_integration_rcon import MockRCONServer
+
+MODES = ('blocking', 'pipelined', 'async')
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _summarize(mode, latencies, seconds, config):
+    """Build the result record for one mode."""
+    latencies = sorted(latencies)
+    record = dict(config)
+    record.update({
+        'mode': mode,
+        'seconds': round(seconds, 4),
+        'cmds_per_sec': round(len(latencies) / seconds, 1) if seconds else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+    })
+    return record
+
+
+def bench_blocking(port, command, commands, concurrency):
+    """One RCONClient per thread, each sending commands one at a time."""
+    per_thread = max(1, commands // concurrency)
+    latencies = []
+    lock = threading.Lock()
+    clients = []
+    for _ in range(concurrency):
+        client = RCONClient('127.0.0.1', port, 'testpass', multi_packet=False)
+        client.connect()
+        clients.append(client)
+
+    def worker(client):
+        local = []
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            client.execute_command(command)
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(c,)) for c in clients]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    seconds = time.perf_counter() - start
+    for client in clients:
+        client.disconnect()
+    return latencies, seconds
+
+
+def bench_pipelined(port, command, commands, concurrency):
+    """One RCONClient with `concurrency` commands in flight via execute_many."""
+    client = RCONClient('127.0.0.1', port, 'testpass', multi_packet=False)
+    client.connect()
+    start = time.perf_counter()
+    results = client.execute_many([command] * commands, window=concurrency)
+    seconds = time.perf_counter() - start
+    client.disconnect()
+    return [r['elapsed'] for r in results if r['elapsed'] is not None], seconds
+
+
+def bench_async(port, command, commands, concurrency):
+    """One AsyncRCONClient with `concurrency` tasks awaiting replies."""
+    latencies = []
+
+    async def run():
+        async with AsyncRCONClient('127.0.0.1', port, 'testpass', timeout=30) as client:
+            remaining = [commands]
+
+            async def worker():
+                while remaining[0] > 0:
+                    remaining[0] -= 1
+                    start = time.perf_counter()
+                    await client.execute_command(command)
+                    latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            return time.perf_counter() - start
+
+    seconds = asyncio.run(run())
+    return latencies, seconds
+
+
+BENCHMARKS = {
+    'blocking': bench_blocking,
+    'pipelined': bench_pipelined,
+    'async': bench_async,
+}
+
+
+def run_benchmarks(port=19950, commands=1000, concurrency=8, latency_ms=0,
+                   response_size=64, modes=MODES):
+    """Run each mode against a fresh MockRCONServer.
+
+    Args:
+        port (int): Port for the mock server
+        commands (int): Commands per mode
+        concurrency (int): Threads (blocking), in-flight window (pipelined)
+            or tasks (async)
+        latency_ms (float): Artificial reply latency added by the server
+        response_size (int): Reply body size in bytes
+        modes (iterable): Names from MODES
+
+    Returns:
+        list of dict: One record per mode with configuration, seconds,
+        cmds_per_sec and p50_ms/p95_ms/p99_ms
+    """
+    config = {
+        'commands': commands,
+        'concurrency': concurrency,
+        'latency_ms': latency_ms,
+        'response_size': response_size,
+    }
+    command = f'payload {response_size}'
+    results = []
+    for mode in modes:
+        server = MockRCONServer(port=port, latency=latency_ms / 1000.0)
+        server.start()
+        try:
+            latencies, seconds = BENCHMARKS[mode](port, command, commands, concurrency)
+        finally:
+            server.stop()
+        results.append(_summarize(mode, latencies, seconds, config))
+    return results
+
+
+def test_benchmark_smoke():
+    results = run_benchmarks(port=19949, commands=40, concurrency=4, latency_ms=2)
+    assert [r['mode'] for r in results] == list(MODES)
+    for r in results:
+        assert r['cmds_per_sec'] > 0
+        assert 0 < r['p50_ms'] <= r['p95_ms'] <= r['p99_ms']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--commands', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--response-size', type=int, default=64)
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help='comma-separated subset of: ' + ', '.join(MODES))
+    parser.add_argument('--port', type=int, default=19950)
+    parser.add_argument('--json', metavar='PATH', help='write results to this file')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(port=args.port, commands=args.commands,
+                             concurrency=args.concurrency, latency_ms=args.latency_ms,
+                             response_size=args.response_size,
+                             modes=[m.strip() for m in args.modes.split(',') if m.strip()])
+
+    print(f"{'mode':>10} {'cmds/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for r in results:
+        print(f"{r['mode']:>10} {r['cmds_per_sec']:>10,.0f} {r['p50_ms']:>9.2f} "
+              f"{r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f}")
+
+    if args.json:
+        report = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results': results,
+        }
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from rcon import RCONResponseCache
+
+
+class CountingConnection:
+    """Stand-in connection that counts commands and answers after a delay."""
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.calls = []
+        self.authenticated = True
+        self.players = ['Alice', 'Bob']
+
+    def execute_command(self, command, urgent=False):
+        self.calls.append(command)
+        time.sleep(self.delay)
+        if command.startswith('kickuser'):
+            self.players.pop()
+            return 'kicked'
+        if command == 'players':
+            return f'Players connected ({len(self.players)}):\n' + '\n'.join(self.players)
+        return f'ran {command}'
+
+    def iter_response(self, command):
+        yield self.execute_command(command)
+
+
+def test_cache_hits_within_ttl_and_expires():
+    """Test read-only commands are served from memory until their TTL passes."""
+    conn = CountingConnection()
+    cache = RCONResponseCache(conn, ttls={'players': 0.2})
+
+    first = cache.execute_command('players')
+    assert cache.execute_command('players') == first
+    assert cache.execute_command(' players ', urgent=True) == first
+    assert conn.calls == ['players']
+
+    time.sleep(0.25)
+    cache.execute_command('players')
+    assert conn.calls == ['players', 'players']
+
+    stats = cache.cache_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 2
+    assert stats['verbs']['players']['hits'] == 2
+
+
+def test_cache_collapses_concurrent_identical_requests():
+    """Test simultaneous identical reads share one server round trip."""
+    conn = CountingConnection(delay=0.2)
+    cache = RCONResponseCache(conn)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(cache.execute_command('players')))
+               for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert conn.calls == ['players']
+    assert len(set(results)) == 1 and len(results) == 5
+    assert cache.cache_stats()['collapsed'] == 4
+
+
+def test_mutating_commands_invalidate_affected_entries():
+    """Test kickuser drops the cached player list but not unrelated entries."""
+    conn = CountingConnection()
+    cache = RCONResponseCache(conn)
+
+    assert 'Bob' in cache.execute_command('players')
+    cache.execute_command('help')
+    cache.execute_command('kickuser "Bob"')
+    assert 'Bob' not in cache.execute_command('players')
+    cache.execute_command('help')
+
+    assert conn.calls == ['players', 'help', 'kickuser "Bob"', 'players']
+    assert cache.cache_stats()['verbs']['players']['invalidations'] == 1
+
+    # Streamed replies are cached once read completely
+    list(cache.iter_response('showoptions'))
+    assert list(cache.iter_response('showoptions')) == ['ran showoptions']
+    assert conn.calls.count('showoptions') == 1
+
+
+def test_read_overlapping_mutation_is_not_cached():
+    """Test a players read racing a kick is returned but never cached."""
+    conn = CountingConnection(delay=0.2)
+    cache = RCONResponseCache(conn)
+
+    reader = threading.Thread(target=cache.execute_command, args=('players',))
+    reader.start()
+    time.sleep(0.05)
+    cache.execute_command('kickuser "Bob"')
+    reader.join()
+
+    cache.execute_command('players')
+    assert conn.calls.count('players') == 2
+
+
+def test_cache_passes_other_attributes_through():
+    """Test the cache can stand in for the connection it wraps."""
+    conn = CountingConnection()
+    cache = RCONResponseCache(conn)
+    assert cache.authenticated is True
+    conn.authenticated = False
+    assert cache.authenticated is False
@@ -0,0 +1,174 @@
+import sys
+import os
+import socket
+import struct
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from rcon_codec import encode_packet, encode_batch, decode_packet, PacketReader
+
+
+def _legacy_packet(packet_id, packet_type, body):
+    """Packet built the way RCONClient used to build it."""
+    packet_data = body.encode('utf-8') + b'\x00\x00'
+    packet = struct.pack('<i', 4 + 4 + len(packet_data))
+    packet += struct.pack('<i', packet_id)
+    packet += struct.pack('<i', packet_type)
+    return packet + packet_data
+
+
+def test_encode_matches_legacy_format():
+    for body in ['', 'players', 'servermsg "Hello_world"', 'ü' * 100]:
+        assert bytes(encode_packet(7, 2, body)) == _legacy_packet(7, 2, body)
+
+
+def test_encode_batch_is_concatenation():
+    packets = [(i, 2, f'unbanuser "player{i}"') for i in range(10)]
+    expected = b''.join(_legacy_packet(*p) for p in packets)
+    assert bytes(encode_batch(packets)) == expected
+
+
+def test_decode_packet_strips_terminators():
+    data = bytes(encode_packet(5, 0, 'hello'))[4:]
+    assert decode_packet(data) == (5, 0, 'hello')
+    assert decode_packet(b'\x01\x00') is None
+
+
+def test_packet_reader_partial_and_large_packets():
+    s1, s2 = socket.socketpair()
+    try:
+        big = 'x' * 20000
+        data = bytes(encode_batch([(1, 0, 'first'), (2, 0, big), (3, 0, '')]))
+        # Dribble the bytes in to exercise partial recv_into
+        s2.sendall(data[:3])
+        time.sleep(0.02)
+        s2.sendall(data[3:])
+
+        reader = PacketReader(initial_size=16)
+        assert reader.read_packet(s1) == (1, 0, 'first')
+        assert reader.read_packet(s1) == (2, 0, big)
+        assert reader.read_packet(s1) == (3, 0, '')
+
+        s2.close()
+        assert reader.read_packet(s1) is None
+    finally:
+        s1.close()
+
+
+def test_packet_reader_resumes_after_timeout():
+    s1, s2 = socket.socketpair()
+    try:
+        s1.settimeout(0.05)
+        data = bytes(encode_batch([(1, 0, 'hello world'), (2, 0, 'next')]))
+        reader = PacketReader(initial_size=16)
+
+        # Time out inside the size field, then inside the body
+        s2.sendall(data[:2])
+        assert reader.read_packet(s1) is None
+        s2.sendall(data[2:9])
+        assert reader.read_packet(s1) is None
+        assert not reader.closed
+
+        s2.sendall(data[9:])
+        assert reader.read_packet(s1) == (1, 0, 'hello world')
+        assert reader.read_packet(s1) == (2, 0, 'next')
+    finally:
+        s1.close()
+        s2.close()
+
+
+def test_recv_exact_keeps_partial_packet():
+    s1, s2 = socket.socketpair()
+    try:
+        s1.settimeout(0.05)
+        data = bytes(encode_packet(1, 0, 'hello world'))
+        reader = PacketReader(initial_size=16)
+
+        # A timed-out read_packet holds 9 bytes; raw reads continue from them
+        s2.sendall(data[:9])
+        assert reader.read_packet(s1) is None
+        assert bytes(reader.recv_exact(s1, 4)) == data[:4]
+        assert reader.recv_exact(s1, 8) is None
+        s2.sendall(data[9:])
+        assert bytes(reader.recv_exact(s1, 8)) == data[4:12]
+        assert bytes(reader.recv_exact(s1, len(data) - 12)) == data[12:]
+        assert not reader.closed
+    finally:
+        s1.close()
+        s2.close()
+
+
+def test_packet_reader_closes_on_invalid_size():
+    s1, s2 = socket.socketpair()
+    try:
+        s2.sendall(struct.pack('<i', -5) + bytes(encode_packet(1, 0, 'lost')))
+        reader = PacketReader()
+        assert reader.read_packet(s1) is None
+        assert reader.closed
+    finally:
+        s1.close()
+        s2.close()
+
+
+def benchmark(iterations=100000, body_size=64, batch_size=32):
+    """Measure encode/decode throughput of the codec.
+
+    Returns:
+        dict: packets per second for encode_packet, encode_batch, decode_packet
+            and PacketReader.read_packet over a socketpair
+    """
+    body = 'x' * body_size
+    results = {}
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        encode_packet(i, 2, body)
+    results['encode_packet'] = iterations / (time.perf_counter() - start)
+
+    batches = max(1, iterations // batch_size)
+    packets = [(i, 2, body) for i in range(batch_size)]
+    start = time.perf_counter()
+    for _ in range(batches):
+        encode_batch(packets)
+    results['encode_batch'] = batches * batch_size / (time.perf_counter() - start)
+
+    data = bytes(encode_packet(1, 0, body))[4:]
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode_packet(data)
+    results['decode_packet'] = iterations / (time.perf_counter() - start)
+
+    # Socket round: one writer buffer, many reads through the reusable buffer
+    count = min(iterations, 20000)
+    payload = bytes(encode_batch([(i, 0, body) for i in range(count)]))
+    s1, s2 = socket.socketpair()
+    try:
+        reader = PacketReader()
+        start = time.perf_counter()
+        sent = 0
+        received = 0
+        s2.setblocking(False)
+        while received < count:
+            if sent < len(payload):
+                try:
+                    sent += s2.send(payload[sent:sent + 65536])
+                except BlockingIOError:
+                    pass
+            reader.read_packet(s1)
+            received += 1
+        results['read_packet'] = count / (time.perf_counter() - start)
+    finally:
+        s1.close()
+        s2.close()
+
+    return results
+
+
+def test_benchmark_smoke():
+    results = benchmark(iterations=2000)
+    assert all(rate > 0 for rate in results.values())
+
+
+if __name__ == '__main__':
+    for name, rate in benchmark().items():
+        print(f'{name:>14}: {rate:12,.0f} packets/s')
@@ -0,0 +1,100 @@
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+from rcon import RCONRateLimiter, RCONWorker, PRIORITY_URGENT, PRIORITY_BULK
+
+
+class RecordingConnection:
+    """Stand-in connection that records commands and the kwargs they came with."""
+
+    def __init__(self):
+        self.calls = []
+
+    def execute_command(self, command, **kwargs):
+        self.calls.append((command, kwargs))
+        return command
+
+
+def test_rate_limiter_paces_after_burst():
+    """Test the bucket allows a burst, then refills at the configured rate."""
+    limiter = RCONRateLimiter(rate=50, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+    for _ in range(10):
+        limiter.acquire(PRIORITY_BULK)
+    assert time.monotonic() - start >= 0.18
+
+    stats = limiter.stats()
+    assert stats['classes']['interactive']['granted'] == 5
+    assert stats['classes']['bulk']['granted'] == 10
+    assert stats['classes']['bulk']['max_wait'] > 0
+    assert stats['waiting'] == 0
+
+
+def test_rate_limiter_serves_urgent_waiters_first():
+    """Test an urgent caller overtakes bulk callers already waiting."""
+    limiter = RCONRateLimiter(rate=20, burst=1)
+    limiter.acquire()
+    order = []
+
+    def take(name, priority):
+        limiter.acquire(priority)
+        order.append(name)
+
+    bulk = [threading.Thread(target=take, args=(f'bulk{i}', PRIORITY_BULK)) for i in range(3)]
+    for t in bulk:
+        t.start()
+        time.sleep(0.005)
+    urgent = threading.Thread(target=take, args=('urgent', PRIORITY_URGENT))
+    urgent.start()
+    for t in bulk + [urgent]:
+        t.join(timeout=2)
+
+    assert order.index('urgent') <= 1
+    assert sorted(order) == ['bulk0', 'bulk1', 'bulk2', 'urgent']
+
+
+def test_rate_limiter_zero_rate_is_unlimited():
+    limiter = RCONRateLimiter(rate=0, burst=1)
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.5
+    limiter.configure(rate=100, burst=2)
+    assert limiter.stats()['rate'] == 100
+
+
+def test_worker_runs_interactive_before_queued_bulk():
+    """Test queued interactive work is picked up ahead of earlier bulk work."""
+    conn = RecordingConnection()
+    worker = RCONWorker(conn, threads=1)
+    release = threading.Event()
+    blocker = worker.submit_call(release.wait, 5)
+
+    bulk = [worker.submit(f'bulk {i}', priority=PRIORITY_BULK) for i in range(3)]
+    interactive = worker.submit('players')
+    urgent = worker.submit('servermsg "restart"', urgent=True)
+    assert urgent.result(timeout=2)
+
+    stats = worker.stats()
+    assert stats['bulk']['queued'] == 3
+    assert stats['interactive']['queued'] == 1
+    assert worker.pending == 4
+
+    release.set()
+    for f in bulk + [interactive, blocker]:
+        f.result(timeout=2)
+    worker.shutdown(wait=True)
+
+    commands = [c for c, _ in conn.calls]
+    assert commands.index('players') < commands.index('bulk 0')
+    assert dict(conn.calls)['bulk 0'] == {'priority': PRIORITY_BULK}
+    assert dict(conn.calls)['servermsg "restart"'] == {'priority': PRIORITY_URGENT}
+    assert dict(conn.calls)['players'] == {}
+    assert worker.stats()['bulk']['started'] == 3
@@ -19,6 +19,9 @@ class FakeSockError:
     def recv(self, n):
         raise socket.error("simulated recv error")
 
+    def recv_into(self, buf, n=0):
+        raise socket.error("simulated recv error")
+
 
 def test_recv_all_partial():
     s1, s2 = socket.socketpair()
@@ -0,0 +1,40 @@
+import ast
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, ROOT)
+
+SHARED_MODULES = ['rcon_codec', 'rcon', 'utils', 'player_sessions', 'players_db', 'log_tools']
+FRONTENDS = ['pz_admin_tool.py', 'pz_restart_timer.py']
+
+
+def _parse(name):
+    with open(os.path.join(ROOT, name), encoding='utf-8') as f:
+        return ast.parse(f.read())
+
+
+def _top_level_defs(tree):
+    return {node.name for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef))}
+
+
+@pytest.mark.parametrize('frontend', FRONTENDS)
+def test_frontend_does_not_redefine_shared_code(frontend):
+    # The apps must import the shared modules rather than carry copies of
+    # them, otherwise fixes made (and tested) in the modules never reach them.
+    defined = _top_level_defs(_parse(frontend))
+    for module in SHARED_MODULES:
+        copied = defined & _top_level_defs(_parse(module + '.py'))
+        assert not copied, '%s redefines %s from %s.py' % (frontend, sorted(copied), module)
+
+
+@pytest.mark.parametrize('frontend', FRONTENDS)
+def test_frontend_imports_resolve(frontend):
+    for node in _parse(frontend).body:
+        if isinstance(node, ast.ImportFrom) and node.module in SHARED_MODULES:
+            module = __import__(node.module)
+            for alias in node.names:
+                assert hasattr(module, alias.name), '%s.%s' % (node.module, alias.name)
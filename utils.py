@@ -1,10 +1,15 @@
 """Utility functions for the Project Zomboid Server Admin Tool.
 
-Includes file parsing (mods, banlists, config) and path detection helpers.
+Includes file parsing (mods, banlists, config), player list parsing and
+diffing, player name completion, path detection helpers, and a persistent
+cache of where each server's files are.
 """
 
+import bisect
+import json
 import os
 import logging
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -71,6 +76,153 @@ def parse_banlist(banlist_file):
     return bans
 
 
+
+def parse_player_list(response):
+    """Parse player names from an RCON 'players' response.
+    
+    The reply looks like "Players connected (N):" followed by one name per
+    line. Blank lines are skipped and duplicates dropped, keeping the
+    server's order.
+    
+    Args:
+        response (str): Raw response text, or None
+        
+    Returns:
+        list: Player names
+    """
+    names = []
+    seen = set()
+    for line in (response or '').split('\n'):
+        line = line.strip()
+        if not line or 'Players connected' in line:
+            continue
+        if line not in seen:
+            seen.add(line)
+            names.append(line)
+    return names
+
+
+def diff_keyed(old_keys, new_keys):
+    """Compare two keyed snapshots, e.g. the player list before and after a refresh.
+    
+    Args:
+        old_keys (iterable): Keys currently shown
+        new_keys (iterable): Keys in the latest snapshot
+        
+    Returns:
+        tuple: (joined, left, unchanged) lists; joined and unchanged follow
+        the order of new_keys, left follows old_keys
+    """
+    old_keys = list(old_keys)
+    new_keys = list(new_keys)
+    old_set = set(old_keys)
+    new_set = set(new_keys)
+    joined = [k for k in new_keys if k not in old_set]
+    left = [k for k in old_keys if k not in new_set]
+    unchanged = [k for k in new_keys if k in old_set]
+    return joined, left, unchanged
+
+
+def _trigrams(text):
+    """Set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class NameIndex:
+    """Prefix and trigram index over player names for as-you-type completion.
+    
+    Names are kept in a sorted list of lower-cased keys, so prefix matches
+    are a binary search plus a short scan, and in a trigram -> names map
+    that finds names containing the typed text, or close to it when it has
+    a typo. Adding a name updates both in place; nothing is rebuilt.
+    
+    Usage:
+        index = NameIndex(['Alice', 'Bob'])
+        index.add('Alicia')
+        index.complete('ali')   # ['Alice', 'Alicia']
+    """
+    
+    def __init__(self, names=()):
+        """Initialize the index.
+        
+        Args:
+            names (iterable): Initial names
+        """
+        self._names = {}       # lower-cased key -> name as last seen
+        self._sorted = []      # lower-cased keys, sorted
+        self._trigrams = {}    # trigram -> set of keys containing it
+        self.add_many(names)
+    
+    def __len__(self):
+        return len(self._sorted)
+    
+    def __contains__(self, name):
+        return name.strip().lower() in self._names
+    
+    def add(self, name):
+        """Add one name (case-insensitively unique).
+        
+        Args:
+            name (str): Player name; blank names are ignored
+            
+        Returns:
+            bool: True if the name was new
+        """
+        name = (name or '').strip()
+        if not name:
+            return False
+        key = name.lower()
+        is_new = key not in self._names
+        self._names[key] = name
+        if is_new:
+            bisect.insort(self._sorted, key)
+            for gram in _trigrams(key):
+                self._trigrams.setdefault(gram, set()).add(key)
+        return is_new
+    
+    def add_many(self, names):
+        """Add several names; returns how many were new."""
+        return sum(1 for name in names if self.add(name))
+    
+    def complete(self, text, limit=10):
+        """Suggest names for what has been typed so far.
+        
+        Prefix matches come first (alphabetically), then names containing
+        the text, then names sharing at least half its trigrams (typos),
+        most similar first.
+        
+        Args:
+            text (str): Typed text
+            limit (int): Most suggestions returned
+            
+        Returns:
+            list: Suggested names
+        """
+        query = text.strip().lower()
+        if not query:
+            return []
+        
+        matches = []
+        i = bisect.bisect_left(self._sorted, query)
+        while i < len(self._sorted) and len(matches) < limit and self._sorted[i].startswith(query):
+            matches.append(self._sorted[i])
+            i += 1
+        
+        grams = _trigrams(query)
+        if len(matches) < limit and grams:
+            shared = {}
+            for gram in grams:
+                for key in self._trigrams.get(gram, ()):
+                    shared[key] = shared.get(key, 0) + 1
+            found = set(matches)
+            min_shared = max(1, len(grams) // 2)
+            ranked = sorted((query not in key, -count, len(key), key)
+                            for key, count in shared.items()
+                            if count >= min_shared and key not in found)
+            matches.extend(entry[-1] for entry in ranked[:limit - len(matches)])
+        return [self._names[key] for key in matches]
+
+
 def find_server_path(start_path):
     """Auto-detect Project Zomboid server paths.
     
@@ -127,14 +279,7 @@ def find_config_file(server_path):
     Returns:
         Path or None: Path to .ini file, or None if not found
     """
-    search_dirs = [
-        server_path / 'Server',
-        server_path,
-        Path.home() / 'Zomboid' / 'Server',
-        Path.home() / '.local' / 'share' / 'Zomboid' / 'Server',
-    ]
-    
-    for search_dir in search_dirs:
+    for search_dir in _config_dirs(server_path):
         if search_dir.exists():
             for ini_file in search_dir.glob('*.ini'):
                 logger.debug("Found config file at %s", ini_file)
@@ -155,17 +300,223 @@ def find_log_file(server_path):
     Returns:
         Path or None: Path to most recent log directory, or None if not found
     """
-    log_locations = [
+    for log_dir in _log_dirs(server_path):
+        if log_dir.exists() and log_dir.is_dir():
+            logger.debug("Found log directory at %s", log_dir)
+            return log_dir
+    
+    logger.warning("No log directory found")
+    return None
+
+
+# Kinds of server file the path cache can locate
+PATH_KINDS = ('config', 'sandbox', 'logs', 'banlist', 'players_db')
+
+
+def _config_dirs(server_path):
+    """Directories that may hold the server .ini and SandboxVars files, in search order."""
+    return [
+        server_path / 'Server',
+        server_path,
+        Path.home() / 'Zomboid' / 'Server',
+        Path.home() / '.local' / 'share' / 'Zomboid' / 'Server',
+    ]
+
+
+def _log_dirs(server_path):
+    """Directories that may hold the server logs, in search order."""
+    return [
         server_path / 'Logs',
         server_path.parent / 'Logs',
         Path.home() / 'Zomboid' / 'Logs',
         Path.home() / '.local' / 'share' / 'Zomboid' / 'Logs',
     ]
+
+
+def _save_dirs(server_path):
+    """Directories that may hold one folder per multiplayer save, in search order."""
+    return [
+        server_path / 'Saves' / 'Multiplayer',
+        server_path / 'Multiplayer',
+        Path.home() / 'Zomboid' / 'Saves' / 'Multiplayer',
+        Path.home() / '.local' / 'share' / 'Zomboid' / 'Saves' / 'Multiplayer',
+    ]
+
+
+class ServerPathCache:
+    """Remembers where each server's config, logs, ban list and players.db are.
     
-    for log_dir in log_locations:
-        if log_dir.exists() and log_dir.is_dir():
-            logger.debug("Found log directory at %s", log_dir)
-            return log_dir
+    A kind of file is searched for once per server path. The result is kept
+    in memory and in a JSON file, so the next session starts with it. Using a
+    cached entry costs one stat per path, plus one per directory that a file
+    listing came from: a directory's mtime changes when files are added or
+    removed in it. The search only runs again when one of those checks
+    fails. Misses are not cached, so a file that appears later is found on
+    the next lookup.
     
-    logger.warning("No log directory found")
-    return None
+    players.db is found by checking `<save>/players.db` for each save folder
+    under Saves/Multiplayer. It never walks the save folders, which hold the
+    map chunks.
+    
+    Usage:
+        paths = ServerPathCache(Path.home() / '.pz_admin_tool_paths.json')
+        log_dir = paths.find_one(server_path, 'logs')
+        ini_files = paths.find(server_path, 'config')
+    """
+    
+    def __init__(self, cache_file=None):
+        """Initialize the cache.
+        
+        Args:
+            cache_file (str or Path): JSON file to persist entries in, or None
+                to keep them in memory only
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        # Re-entrant: locating players.db looks up the config first
+        self._lock = threading.RLock()
+        self._entries = self._load()
+    
+    def find(self, server_path, kind):
+        """All paths of one kind for a server, best first.
+        
+        Args:
+            server_path (str or Path): Server path as set in the tool
+            kind (str): One of PATH_KINDS
+            
+        Returns:
+            list: Paths found (empty if none)
+            
+        Raises:
+            KeyError: If kind is not one of PATH_KINDS
+        """
+        if kind not in PATH_KINDS:
+            raise KeyError(kind)
+        server_path = Path(server_path)
+        with self._lock:
+            entries = self._entries.setdefault(str(server_path), {})
+            entry = entries.get(kind)
+            if entry is not None and self._is_valid(entry):
+                return [Path(p) for p in entry['paths']]
+            
+            paths, dirs = getattr(self, f'_locate_{kind}')(server_path)
+            if paths:
+                logger.debug("Found %s for %s: %s", kind, server_path, paths[0])
+                entries[kind] = {'paths': [str(p) for p in paths], 'dirs': dirs}
+            else:
+                entries.pop(kind, None)
+            if entry is not None or paths:
+                self._save()
+            return paths
+    
+    def find_one(self, server_path, kind):
+        """The best path of one kind for a server, or None."""
+        paths = self.find(server_path, kind)
+        return paths[0] if paths else None
+    
+    def forget(self, server_path=None):
+        """Drop cached entries for one server path, or for all of them."""
+        with self._lock:
+            if server_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(Path(server_path)), None)
+            self._save()
+    
+    @staticmethod
+    def _is_valid(entry):
+        """True if every cached path still exists and no listed directory changed."""
+        try:
+            for path in entry['paths']:
+                os.stat(path)
+            for path, mtime in entry['dirs'].items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+        except OSError:
+            return False
+        return True
+    
+    @staticmethod
+    def _list(dirs, pattern):
+        """Files matching pattern in each existing dir, and those dirs' mtimes."""
+        found, mtimes = [], {}
+        for directory in dirs:
+            try:
+                # Stat before listing, so a change made during the listing
+                # still invalidates the entry
+                mtime = directory.stat().st_mtime_ns
+            except OSError:
+                continue
+            if not directory.is_dir():
+                continue
+            mtimes[str(directory)] = mtime
+            for path in sorted(directory.glob(pattern)):
+                if path.is_file() and path not in found:
+                    found.append(path)
+        return found, mtimes
+    
+    def _locate_config(self, server_path):
+        return self._list(_config_dirs(server_path), '*.ini')
+    
+    def _locate_sandbox(self, server_path):
+        return self._list(_config_dirs(server_path), '*_SandboxVars.lua')
+    
+    def _locate_logs(self, server_path):
+        for log_dir in _log_dirs(server_path):
+            if log_dir.is_dir():
+                return [log_dir], {}
+        return [], {}
+    
+    def _locate_banlist(self, server_path):
+        for config_dir in _config_dirs(server_path):
+            banlist = config_dir / 'banlist.txt'
+            if banlist.is_file():
+                return [banlist], {}
+        return [], {}
+    
+    def _locate_players_db(self, server_path):
+        candidates = [server_path / 'players.db']
+        for saves in _save_dirs(server_path):
+            try:
+                with os.scandir(saves) as entries:
+                    candidates.extend(Path(entry.path) / 'players.db'
+                                      for entry in entries if entry.is_dir())
+            except OSError:
+                continue
+        found = []
+        for path in candidates:
+            try:
+                found.append((path, path.stat().st_mtime))
+            except OSError:
+                continue
+        # The save named after the server's config first, then the newest
+        config = self.find_one(server_path, 'config')
+        name = config.stem if config else None
+        found.sort(key=lambda item: (item[0].parent.name != name, -item[1]))
+        paths = []
+        for path, _ in found:
+            if path not in paths:
+                paths.append(path)
+        return paths, {}
+    
+    def _load(self):
+        """Entries from the cache file ({} if missing or unreadable)."""
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+    
+    def _save(self):
+        """Write the entries to the cache file (caller holds the lock)."""
+        if self.cache_file is None:
+            return
+        tmp = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, indent=1)
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            logger.warning("Could not save path cache %s: %s", self.cache_file, e)